@@ -0,0 +1,56 @@
+"""add expense and budget composite indexes
+
+Revision ID: 7c2e4f1a9b3d
+Revises: 511150c5afb0
+Create Date: 2025-10-05 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e4f1a9b3d"
+down_revision: Union[str, Sequence[str], None] = "511150c5afb0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_expenses_user_id_date_id", "expenses", ["user_id", "date", "id"]),
+    (
+        "ix_expenses_user_id_category_id_date",
+        "expenses",
+        ["user_id", "category_id", "date"],
+    ),
+    ("ix_budgets_user_id_category_id", "budgets", ["user_id", "category_id"]),
+    ("ix_budgets_user_id_period", "budgets", ["user_id", "period"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction, but doesn't lock writes
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,95 @@
+"""Encode/decode throughput of a cached `list[ExpenseDTO]`.
+
+Compares the previous `asdict` + `model(**item)` round trip, which left UUIDs and
+datetimes as strings, with `OrjsonCodec` with and without compression. Typed
+decoding parses every UUID and datetime, so it decodes slower than the legacy
+path that skipped them, in exchange for a much cheaper encode. Runs in process,
+no redis needed.
+
+Usage:
+
+    python -m benchmarks.cache_codec --items 10000 --iterations 50
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import uuid4
+
+import orjson
+
+from expenses_tracker.application.dto.expense import ExpenseDTO
+from expenses_tracker.infrastructure.cache.codec import OrjsonCodec
+
+
+def make_expenses(items: int) -> list[ExpenseDTO]:
+    now = datetime.now(timezone.utc)
+    user_id, category_id = uuid4(), uuid4()
+    return [
+        ExpenseDTO(
+            id=uuid4(),
+            amount=round(i * 1.37 % 500, 2),
+            date=now - timedelta(minutes=i),
+            user_id=user_id,
+            category_id=category_id,
+            description=f"expense {i}" if i % 3 else None,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(items)
+    ]
+
+
+def legacy_encode(value: list[ExpenseDTO]) -> bytes:
+    return orjson.dumps([asdict(v) for v in value])
+
+
+def legacy_decode(data: bytes) -> list[ExpenseDTO]:
+    return [ExpenseDTO(**item) for item in orjson.loads(data)]
+
+
+def typed_decoder(codec: OrjsonCodec) -> Callable[[bytes], Any]:
+    return lambda data: codec.decode(data, list[ExpenseDTO])
+
+
+def measure(call: Callable[[], Any], iterations: int) -> float:
+    call()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - started) / iterations * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    expenses = make_expenses(args.items)
+    codecs: list[tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]] = [
+        ("asdict + **kwargs", legacy_encode, legacy_decode),
+    ]
+    for name, codec in (
+        ("orjson codec", OrjsonCodec()),
+        ("orjson codec + zlib", OrjsonCodec(compression_threshold=0)),
+    ):
+        codecs.append((name, codec.encode, typed_decoder(codec)))
+
+    print(f"{'codec':<22} {'encode ms':>10} {'decode ms':>10} {'KiB':>8}  types")
+    for name, encode, decode in codecs:
+        data = encode(expenses)
+        encode_ms = measure(lambda: encode(expenses), args.iterations)
+        decode_ms = measure(lambda: decode(data), args.iterations)
+        typed = decode(data) == expenses
+        print(
+            f"{name:<22} {encode_ms:>10.2f} {decode_ms:>10.2f} "
+            f"{len(data) / 1024:>8.1f}  {'ok' if typed else 'strings'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Database queries issued by a thundering herd on an invalidated list cache.
+
+Every simulated worker owns its own `RedisService`, as the uvicorn workers do,
+and all of them share the redis configured in `.env`. The repository is an
+in-memory one that sleeps `--query-ms` per query and counts calls. Two
+scenarios run for the previous read-through (GET, query, SET) and for
+`get_or_load`:
+
+- herd: `--requests` concurrent `get_expenses_by_user_id` right after the key
+  was deleted by a write
+- sustained: steady traffic for three TTLs of a short lived key, XFetch should
+  refresh it early instead of letting everyone miss at expiry
+
+Usage:
+
+    python -m benchmarks.cache_stampede --workers 4 --requests 400
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from typing import Any, TypeVar
+from uuid import UUID, uuid4
+
+from expenses_tracker.application.use_cases.expense import ExpenseUseCases
+from expenses_tracker.core.settings import get_settings
+from expenses_tracker.domain.entities.expense import Expense
+from expenses_tracker.infrastructure.cache.redis_cache_service import RedisService
+from expenses_tracker.infrastructure.database.repositories.dummy_uow import (
+    DummyUnitOfWork,
+)
+from expenses_tracker.infrastructure.database.repositories.expense.dummy_expense_repo import (
+    DummyExpenseRepository,
+)
+
+T = TypeVar("T")
+
+
+class SlowExpenseRepository(DummyExpenseRepository):
+    def __init__(self, query_seconds: float) -> None:
+        super().__init__()
+        self.query_seconds = query_seconds
+        self.queries = 0
+
+    async def get_all_by_user_id(self, user_id: UUID) -> list[Expense]:
+        self.queries += 1
+        await asyncio.sleep(self.query_seconds)
+        return await super().get_all_by_user_id(user_id)
+
+
+class ReadThroughRedisService(RedisService[T]):
+    """The read path before get_or_load: every miss runs the loader"""
+
+    async def get_or_load(
+        self,
+        key: str,
+        serializer: type[T],
+        loader: Callable[[], Awaitable[T]],
+        ttl: int | None = None,
+        tags: list[str] | None = None,
+    ) -> T:
+        cached = await self.get(key, serializer)
+        if cached is not None:
+            return cached
+        value = await loader()
+        await self.set(key, value, ttl=ttl, tags=tags)
+        return value
+
+
+def make_use_cases(
+    cache: RedisService[Any], repository: SlowExpenseRepository
+) -> ExpenseUseCases:
+    uow = DummyUnitOfWork()
+    uow._expense_repository = repository
+    return ExpenseUseCases(unit_of_work=uow, cache_service=cache)
+
+
+async def herd(
+    workers: list[ExpenseUseCases], user_id: UUID, requests: int
+) -> list[float]:
+    async def request(use_cases: ExpenseUseCases) -> float:
+        started = time.perf_counter()
+        await use_cases.get_expenses_by_user_id(user_id=user_id)
+        return time.perf_counter() - started
+
+    return await asyncio.gather(
+        *(request(workers[i % len(workers)]) for i in range(requests))
+    )
+
+
+async def sustained(
+    workers: list[ExpenseUseCases], user_id: UUID, duration: float, rps: int
+) -> list[float]:
+    latencies: list[float] = []
+    tasks = []
+
+    async def request(use_cases: ExpenseUseCases) -> None:
+        started = time.perf_counter()
+        await use_cases.get_expenses_by_user_id(user_id=user_id)
+        latencies.append(time.perf_counter() - started)
+
+    deadline = time.perf_counter() + duration
+    i = 0
+    while time.perf_counter() < deadline:
+        tasks.append(asyncio.create_task(request(workers[i % len(workers)])))
+        i += 1
+        await asyncio.sleep(1 / rps)
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+def p99(latencies: list[float]) -> float:
+    return sorted(latencies)[int(len(latencies) * 0.99)] * 1e3
+
+
+async def run(args: argparse.Namespace) -> None:
+    # short TTL so the sustained run crosses several expiries
+    get_settings().expenses_list_ttl_seconds = args.ttl
+    user_id = uuid4()
+    print(
+        f"{'scenario':<12} {'cache':<14} {'requests':>9} {'queries':>8} {'p99 ms':>8}"
+    )
+    for name, cache_class in (
+        ("read-through", ReadThroughRedisService),
+        ("get_or_load", RedisService),
+    ):
+        repository = SlowExpenseRepository(query_seconds=args.query_ms / 1000)
+        for _ in range(args.expenses):
+            expense = Expense(
+                amount=1.0,
+                date=datetime.now(timezone.utc),
+                user_id=user_id,
+                category_id=uuid4(),
+            )
+            repository.expenses[expense.id] = expense
+        caches: list[RedisService[Any]] = [cache_class() for _ in range(args.workers)]
+        workers = [make_use_cases(cache, repository) for cache in caches]
+        key = f"expenses:user:{user_id}"
+
+        await caches[0].delete(key)
+        latencies = await herd(workers, user_id, args.requests)
+        print(
+            f"{'herd':<12} {name:<14} {args.requests:>9} "
+            f"{repository.queries:>8} {p99(latencies):>8.1f}"
+        )
+
+        await caches[0].delete(key)
+        await workers[0].get_expenses_by_user_id(user_id=user_id)
+        repository.queries = 0
+        latencies = await sustained(workers, user_id, args.ttl * 3, args.rps)
+        print(
+            f"{'sustained':<12} {name:<14} {len(latencies):>9} "
+            f"{repository.queries:>8} {p99(latencies):>8.1f}"
+        )
+        await caches[0].delete(key)
+        for cache in caches:
+            await cache.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--expenses", type=int, default=500)
+    parser.add_argument("--query-ms", type=float, default=50)
+    parser.add_argument("--ttl", type=int, default=2)
+    parser.add_argument("--rps", type=int, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
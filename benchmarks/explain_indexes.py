@@ -0,0 +1,289 @@
+"""EXPLAIN ANALYZE every expense/budget repository query against a seeded database.
+
+The SQL is captured from the psycopg repositories themselves, so the benchmark
+always checks what the application really sends. Each query is explained twice:
+with the composite indexes and with them dropped inside a rolled back
+transaction, to show the difference.
+
+Usage (schema must be migrated with `alembic upgrade head` first):
+
+    python -m benchmarks.explain_indexes --users 1000 --expenses 2000000
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import orjson
+from psycopg import AsyncConnection
+
+from expenses_tracker.core.constants import BudgetPeriod
+from expenses_tracker.core.settings import get_settings
+from expenses_tracker.infrastructure.database.repositories.budget.psycopg_budget_repo import (
+    PsycopgBudgetRepository,
+)
+from expenses_tracker.infrastructure.database.repositories.expense.psycopg_expense_repo import (
+    PsycopgExpenseRepository,
+)
+
+USERNAME_PREFIX = "bench_"
+COMPOSITE_INDEXES = (
+    "ix_expenses_user_id_date_id",
+    "ix_expenses_user_id_category_id_date",
+    "ix_budgets_user_id_category_id",
+    "ix_budgets_user_id_period",
+)
+
+Query = tuple[str, str, Any]
+
+
+class _RecordingCursor:
+    def __init__(self, queries: list[tuple[str, Any]]) -> None:
+        self._queries = queries
+
+    async def __aenter__(self) -> "_RecordingCursor":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    async def execute(self, query: str, params: Any = None) -> None:
+        self._queries.append((query, params))
+
+    async def fetchall(self) -> list[Any]:
+        return []
+
+    async def fetchone(self) -> None:
+        return None
+
+
+class _RecordingConnection:
+    """Stands in for AsyncConnection and only remembers executed statements"""
+
+    def __init__(self) -> None:
+        self.queries: list[tuple[str, Any]] = []
+
+    def cursor(self, *args: Any, **kwargs: Any) -> _RecordingCursor:
+        return _RecordingCursor(self.queries)
+
+
+async def seed(
+    conn: AsyncConnection, users: int, categories: int, expenses: int, budgets: int
+) -> None:
+    await conn.execute(
+        """
+        INSERT INTO users (id, username, hashed_password, email_verified)
+        SELECT gen_random_uuid(), %(prefix)s || g, 'bench', false
+        FROM generate_series(1, %(users)s) g
+        """,
+        {"prefix": USERNAME_PREFIX, "users": users},
+    )
+    await conn.execute(
+        """
+        INSERT INTO categories (id, name, color, is_default, user_id)
+        SELECT gen_random_uuid(), 'category_' || c, '#000000', false, u.id
+        FROM users u CROSS JOIN generate_series(1, %(categories)s) c
+        WHERE u.username LIKE %(pattern)s
+        """,
+        {"categories": categories, "pattern": f"{USERNAME_PREFIX}%"},
+    )
+    await conn.execute(
+        """
+        WITH c AS (
+            SELECT cat.id, cat.user_id, row_number() OVER () AS rn
+            FROM categories cat JOIN users u ON u.id = cat.user_id
+            WHERE u.username LIKE %(pattern)s
+        ), n AS (SELECT count(*) AS total FROM c)
+        INSERT INTO expenses (id, amount, date, user_id, category_id)
+        SELECT gen_random_uuid(), round((random() * 500)::numeric, 2),
+               now() - random() * interval '730 days', c.user_id, c.id
+        FROM generate_series(1, %(expenses)s) g
+        JOIN c ON c.rn = 1 + (g %% (SELECT total FROM n))
+        """,
+        {"expenses": expenses, "pattern": f"{USERNAME_PREFIX}%"},
+    )
+    await conn.execute(
+        """
+        WITH c AS (
+            SELECT cat.id, cat.user_id, row_number() OVER () AS rn
+            FROM categories cat JOIN users u ON u.id = cat.user_id
+            WHERE u.username LIKE %(pattern)s
+        ), n AS (SELECT count(*) AS total FROM c)
+        INSERT INTO budgets
+            (id, amount, period, start_date, end_date, user_id, category_id)
+        SELECT gen_random_uuid(), 1000,
+               (ARRAY['WEEKLY', 'MONTHLY', 'YEARLY'])[1 + g %% 3]::budgetperiod,
+               now() - (g %% 730) * interval '1 day',
+               now() - (g %% 730) * interval '1 day' + interval '30 days',
+               c.user_id, c.id
+        FROM generate_series(1, %(budgets)s) g
+        JOIN c ON c.rn = 1 + (g %% (SELECT total FROM n))
+        """,
+        {"budgets": budgets, "pattern": f"{USERNAME_PREFIX}%"},
+    )
+    # fresh statistics and visibility map, otherwise the planner can't pick
+    # index-only scans right after a bulk load
+    await conn.execute("VACUUM ANALYZE expenses")
+    await conn.execute("VACUUM ANALYZE budgets")
+
+
+async def capture_queries(user_id: UUID, category_id: UUID) -> list[Query]:
+    now = datetime.now()
+    month_ago = now - timedelta(days=30)
+    expense_conn, budget_conn = _RecordingConnection(), _RecordingConnection()
+    expense_repo = PsycopgExpenseRepository(expense_conn)  # type: ignore[arg-type]
+    budget_repo = PsycopgBudgetRepository(budget_conn)  # type: ignore[arg-type]
+
+    calls: list[tuple[str, _RecordingConnection, Callable[[], Awaitable[Any]]]] = [
+        (
+            "expenses.get_all_by_user_id",
+            expense_conn,
+            lambda: expense_repo.get_all_by_user_id(user_id),
+        ),
+        (
+            "expenses.get_page_by_user_id",
+            expense_conn,
+            lambda: expense_repo.get_page_by_user_id(user_id, limit=50),
+        ),
+        (
+            "expenses.get_page_by_user_id(after)",
+            expense_conn,
+            lambda: expense_repo.get_page_by_user_id(
+                user_id, limit=50, after=(month_ago, UUID(int=0))
+            ),
+        ),
+        (
+            "expenses.get_by_user_id_and_date_range",
+            expense_conn,
+            lambda: expense_repo.get_by_user_id_and_date_range(user_id, month_ago, now),
+        ),
+        (
+            "expenses.get_by_user_id_and_category_id",
+            expense_conn,
+            lambda: expense_repo.get_by_user_id_and_category_id(user_id, category_id),
+        ),
+        (
+            "budgets.get_all_by_user_id",
+            budget_conn,
+            lambda: budget_repo.get_all_by_user_id(user_id),
+        ),
+        (
+            "budgets.get_by_user_id_and_date_range",
+            budget_conn,
+            lambda: budget_repo.get_by_user_id_and_date_range(user_id, month_ago, now),
+        ),
+        (
+            "budgets.get_by_user_id_and_category_id",
+            budget_conn,
+            lambda: budget_repo.get_by_user_id_and_category_id(user_id, category_id),
+        ),
+        (
+            "budgets.get_by_user_id_and_period",
+            budget_conn,
+            lambda: budget_repo.get_by_user_id_and_period(
+                user_id, BudgetPeriod.MONTHLY
+            ),
+        ),
+        (
+            "budgets.get_total_budget_amount_for_period",
+            budget_conn,
+            lambda: budget_repo.get_total_budget_amount_for_period(
+                user_id, month_ago, now
+            ),
+        ),
+    ]
+    queries: list[Query] = []
+    for name, conn, call in calls:
+        await call()
+        sql, params = conn.queries[-1]
+        queries.append((name, sql, params))
+    return queries
+
+
+def _walk(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+async def explain(conn: AsyncConnection, sql: str, params: Any) -> tuple[float, str]:
+    cursor = await conn.execute(
+        "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql,
+        params,
+    )
+    row = await cursor.fetchone()
+    assert row is not None
+    raw = row[0]
+    result = (orjson.loads(raw) if isinstance(raw, str) else raw)[0]
+    scans = [
+        f"{node['Node Type']}({node.get('Index Name', node['Relation Name'])})"
+        for node in _walk(result["Plan"])
+        if node.get("Relation Name") in ("expenses", "budgets")
+    ]
+    return result["Execution Time"], ", ".join(scans)
+
+
+async def run(args: argparse.Namespace) -> int:
+    conn = await AsyncConnection.connect(
+        get_settings().sync_postgres_url, autocommit=True
+    )
+    async with conn:
+        if args.reseed:
+            await conn.execute(
+                "DELETE FROM users WHERE username LIKE %s", (f"{USERNAME_PREFIX}%",)
+            )
+        cursor = await conn.execute(
+            "SELECT count(*) FROM users WHERE username LIKE %s",
+            (f"{USERNAME_PREFIX}%",),
+        )
+        row = await cursor.fetchone()
+        if not row or row[0] == 0:
+            print(
+                f"Seeding {args.users} users, {args.expenses} expenses, "
+                f"{args.budgets} budgets..."
+            )
+            await seed(conn, args.users, args.categories, args.expenses, args.budgets)
+
+        cursor = await conn.execute(
+            """
+            SELECT e.user_id, e.category_id FROM expenses e
+            JOIN users u ON u.id = e.user_id
+            WHERE u.username LIKE %s LIMIT 1
+            """,
+            (f"{USERNAME_PREFIX}%",),
+        )
+        row = await cursor.fetchone()
+        assert row is not None, "no seeded expenses found"
+        queries = await capture_queries(user_id=row[0], category_id=row[1])
+
+        seq_scans = 0
+        print(f"{'query':<45} {'indexed ms':>11} {'no index ms':>12}  plan")
+        for name, sql, params in queries:
+            indexed_ms, plan = await explain(conn, sql, params)
+            async with conn.transaction(force_rollback=True):
+                for index in COMPOSITE_INDEXES:
+                    await conn.execute(f"DROP INDEX IF EXISTS {index}")
+                plain_ms, _ = await explain(conn, sql, params)
+            seq_scans += "Seq Scan" in plan
+            print(f"{name:<45} {indexed_ms:>11.3f} {plain_ms:>12.3f}  {plan}")
+    return 1 if seq_scans else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--categories", type=int, default=10, help="per user")
+    parser.add_argument("--expenses", type=int, default=2_000_000)
+    parser.add_argument("--budgets", type=int, default=200_000)
+    parser.add_argument(
+        "--reseed", action="store_true", help="drop previously seeded rows first"
+    )
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
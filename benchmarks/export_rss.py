@@ -0,0 +1,167 @@
+"""Peak RSS and wall time of exporting one user's expenses as CSV.
+
+Every mode runs in its own subprocess, because ru_maxrss only ever grows:
+
+- copy: psycopg `COPY ... TO STDOUT` export
+- stream: SQLAlchemy `stream_scalars` export
+- list: `get_expenses_by_user_id`, i.e. everything materialised before writing
+
+Usage (schema must be migrated with `alembic upgrade head` first):
+
+    python -m benchmarks.export_rss --rows 1000000
+"""
+
+import argparse
+import asyncio
+import resource
+import subprocess
+import sys
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import UUID
+
+from psycopg import AsyncConnection
+
+from expenses_tracker.application.use_cases.expense import ExpenseUseCases
+from expenses_tracker.core.settings import get_settings
+from expenses_tracker.domain.repositories.uow import IUnitOfWork
+from expenses_tracker.infrastructure.cache.dummy_cache_service import (
+    DummyCacheService,
+)
+from expenses_tracker.infrastructure.database.db import (
+    create_psycopg_pool,
+    create_sqlalchemy_engine,
+    create_sqlalchemy_session_factory,
+)
+from expenses_tracker.infrastructure.database.repositories.expense.csv_export import (
+    expenses_to_csv,
+)
+from expenses_tracker.infrastructure.database.repositories.psycopg_uow import (
+    PsycopgUnitOfWork,
+)
+from expenses_tracker.infrastructure.database.repositories.sqlalchemy_uow import (
+    SqlAlchemyUnitOfWork,
+)
+
+USERNAME = "bench_export"
+MODES = ("copy", "stream", "list")
+
+
+async def seed(rows: int) -> UUID:
+    conn = await AsyncConnection.connect(
+        get_settings().sync_postgres_url, autocommit=True
+    )
+    async with conn:
+        cursor = await conn.execute(
+            "SELECT u.id, count(e.id) FROM users u "
+            "LEFT JOIN expenses e ON e.user_id = u.id "
+            "WHERE u.username = %s GROUP BY u.id",
+            (USERNAME,),
+        )
+        row = await cursor.fetchone()
+        if row and row[1] == rows:
+            return UUID(str(row[0]))
+
+        print(f"Seeding {rows} expenses...")
+        await conn.execute("DELETE FROM users WHERE username = %s", (USERNAME,))
+        cursor = await conn.execute(
+            """
+            INSERT INTO users (id, username, hashed_password, email_verified)
+            VALUES (gen_random_uuid(), %s, 'bench', false) RETURNING id
+            """,
+            (USERNAME,),
+        )
+        user_row = await cursor.fetchone()
+        assert user_row is not None
+        user_id = user_row[0]
+        cursor = await conn.execute(
+            """
+            INSERT INTO categories (id, name, color, is_default, user_id)
+            VALUES (gen_random_uuid(), 'bench', '#000000', false, %s) RETURNING id
+            """,
+            (user_id,),
+        )
+        category_row = await cursor.fetchone()
+        assert category_row is not None
+        await conn.execute(
+            """
+            INSERT INTO expenses (id, amount, date, description, user_id, category_id)
+            SELECT gen_random_uuid(), round((random() * 500)::numeric, 2),
+                   now() - random() * interval '730 days', 'expense ' || g, %s, %s
+            FROM generate_series(1, %s) g
+            """,
+            (user_id, category_row[0], rows),
+        )
+        await conn.execute("VACUUM ANALYZE expenses")
+        return UUID(str(user_id))
+
+
+async def _list_export(
+    use_cases: ExpenseUseCases, user_id: UUID
+) -> AsyncIterator[bytes]:
+    dtos = await use_cases.get_expenses_by_user_id(user_id=user_id)
+    yield expenses_to_csv(dtos, header=True)  # type: ignore[arg-type]
+
+
+async def run_mode(mode: str, user_id: UUID) -> dict[str, Any]:
+    uow: IUnitOfWork
+    pool = create_psycopg_pool()
+    engine = create_sqlalchemy_engine()
+    if mode == "copy":
+        await pool.open()
+        uow = PsycopgUnitOfWork(pool=pool)
+    else:
+        uow = SqlAlchemyUnitOfWork(
+            session_factory=create_sqlalchemy_session_factory(engine)
+        )
+    use_cases = ExpenseUseCases(unit_of_work=uow, cache_service=DummyCacheService())
+
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    chunks = (
+        _list_export(use_cases, user_id)
+        if mode == "list"
+        else use_cases.export_expenses_csv(user_id=user_id)
+    )
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+    elapsed = time.perf_counter() - started
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    await pool.close()
+    await engine.dispose()
+    return {
+        "mode": mode,
+        "seconds": elapsed,
+        "mb": size / 2**20,
+        "rss_growth_mb": (peak_kb - baseline_kb) / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--mode", choices=MODES, help="run a single mode in-process")
+    args = parser.parse_args()
+
+    user_id = asyncio.run(seed(args.rows))
+    if args.mode:
+        result = asyncio.run(run_mode(args.mode, user_id))
+        print(
+            f"{result['mode']:<8} {result['seconds']:>8.2f} {result['mb']:>9.1f} "
+            f"{result['rss_growth_mb']:>15.1f}"
+        )
+        return
+
+    print(f"{'mode':<8} {'seconds':>8} {'csv MiB':>9} {'peak RSS +MiB':>15}")
+    for mode in MODES:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.export_rss", "--rows", str(args.rows)]
+            + ["--mode", mode],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
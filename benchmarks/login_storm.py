@@ -0,0 +1,130 @@
+"""Latency of an unrelated endpoint while a burst of logins verifies passwords.
+
+A minimal FastAPI app exposes `/login`, which only runs the password check,
+and `/ping`. While `--logins` concurrent logins are in flight, `/ping` is
+due every `--ping-interval-ms` and its latency recorded from when it was due. Runs for the
+previous hasher, which called bcrypt on the event loop, and for
+`BcryptPasswordHasher`, which offloads it to a thread pool. Runs in process
+over ASGI, no database needed.
+
+Usage:
+
+    python -m benchmarks.login_storm --logins 50 --rounds 12 --workers 4
+"""
+
+import argparse
+import asyncio
+import time
+
+import bcrypt
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from expenses_tracker.application.interfaces.password_hasher import IPasswordHasher
+from expenses_tracker.infrastructure.security.bcrypt_password_hasher import (
+    BcryptPasswordHasher,
+)
+
+PASSWORD = "correct horse battery staple"
+
+
+class BlockingBcryptPasswordHasher(IPasswordHasher):
+    """The previous hasher: bcrypt runs on the event loop thread"""
+
+    def __init__(self, rounds: int) -> None:
+        self._rounds = rounds
+
+    async def hash(self, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=self._rounds)
+        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+
+
+def make_app(hasher: IPasswordHasher, hashed: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login() -> dict[str, bool]:
+        if not await hasher.verify(PASSWORD, hashed):
+            raise HTTPException(status_code=401)
+        return {"ok": True}
+
+    @app.get("/ping")
+    async def ping() -> dict[str, bool]:
+        return {"ok": True}
+
+    return app
+
+
+def percentile(latencies: list[float], q: float) -> float:
+    return sorted(latencies)[min(int(len(latencies) * q), len(latencies) - 1)] * 1e3
+
+
+async def storm(
+    hasher: IPasswordHasher, logins: int, ping_interval: float
+) -> tuple[float, list[float]]:
+    hashed = await hasher.hash(PASSWORD)
+    transport = httpx.ASGITransport(app=make_app(hasher, hashed))
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        done = asyncio.Event()
+        latencies: list[float] = []
+
+        async def pinger() -> None:
+            # latency counts from when the ping was due, so time spent waiting
+            # for a blocked event loop is included
+            first = time.perf_counter()
+            i = 0
+            while not done.is_set():
+                due = first + i * ping_interval
+                await asyncio.sleep(max(due - time.perf_counter(), 0))
+                await client.get("/ping")
+                latencies.append(time.perf_counter() - due)
+                i += 1
+
+        ping_task = asyncio.create_task(pinger())
+        # let the pinger take a baseline sample first
+        await asyncio.sleep(ping_interval * 2)
+        started = time.perf_counter()
+        await asyncio.gather(*(client.post("/login") for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await ping_task
+    return elapsed, latencies
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{'hasher':<20} {'logins':>7} {'storm s':>8} "
+        f"{'ping p50 ms':>12} {'ping p99 ms':>12} {'ping max ms':>12}"
+    )
+    pooled = BcryptPasswordHasher(rounds=args.rounds, max_workers=args.workers)
+    for name, hasher in (
+        ("blocking", BlockingBcryptPasswordHasher(rounds=args.rounds)),
+        ("thread pool", pooled),
+    ):
+        elapsed, latencies = await storm(
+            hasher, args.logins, args.ping_interval_ms / 1000
+        )
+        print(
+            f"{name:<20} {args.logins:>7} {elapsed:>8.2f} "
+            f"{percentile(latencies, 0.5):>12.1f} {percentile(latencies, 0.99):>12.1f} "
+            f"{max(latencies) * 1e3:>12.1f}"
+        )
+    pooled.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--ping-interval-ms", type=float, default=5)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
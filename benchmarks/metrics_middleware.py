@@ -0,0 +1,130 @@
+"""Per-request overhead of the Prometheus middleware.
+
+Compares the previous `BaseHTTPMiddleware` version, which labelled requests by
+raw path, with the plain ASGI `PrometheusMiddleware` and with no middleware at
+all. Every request hits `/items/{item_id}` with a fresh id, the ASGI app is
+called directly so no client or server overhead is included. The time series
+column is how many `http_requests_total` series the run left behind.
+
+Usage:
+
+    python -m benchmarks.metrics_middleware --iterations 20000
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message
+
+from expenses_tracker.infrastructure.api.middlewares.prometheus import (
+    PrometheusMiddleware,
+)
+from expenses_tracker.infrastructure.monitoring.metrics import (
+    REQUEST_COUNT,
+    REQUEST_LATENCY,
+)
+
+
+class RawPathPrometheusMiddleware(BaseHTTPMiddleware):
+    """The middleware before the rewrite"""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        start_time = time.time()
+        response: Response = await call_next(request)
+        process_time = time.time() - start_time
+        endpoint = request.url.path
+        REQUEST_COUNT.labels(
+            method=request.method,
+            endpoint=endpoint,
+            http_status=response.status_code,
+        ).inc()
+        REQUEST_LATENCY.labels(method=request.method, endpoint=endpoint).observe(
+            process_time
+        )
+        return response
+
+
+def make_app(middleware: Callable[[ASGIApp], ASGIApp] | None) -> ASGIApp:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str) -> dict[str, str]:
+        return {"id": item_id}
+
+    return app if middleware is None else middleware(app)
+
+
+def series_count() -> int:
+    return sum(
+        sample.name.endswith("_total")
+        for metric in REQUEST_COUNT.collect()
+        for sample in metric.samples
+    )
+
+
+async def measure(app: ASGIApp, iterations: int) -> float:
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    def scope() -> dict[str, object]:
+        path = f"/items/{uuid4()}"
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"bench")],
+            "client": ("127.0.0.1", 1234),
+            "server": ("bench", 80),
+        }
+
+    # builds the middleware stack before timing
+    await app(scope(), receive, send)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await app(scope(), receive, send)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+async def run(iterations: int) -> None:
+    print(f"{'middleware':<28} {'us/request':>10} {'overhead':>9} {'series':>8}")
+    baseline = None
+    middlewares: list[tuple[str, Callable[[ASGIApp], ASGIApp] | None]] = [
+        ("none", None),
+        ("BaseHTTPMiddleware, path", RawPathPrometheusMiddleware),
+        ("ASGI, route template", PrometheusMiddleware),
+    ]
+    for name, middleware in middlewares:
+        REQUEST_COUNT.clear()
+        REQUEST_LATENCY.clear()
+        per_request = await measure(make_app(middleware), iterations)
+        baseline = baseline or per_request
+        print(
+            f"{name:<28} {per_request:>10.1f} {per_request - baseline:>9.1f} "
+            f"{series_count():>8}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    asyncio.run(run(parser.parse_args().iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Import time and time to first request of a fresh worker.
+
+Every run starts a new interpreter that imports `expenses_tracker.app`, runs
+`init_app` and the lifespan, then sends `GET /api/health` through an ASGI
+transport. It then waits for the services initialised in the background;
+before they were deferred the lifespan blocked on all of them, so that column
+is roughly where the first request used to be served. Services that can't be
+reached show up as failed, the app starts regardless.
+
+Usage:
+
+    python -m benchmarks.startup --runs 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+import orjson
+
+STARTED = time.perf_counter()
+
+
+async def measure_once() -> dict[str, float | str]:
+    from asgi_lifespan import LifespanManager
+    from httpx import ASGITransport, AsyncClient
+
+    from expenses_tracker.app import init_app
+
+    imported = time.perf_counter()
+    app = init_app()
+    async with LifespanManager(app, startup_timeout=60, shutdown_timeout=60):
+        started_up = time.perf_counter()
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            response = await client.get("/api/health")
+            response.raise_for_status()
+        first_request = time.perf_counter()
+        readiness = app.state.readiness
+        await asyncio.gather(
+            *(readiness.wait(name) for name in readiness.status()),
+            return_exceptions=True,
+        )
+        ready = time.perf_counter()
+        status = readiness.status()
+    return {
+        "import": imported - STARTED,
+        "lifespan": started_up - imported,
+        "first_request": first_request - STARTED,
+        "background_ready": ready - STARTED,
+        "failed": ",".join(name for name, s in status.items() if s != "ready"),
+    }
+
+
+def run_child() -> dict[str, float | str]:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", "--child"],
+        capture_output=True,
+        check=True,
+    ).stdout
+    # the app logs to stdout too, the result is the last line
+    return orjson.loads(output.splitlines()[-1])  # type: ignore[no-any-return]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = asyncio.run(measure_once())
+        sys.stdout.flush()
+        sys.stdout.buffer.write(b"\n" + orjson.dumps(result) + b"\n")
+        return
+
+    results = [run_child() for _ in range(args.runs)]
+    print(f"{'phase':<18} {'median ms':>10} {'max ms':>10}")
+    for phase in ("import", "lifespan", "first_request", "background_ready"):
+        values = [float(result[phase]) * 1e3 for result in results]
+        print(f"{phase:<18} {statistics.median(values):>10.1f} {max(values):>10.1f}")
+    failed = {str(result["failed"]) for result in results} - {""}
+    if failed:
+        print(f"not ready: {', '.join(sorted(failed))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Access token decode throughput of `JWTTokenService`.
+
+Compares the previous decode, which looked up the key and algorithm in the
+settings and verified the signature on every call, with the precomputed key
+alone and with the verified-token cache. `--tokens` distinct tokens are
+decoded round robin, as many clients resending their own token would. Runs in
+process, no redis needed.
+
+Usage:
+
+    python -m benchmarks.token_decode --tokens 1000 --iterations 200000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from uuid import uuid4
+
+import jwt
+
+from expenses_tracker.core.constants import TokenType
+from expenses_tracker.core.settings import get_settings
+from expenses_tracker.domain.entities.token_payload import TokenPayload
+from expenses_tracker.infrastructure.security.jwt_token_service import JWTTokenService
+
+
+def legacy_decode(token: str) -> TokenPayload:
+    payload = jwt.decode(
+        token,
+        get_settings().secret_key,
+        algorithms=[get_settings().algorithm],
+    )
+    payload["type"] = TokenType(payload["type"])
+    return TokenPayload(**payload)
+
+
+def measure(decode: Callable[[str], TokenPayload], tokens: list[str], n: int) -> float:
+    for token in tokens:
+        decode(token)
+    started = time.perf_counter()
+    for i in range(n):
+        decode(tokens[i % len(tokens)])
+    return n / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    tokens = [JWTTokenService().create_token(str(uuid4())) for _ in range(args.tokens)]
+    decoders: list[tuple[str, Callable[[str], TokenPayload]]] = [
+        ("settings per call", legacy_decode),
+        ("precomputed key", JWTTokenService(cache_max_size=0).decode_token),
+        ("precomputed key + LRU", JWTTokenService().decode_token),
+    ]
+
+    print(f"{'decode':<24} {'decodes/s':>12} {'us/decode':>10}")
+    for name, decode in decoders:
+        rate = measure(decode, tokens, args.iterations)
+        print(f"{name:<24} {rate:>12,.0f} {1e6 / rate:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
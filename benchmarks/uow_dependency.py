@@ -0,0 +1,73 @@
+"""Per-request cost of resolving the SQLAlchemy unit of work dependency.
+
+Compares building an `async_sessionmaker` on every request (the previous
+`get_sqlalchemy_uow`) with reusing the one created in `lifespan`. No database
+connection is opened, only dependency construction is measured.
+
+Usage:
+
+    python -m benchmarks.uow_dependency --iterations 100000
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from expenses_tracker.infrastructure.database.db import (
+    create_sqlalchemy_engine,
+    create_sqlalchemy_session_factory,
+)
+from expenses_tracker.infrastructure.database.repositories.sqlalchemy_uow import (
+    SqlAlchemyUnitOfWork,
+)
+from expenses_tracker.infrastructure.di import get_sqlalchemy_uow
+
+
+async def get_sqlalchemy_uow_per_request(request: Any) -> SqlAlchemyUnitOfWork:
+    session_factory = async_sessionmaker(
+        bind=request.app.state.sqlalchemy_engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+    return SqlAlchemyUnitOfWork(session_factory=session_factory)
+
+
+async def measure(dependency: Any, request: Any, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await dependency(request)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+async def run(iterations: int) -> None:
+    engine = create_sqlalchemy_engine()
+    state = SimpleNamespace(
+        sqlalchemy_engine=engine,
+        sqlalchemy_session_factory=create_sqlalchemy_session_factory(engine),
+    )
+    request = SimpleNamespace(app=SimpleNamespace(state=state))
+
+    # warm up both paths before timing
+    await measure(get_sqlalchemy_uow_per_request, request, 1000)
+    await measure(get_sqlalchemy_uow, request, 1000)
+
+    before = await measure(get_sqlalchemy_uow_per_request, request, iterations)
+    after = await measure(get_sqlalchemy_uow, request, iterations)
+    print(f"{'sessionmaker per request':<26} {before:>8.2f} us/request")
+    print(f"{'shared sessionmaker':<26} {after:>8.2f} us/request")
+    print(f"{'speedup':<26} {before / after:>8.1f}x")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    asyncio.run(run(parser.parse_args().iterations))
+
+
+if __name__ == "__main__":
+    main()
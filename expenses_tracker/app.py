@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Any
 
@@ -5,6 +6,8 @@ import structlog
 from fastapi import FastAPI
 from starlette.staticfiles import StaticFiles
 
+from expenses_tracker.application.interfaces.avatar_storage import IAvatarStorage
+from expenses_tracker.application.interfaces.email_service import IEmailService
 from expenses_tracker.core.logger import prepare_logger
 from expenses_tracker.core.settings import get_settings, Settings
 from expenses_tracker.core.utils import use_handler_name_as_unique_id
@@ -14,21 +17,38 @@ from expenses_tracker.infrastructure.api.exception_handlers import (
 from expenses_tracker.infrastructure.api.main_router import get_routers
 from expenses_tracker.infrastructure.api.middlewares.middlewares import add_middlewares
 from expenses_tracker.infrastructure.api.rate_limiter import init_rate_limiter
+from expenses_tracker.infrastructure.cache.background_cache_warmer import (
+    BackgroundCacheWarmer,
+)
 from expenses_tracker.infrastructure.cache.redis_cache_service import RedisService
-from expenses_tracker.infrastructure.database.avatar_storages.minio_storage import (
-    MinioAvatarStorage,
+from expenses_tracker.infrastructure.cache.two_tier_cache_service import (
+    TwoTierCacheService,
 )
 from expenses_tracker.infrastructure.database.db import (
     create_sqlalchemy_engine,
+    create_sqlalchemy_session_factory,
+    create_psycopg_pool,
+    ping_sqlalchemy_engine,
+    psycopg_pool_stats,
+    sqlalchemy_pool_stats,
+)
+from expenses_tracker.infrastructure.database.repositories.sqlalchemy_uow import (
+    SqlAlchemyUnitOfWork,
 )
+from expenses_tracker.infrastructure.monitoring.health import HealthChecker
 from expenses_tracker.infrastructure.monitoring.opentelemetry import setup_opentelemetry
+from expenses_tracker.infrastructure.monitoring.profiling import (
+    ProfileRecorder,
+    RedisProfilingStorage,
+)
+from expenses_tracker.infrastructure.monitoring.readiness import (
+    ReadinessTracker,
+    ServiceNotReady,
+)
 from expenses_tracker.infrastructure.monitoring.sentry import init_sentry
 from expenses_tracker.infrastructure.security.bcrypt_password_hasher import (
     BcryptPasswordHasher,
 )
-from expenses_tracker.infrastructure.security.fastapi_email_service import (
-    FastapiEmailService,
-)
 from expenses_tracker.infrastructure.security.jwt_token_service import JWTTokenService
 
 logger = structlog.get_logger(__name__)
@@ -49,29 +69,126 @@ def get_app_config(settings: Settings) -> dict[Any, Any]:
     )
 
 
+def create_email_service() -> IEmailService:
+    # fastapi_mail is slow to import, nothing needs it before the first email
+    from expenses_tracker.infrastructure.security.fastapi_email_service import (
+        FastapiEmailService,
+    )
+
+    return FastapiEmailService()
+
+
+def create_avatar_storage() -> IAvatarStorage:
+    # boto3 import and the blocking bucket checks run off the event loop
+    from expenses_tracker.infrastructure.database.avatar_storages.minio_storage import (
+        MinioAvatarStorage,
+    )
+
+    return MinioAvatarStorage()
+
+
+def start_background_services(app: FastAPI) -> ReadinessTracker:
+    async def init_email_service() -> None:
+        app.state.email_service = await asyncio.to_thread(create_email_service)
+
+    async def init_avatar_storage() -> None:
+        app.state.avatar_storage = await asyncio.to_thread(create_avatar_storage)
+
+    readiness = ReadinessTracker()
+    app.state.email_service = None
+    app.state.avatar_storage = None
+    readiness.start("email_service", init_email_service)
+    readiness.start("avatar_storage", init_avatar_storage)
+    return readiness
+
+
+def create_health_checker(
+    app: FastAPI, redis_service: RedisService[Any]
+) -> HealthChecker:
+    async def ping_postgres() -> None:
+        await ping_sqlalchemy_engine(app.state.sqlalchemy_engine)
+
+    async def ping_minio() -> None:
+        if app.state.avatar_storage is None:
+            raise ServiceNotReady("Avatar storage is not initialized")
+        await asyncio.to_thread(app.state.avatar_storage.ping)
+
+    return HealthChecker(
+        probes={
+            "postgres": ping_postgres,
+            "redis": redis_service.ping,
+            "minio": ping_minio,
+        },
+        pools={
+            "sqlalchemy": lambda: sqlalchemy_pool_stats(app.state.sqlalchemy_engine),
+            "psycopg": lambda: psycopg_pool_stats(app.state.psycopg_pool),
+            "redis": redis_service.pool_stats,
+        },
+        # avatar storage is initialised and retried in the background, the
+        # replica can serve everything else while it is down
+        optional={"minio"},
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, Any]:
     app.state.sqlalchemy_engine = create_sqlalchemy_engine()
-    app.state.psycopg_dsn = get_settings().sync_postgres_url
+    app.state.sqlalchemy_session_factory = create_sqlalchemy_session_factory(
+        app.state.sqlalchemy_engine
+    )
+    app.state.psycopg_pool = create_psycopg_pool()
+    await app.state.psycopg_pool.open()
     app.state.token_service = JWTTokenService()
     app.state.password_hasher = BcryptPasswordHasher()
-    app.state.cache_service = RedisService()
-    app.state.email_service = FastapiEmailService()
-    app.state.avatar_storage = MinioAvatarStorage()
+    redis_service = RedisService[Any]()
+    app.state.cache_service = redis_service
+    if get_settings().cache_local_enabled:
+        app.state.cache_service = TwoTierCacheService(remote=app.state.cache_service)
+        await app.state.cache_service.start()
+    app.state.cache_warmer = None
+    if get_settings().cache_warmup_enabled:
+        app.state.cache_warmer = BackgroundCacheWarmer(
+            unit_of_work_factory=lambda: SqlAlchemyUnitOfWork(
+                session_factory=app.state.sqlalchemy_session_factory
+            ),
+            cache_service=app.state.cache_service,
+            password_hasher=app.state.password_hasher,
+        )
+    app.state.profile_recorder = None
+    if get_settings().enable_profiling:
+        app.state.profile_recorder = ProfileRecorder(
+            storage=RedisProfilingStorage(cache_service=app.state.cache_service)
+        )
+        app.state.profile_recorder.start()
+    app.state.readiness = start_background_services(app)
+    app.state.health_checker = create_health_checker(app, redis_service)
     app.state.limiter = init_rate_limiter(get_settings().redis_dsn)
     setup_opentelemetry(app=app, engine=app.state.sqlalchemy_engine)
     logger.info("Startup completed")
     yield
+    if app.state.cache_warmer:
+        await app.state.cache_warmer.close()
+    if app.state.profile_recorder:
+        await app.state.profile_recorder.close()
+    await app.state.health_checker.close()
     await app.state.sqlalchemy_engine.dispose()
+    await app.state.psycopg_pool.close()
     await app.state.cache_service.close()
-    app.state.avatar_storage.close()
+    await app.state.readiness.close()
+    if app.state.avatar_storage:
+        app.state.avatar_storage.close()
+    app.state.password_hasher.close()
     logger.debug("Server stopped")
 
 
 def init_app() -> FastAPI:
     settings = get_settings()
     init_sentry(settings)
-    prepare_logger(log_level=settings.log_level)
+    prepare_logger(
+        log_level=settings.log_level,
+        queue_max_size=settings.log_queue_max_size,
+        block_when_full=settings.log_queue_block_when_full,
+    )
 
     logger.info("Initializing app")
     app = FastAPI(**get_app_config(settings))
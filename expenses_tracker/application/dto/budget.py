@@ -36,3 +36,16 @@ class BudgetUpdateDTO:
     start_date: datetime | None = None
     end_date: datetime | None = None
     category_id: UUID | None = None
+
+
+@dataclass
+class BudgetUtilisationDTO:
+    budget_id: UUID
+    category_id: UUID
+    period: BudgetPeriod
+    start_date: datetime
+    end_date: datetime
+    amount: float
+    spent: float
+    remaining: float
+    percentage: float
@@ -31,3 +31,32 @@ class ExpenseUpdateDTO:
     date: datetime | None = None
     category_id: UUID | None = None
     description: str | None = None
+
+
+@dataclass
+class ExpensePageDTO:
+    items: list[ExpenseDTO]
+    next_cursor: str | None
+
+
+@dataclass
+class ExpenseSummaryDTO:
+    category_id: UUID | None
+    period_start: datetime | None
+    total_amount: float
+    count: int
+    min_amount: float
+    max_amount: float
+    avg_amount: float
+
+
+@dataclass
+class ExpenseImportErrorDTO:
+    row: int
+    error: str
+
+
+@dataclass
+class ExpenseImportResultDTO:
+    created: int
+    errors: list[ExpenseImportErrorDTO]
@@ -1,26 +1,110 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from enum import Enum
+from typing import Final, TypeVar, Generic
 
 T = TypeVar("T")
 
 
+class Tombstone(Enum):
+    TOMBSTONE = "tombstone"
+
+
+# cached in place of entities that were looked up and not found
+TOMBSTONE: Final = Tombstone.TOMBSTONE
+
+
+class ICachePipeline(ABC, Generic[T]):
+    """Buffers mutations, they are sent in one round trip when the context exits"""
+
+    @abstractmethod
+    def set(
+        self, key: str, value: T, ttl: int | None = None, tags: list[str] | None = None
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate_tags(self, *tags: str) -> None:
+        pass
+
+    @abstractmethod
+    def bump_version(self, *namespaces: str) -> None:
+        """Orphans every key built from the previous versions"""
+        pass
+
+
 class ICacheService(ABC, Generic[T]):
     @abstractmethod
     async def get(self, key: str, serializer: type[T]) -> T | None:
         pass
 
     @abstractmethod
-    async def get_keys_by_pattern(self, pattern: str) -> list[str]:
+    async def get_or_tombstone(
+        self, key: str, serializer: type[T]
+    ) -> T | Tombstone | None:
+        """Tells a tombstone apart from a miss, `get` returns None for both"""
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: list[str], serializer: type[T]) -> list[T | None]:
         pass
 
     @abstractmethod
-    async def delete_keys_by_pattern(self, pattern: str) -> None:
+    async def get_or_load(
+        self,
+        key: str,
+        serializer: type[T],
+        loader: Callable[[], Awaitable[T]],
+        ttl: int | None = None,
+        tags: list[str] | None = None,
+    ) -> T:
+        """Read-through get, concurrent misses for the same key share one loader call"""
         pass
 
     @abstractmethod
-    async def set(self, key: str, value: T, ttl: int | None = None) -> None:
+    async def set(
+        self, key: str, value: T, ttl: int | None = None, tags: list[str] | None = None
+    ) -> None:
+        """Tagged keys are deleted together by `invalidate_tags`"""
+        pass
+
+    @abstractmethod
+    async def set_tombstone(self, key: str, ttl: int) -> None:
+        """Does not overwrite a value, a later `set` replaces the tombstone"""
+        pass
+
+    @abstractmethod
+    async def set_many(self, items: dict[str, T], ttl: int | None = None) -> None:
         pass
 
     @abstractmethod
     async def delete(self, key: str) -> None:
         pass
+
+    @abstractmethod
+    async def delete_many(self, keys: list[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def get_tag_members(self, tag: str) -> list[str]:
+        """Live keys registered under the tag"""
+        pass
+
+    @abstractmethod
+    async def invalidate_tags(self, tags: list[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def get_version(self, namespace: str) -> int | None:
+        """Embedded in derived keys, None if it can't be read and nothing should be cached"""
+        pass
+
+    @abstractmethod
+    def pipeline(self) -> AbstractAsyncContextManager[ICachePipeline[T]]:
+        """Transactional batch of mutations, discarded if the block raises"""
+        pass
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class ICacheWarmer(ABC):
+    @abstractmethod
+    def schedule(self, user_id: UUID) -> None:
+        """Fills the caches the user reads first, in the background"""
+        pass
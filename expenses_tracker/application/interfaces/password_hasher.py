@@ -3,9 +3,9 @@ from abc import ABC, abstractmethod
 
 class IPasswordHasher(ABC):
     @abstractmethod
-    def hash(self, password: str) -> str:
+    async def hash(self, password: str) -> str:
         pass
 
     @abstractmethod
-    def verify(self, password: str, hashed: str) -> bool:
+    async def verify(self, password: str, hashed: str) -> bool:
         pass
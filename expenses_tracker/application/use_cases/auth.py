@@ -6,6 +6,7 @@ import structlog
 from expenses_tracker.application.dto.token import TokenPairDTO
 from expenses_tracker.application.dto.user import UserCreateDTO
 from expenses_tracker.application.interfaces.cache_service import ICacheService
+from expenses_tracker.application.interfaces.cache_warmer import ICacheWarmer
 from expenses_tracker.application.interfaces.email_service import IEmailService
 from expenses_tracker.application.interfaces.password_hasher import IPasswordHasher
 from expenses_tracker.application.interfaces.token_service import ITokenService
@@ -31,12 +32,14 @@ class AuthUserUseCases:
         token_service: ITokenService,
         email_service: IEmailService,
         cache_service: ICacheService[TokenPayload],
+        cache_warmer: ICacheWarmer | None = None,
     ):
         self._unit_of_work = unit_of_work
         self._password_hasher = password_hasher
         self._token_service = token_service
         self._email_service = email_service
         self._cache_service = cache_service
+        self._cache_warmer = cache_warmer
 
     @staticmethod
     def _refresh_token_cache_key(jti: str) -> str:
@@ -60,6 +63,13 @@ class AuthUserUseCases:
         )
         return TokenPairDTO(access_token=access_token, refresh_token=refresh_token)
 
+    async def _on_token_issued(self, user_id: UUID) -> None:
+        """Called after the new refresh jti is committed"""
+        # the cached user still holds the previous refresh jti
+        await self._cache_service.delete(key=self._user_cache_key(user_id))
+        if self._cache_warmer:
+            self._cache_warmer.schedule(user_id=user_id)
+
     async def _validate_user_uniqueness(
         self,
         uow: IUnitOfWork,
@@ -78,7 +88,9 @@ class AuthUserUseCases:
             await self._validate_user_uniqueness(
                 uow=uow, new_email=user_data.email, new_username=user_data.username
             )
-            hashed_password = self._password_hasher.hash(password=user_data.password)
+            hashed_password = await self._password_hasher.hash(
+                password=user_data.password
+            )
             refresh_jti = str(uuid4())
             new_user = User(
                 username=user_data.username,
@@ -97,7 +109,8 @@ class AuthUserUseCases:
             if not user:
                 raise UserNotFound(f"User with username {username} not found")
 
-            if not self._password_hasher.verify(
+            # OAuth accounts have nothing to check the password against
+            if not user.has_usable_password or not await self._password_hasher.verify(
                 password=password, hashed=user.hashed_password
             ):
                 raise InvalidCredentials(f"Invalid credentials for user {username}")
@@ -106,8 +119,10 @@ class AuthUserUseCases:
             await uow.user_repository.update_last_refresh_jti(
                 user_id=user.id, jti=refresh_jti
             )
-            return self._create_tokens_for_user(user=user, refresh_jti=refresh_jti)
-        assert False, "unreachable"
+            tokens = self._create_tokens_for_user(user=user, refresh_jti=refresh_jti)
+            user_id = user.id
+        await self._on_token_issued(user_id=user_id)
+        return tokens
 
     async def refresh(self, refresh_token: str) -> TokenPairDTO:
         payload = self._token_service.decode_token(refresh_token)
@@ -141,8 +156,9 @@ class AuthUserUseCases:
                 user_id=user.id, jti=refresh_jti
             )
 
-            return self._create_tokens_for_user(user=user, refresh_jti=refresh_jti)
-        assert False, "unreachable"
+            tokens = self._create_tokens_for_user(user=user, refresh_jti=refresh_jti)
+        await self._on_token_issued(user_id=user_id)
+        return tokens
 
     async def logout(self, refresh_token: str) -> None:
         payload = self._token_service.decode_token(refresh_token)
@@ -256,7 +272,7 @@ class AuthUserUseCases:
             if not user:
                 raise UserNotFound(f"User with id {user_id} not found")
 
-            hashed_password = self._password_hasher.hash(password=new_password)
+            hashed_password = await self._password_hasher.hash(password=new_password)
             user.hashed_password = hashed_password
             user.last_refresh_jti = None  # Invalidate all existing refresh tokens
             await uow.user_repository.update(user=user)
@@ -7,22 +7,33 @@ from expenses_tracker.application.dto.budget import (
     BudgetDTO,
     BudgetCreateDTO,
     BudgetUpdateDTO,
+    BudgetUtilisationDTO,
+)
+from expenses_tracker.application.interfaces.cache_service import (
+    TOMBSTONE,
+    ICacheService,
 )
-from expenses_tracker.application.interfaces.cache_service import ICacheService
 from expenses_tracker.core.constants import BudgetPeriod
 from expenses_tracker.core.settings import get_settings
-from expenses_tracker.domain.entities.budget import Budget
+from expenses_tracker.domain.entities.budget import Budget, BudgetUtilisation
 from expenses_tracker.domain.exceptions.budget import BudgetNotFound
 from expenses_tracker.domain.repositories.uow import IUnitOfWork
 
 logger = structlog.get_logger(__name__)
 
 
+def user_budgets_utilisation_cache_key(user_id: UUID) -> str:
+    """Also dropped by ExpenseUseCases, spending changes the utilisation"""
+    return f"budgets:user:{user_id}:utilisation"
+
+
 class BudgetUseCases:
     def __init__(
         self,
         unit_of_work: IUnitOfWork,
-        cache_service: ICacheService[BudgetDTO | list[BudgetDTO]],
+        cache_service: ICacheService[
+            BudgetDTO | list[BudgetDTO] | list[BudgetUtilisationDTO]
+        ],
     ):
         self._unit_of_work = unit_of_work
         self._cache_service = cache_service
@@ -41,6 +52,21 @@ class BudgetUseCases:
             updated_at=budget.updated_at,
         )
 
+    @staticmethod
+    def _to_utilisation_dto(utilisation: BudgetUtilisation) -> BudgetUtilisationDTO:
+        budget = utilisation.budget
+        return BudgetUtilisationDTO(
+            budget_id=budget.id,
+            category_id=budget.category_id,
+            period=budget.period,
+            start_date=budget.start_date,
+            end_date=budget.end_date,
+            amount=budget.amount,
+            spent=utilisation.spent,
+            remaining=utilisation.remaining,
+            percentage=utilisation.percentage,
+        )
+
     @staticmethod
     def _budget_cache_key(budget_id: UUID) -> str:
         return f"budget:{budget_id}"
@@ -49,11 +75,31 @@ class BudgetUseCases:
     def _user_budgets_cache_key(user_id: UUID) -> str:
         return f"budgets:user:{user_id}"
 
+    _user_budgets_utilisation_cache_key = staticmethod(
+        user_budgets_utilisation_cache_key
+    )
+
+    @staticmethod
+    def _user_budgets_cache_tag(user_id: UUID) -> str:
+        """Every cached budget list and utilisation of the user"""
+        return f"budgets:user:{user_id}"
+
+    @staticmethod
+    def _user_budgets_cache_namespace(user_id: UUID) -> str:
+        """Its version is embedded in the keys of parametrised budget queries"""
+        return f"budgets:user:{user_id}"
+
+    @staticmethod
+    def _user_budgets_query_cache_key(user_id: UUID, version: int, *params: str) -> str:
+        return f"budgets:user:{user_id}:v{version}:{':'.join(params)}"
+
     async def get_budget(self, budget_id: UUID) -> BudgetDTO | None:
         cache_key = self._budget_cache_key(budget_id)
-        cached_budget = await self._cache_service.get(
+        cached_budget = await self._cache_service.get_or_tombstone(
             key=cache_key, serializer=BudgetDTO
         )
+        if cached_budget is TOMBSTONE:
+            raise BudgetNotFound(f"Budget with id {budget_id} not found")
         if cached_budget:
             logger.bind(budget_id=budget_id).debug("Retrieved budget from cache")
             return cached_budget  # type: ignore
@@ -61,6 +107,9 @@ class BudgetUseCases:
         async with self._unit_of_work as uow:
             budget = await uow.budget_repository.get_by_id(budget_id=budget_id)
             if not budget:
+                ttl = get_settings().budget_tombstone_ttl_seconds
+                if ttl:
+                    await self._cache_service.set_tombstone(key=cache_key, ttl=ttl)
                 raise BudgetNotFound(f"Budget with id {budget_id} not found")
 
             dto = self._to_dto(budget)
@@ -74,40 +123,52 @@ class BudgetUseCases:
         assert False, "unreachable"
 
     async def get_budgets_by_user_id(self, user_id: UUID) -> list[BudgetDTO]:
-        cache_key = self._user_budgets_cache_key(user_id)
-        cached_budgets = await self._cache_service.get(
-            key=cache_key, serializer=list[BudgetDTO]
-        )
-        if cached_budgets:
-            logger.bind(user_id=user_id, count=len(cached_budgets)).debug(  # type: ignore
-                "Retrieved budgets from cache"
-            )
-            return cached_budgets  # type: ignore
+        async def load() -> list[BudgetDTO]:
+            async with self._unit_of_work as uow:
+                budgets = await uow.budget_repository.get_all_by_user_id(
+                    user_id=user_id
+                )
+                logger.bind(user_id=user_id, count=len(budgets)).debug(
+                    "Retrieved budgets from repo"
+                )
+                return [self._to_dto(b) for b in budgets]
+            assert False, "unreachable"
 
-        async with self._unit_of_work as uow:
-            budgets = await uow.budget_repository.get_all_by_user_id(user_id=user_id)
-            dtos = [self._to_dto(b) for b in budgets]
-            await self._cache_service.set(
-                key=cache_key, value=dtos, ttl=get_settings().budgets_list_ttl_seconds
-            )
-            logger.bind(user_id=user_id, count=len(dtos)).debug(
-                "Retrieved budgets from repo and cached"
-            )
-            return dtos
-        assert False, "unreachable"
+        return await self._cache_service.get_or_load(  # type: ignore
+            key=self._user_budgets_cache_key(user_id),
+            serializer=list[BudgetDTO],
+            loader=load,
+            ttl=get_settings().budgets_list_ttl_seconds,
+            tags=[self._user_budgets_cache_tag(user_id)],
+        )
 
     async def get_budgets_by_user_id_and_date_range(
         self, user_id: UUID, start_date: datetime, end_date: datetime
     ) -> list[BudgetDTO]:
-        async with self._unit_of_work as uow:
-            budgets = await uow.budget_repository.get_by_user_id_and_date_range(
-                user_id=user_id, start_date=start_date, end_date=end_date
-            )
-            logger.bind(user_id=user_id, count=len(budgets)).debug(
-                "Retrieved budgets by date range from repo"
-            )
-            return [self._to_dto(b) for b in budgets]
-        assert False, "unreachable"
+        async def load() -> list[BudgetDTO]:
+            async with self._unit_of_work as uow:
+                budgets = await uow.budget_repository.get_by_user_id_and_date_range(
+                    user_id=user_id, start_date=start_date, end_date=end_date
+                )
+                logger.bind(user_id=user_id, count=len(budgets)).debug(
+                    "Retrieved budgets by date range from repo"
+                )
+                return [self._to_dto(b) for b in budgets]
+            assert False, "unreachable"
+
+        version = await self._cache_service.get_version(
+            namespace=self._user_budgets_cache_namespace(user_id)
+        )
+        if version is None:
+            return await load()
+        return await self._cache_service.get_or_load(  # type: ignore
+            key=self._user_budgets_query_cache_key(
+                user_id, version, "range", start_date.isoformat(), end_date.isoformat()
+            ),
+            serializer=list[BudgetDTO],
+            loader=load,
+            ttl=get_settings().budgets_query_ttl_seconds,
+        )
 
     async def get_budgets_by_user_id_and_category_id(
         self, user_id: UUID, category_id: UUID
@@ -122,31 +183,78 @@ class BudgetUseCases:
             return [self._to_dto(b) for b in budgets]
         assert False, "unreachable"
 
+    @staticmethod
+    def _as_aware(date: datetime) -> datetime:
+        # budget dates are timestamptz, Postgres compares naive input as UTC
+        return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+
     async def get_active_budgets_by_user_id(
         self, user_id: UUID, current_date: datetime
     ) -> list[BudgetDTO]:
-        async with self._unit_of_work as uow:
-            budgets = await uow.budget_repository.get_active_budgets_by_user_id(
-                user_id=user_id, current_date=current_date
-            )
-            logger.bind(user_id=user_id, count=len(budgets)).debug(
-                "Retrieved active budgets from repo"
-            )
-            return [self._to_dto(b) for b in budgets]
-        assert False, "unreachable"
+        # filtered from the cached list of all budgets, keying a cached query
+        # by the client's timestamp would make almost every request a miss
+        current_date = self._as_aware(current_date)
+        budgets = [
+            budget
+            for budget in await self.get_budgets_by_user_id(user_id=user_id)
+            if self._as_aware(budget.start_date)
+            <= current_date
+            <= self._as_aware(budget.end_date)
+        ]
+        logger.bind(user_id=user_id, count=len(budgets)).debug(
+            "Filtered active budgets"
+        )
+        return budgets
+
+    async def get_budgets_utilisation(
+        self, user_id: UUID
+    ) -> list[BudgetUtilisationDTO]:
+        async def load() -> list[BudgetUtilisationDTO]:
+            async with self._unit_of_work as uow:
+                utilisation = await uow.budget_repository.get_utilisation_by_user_id(
+                    user_id=user_id, current_date=datetime.now(timezone.utc)
+                )
+                logger.bind(user_id=user_id, count=len(utilisation)).debug(
+                    "Retrieved budgets utilisation from repo"
+                )
+                return [self._to_utilisation_dto(u) for u in utilisation]
+            assert False, "unreachable"
+
+        return await self._cache_service.get_or_load(  # type: ignore
+            key=self._user_budgets_utilisation_cache_key(user_id),
+            serializer=list[BudgetUtilisationDTO],
+            loader=load,
+            ttl=get_settings().budgets_utilisation_ttl_seconds,
+            tags=[self._user_budgets_cache_tag(user_id)],
+        )
 
     async def get_budgets_by_user_id_and_period(
         self, user_id: UUID, period: BudgetPeriod
     ) -> list[BudgetDTO]:
-        async with self._unit_of_work as uow:
-            budgets = await uow.budget_repository.get_by_user_id_and_period(
-                user_id=user_id, period=period
-            )
-            logger.bind(user_id=user_id, count=len(budgets)).debug(
-                "Retrieved budgets by period from repo"
-            )
-            return [self._to_dto(b) for b in budgets]
-        assert False, "unreachable"
+        async def load() -> list[BudgetDTO]:
+            async with self._unit_of_work as uow:
+                budgets = await uow.budget_repository.get_by_user_id_and_period(
+                    user_id=user_id, period=period
+                )
+                logger.bind(user_id=user_id, count=len(budgets)).debug(
+                    "Retrieved budgets by period from repo"
+                )
+                return [self._to_dto(b) for b in budgets]
+            assert False, "unreachable"
+
+        version = await self._cache_service.get_version(
+            namespace=self._user_budgets_cache_namespace(user_id)
+        )
+        if version is None:
+            return await load()
+        return await self._cache_service.get_or_load(  # type: ignore
+            key=self._user_budgets_query_cache_key(
+                user_id, version, "period", period.value
+            ),
+            serializer=list[BudgetDTO],
+            loader=load,
+            ttl=get_settings().budgets_query_ttl_seconds,
+        )
 
     async def get_total_budget_amount_for_period(
         self, user_id: UUID, start_date: datetime, end_date: datetime
@@ -177,15 +285,15 @@ class BudgetUseCases:
             logger.bind(budget=budget).debug("Created budget in repo")
 
             dto = self._to_dto(budget)
-            await self._cache_service.set(
-                key=self._budget_cache_key(dto.id),
-                value=dto,
-                ttl=get_settings().budget_dto_ttl_seconds,
-            )
-            # invalidate user budgets cache
-            await self._cache_service.delete(
-                key=self._user_budgets_cache_key(budget.user_id)
-            )
+            async with self._cache_service.pipeline() as pipe:
+                pipe.set(
+                    key=self._budget_cache_key(dto.id),
+                    value=dto,
+                    ttl=get_settings().budget_dto_ttl_seconds,
+                )
+                # invalidate user budgets cache
+                pipe.invalidate_tags(self._user_budgets_cache_tag(budget.user_id))
+                pipe.bump_version(self._user_budgets_cache_namespace(budget.user_id))
             return dto
         assert False, "unreachable"
 
@@ -211,15 +319,15 @@ class BudgetUseCases:
             logger.bind(updated_budget=updated_budget).debug("Updated budget in repo")
 
             dto = self._to_dto(updated_budget)
-            await self._cache_service.set(
-                key=self._budget_cache_key(dto.id),
-                value=dto,
-                ttl=get_settings().budget_dto_ttl_seconds,
-            )
-            # invalidate user budgets cache
-            await self._cache_service.delete(
-                key=self._user_budgets_cache_key(dto.user_id)
-            )
+            async with self._cache_service.pipeline() as pipe:
+                pipe.set(
+                    key=self._budget_cache_key(dto.id),
+                    value=dto,
+                    ttl=get_settings().budget_dto_ttl_seconds,
+                )
+                # invalidate user budgets cache
+                pipe.invalidate_tags(self._user_budgets_cache_tag(dto.user_id))
+                pipe.bump_version(self._user_budgets_cache_namespace(dto.user_id))
             return dto
         assert False, "unreachable"
 
@@ -232,8 +340,8 @@ class BudgetUseCases:
             await uow.budget_repository.delete(budget=budget)
             logger.bind(budget=budget).debug("Deleted budget in repo")
 
-            await self._cache_service.delete(key=self._budget_cache_key(budget_id))
-            await self._cache_service.delete(
-                key=self._user_budgets_cache_key(budget.user_id)
-            )
+            async with self._cache_service.pipeline() as pipe:
+                pipe.delete(self._budget_cache_key(budget_id))
+                pipe.invalidate_tags(self._user_budgets_cache_tag(budget.user_id))
+                pipe.bump_version(self._user_budgets_cache_namespace(budget.user_id))
             return None
@@ -8,7 +8,10 @@ from expenses_tracker.application.dto.category import (
     CategoryCreateDTO,
     CategoryUpdateDTO,
 )
-from expenses_tracker.application.interfaces.cache_service import ICacheService
+from expenses_tracker.application.interfaces.cache_service import (
+    TOMBSTONE,
+    ICacheService,
+)
 from expenses_tracker.core.settings import get_settings
 from expenses_tracker.domain.entities.category import Category
 from expenses_tracker.domain.exceptions.category import CategoryNotFound
@@ -47,11 +50,24 @@ class CategoryUseCases:
     def _user_categories_cache_key(user_id: UUID) -> str:
         return f"category:user:{user_id}"
 
+    @staticmethod
+    def _user_categories_cache_tag(user_id: UUID) -> str:
+        """Every cached category list of the user"""
+        return f"categories:user:{user_id}"
+
+    @staticmethod
+    def _user_cascaded_caches(user_id: UUID) -> tuple[str, str]:
+        """Tags and version namespaces of the user expenses and budgets, which
+        are deleted along with the category"""
+        return f"expenses:user:{user_id}", f"budgets:user:{user_id}"
+
     async def get_category(self, category_id: UUID) -> CategoryDTO | None:
         cache_key = self._category_cache_key(category_id)
-        cached_category = await self._cache_service.get(
+        cached_category = await self._cache_service.get_or_tombstone(
             key=cache_key, serializer=CategoryDTO
         )
+        if cached_category is TOMBSTONE:
+            raise CategoryNotFound(f"Category with id {category_id} not found")
         if cached_category:
             logger.bind(category_id=category_id).debug("Retrieved category from cache")
             return cached_category  # type: ignore
@@ -59,6 +75,9 @@ class CategoryUseCases:
         async with self._unit_of_work as uow:
             category = await uow.category_repository.get_by_id(category_id=category_id)
             if not category:
+                ttl = get_settings().category_tombstone_ttl_seconds
+                if ttl:
+                    await self._cache_service.set_tombstone(key=cache_key, ttl=ttl)
                 raise CategoryNotFound(f"Category with id {category_id} not found")
 
             dto = self._to_dto(category)
@@ -72,31 +91,24 @@ class CategoryUseCases:
         assert False, "unreachable"
 
     async def get_categories_by_user_id(self, user_id: UUID) -> list[CategoryDTO]:
-        cache_key = self._user_categories_cache_key(user_id)
-        cached_categories = await self._cache_service.get(
-            key=cache_key, serializer=list[CategoryDTO]
+        async def load() -> list[CategoryDTO]:
+            async with self._unit_of_work as uow:
+                categories = await uow.category_repository.get_all_by_user_id(
+                    user_id=user_id
+                )
+                logger.bind(user_id=user_id, count=len(categories)).debug(
+                    "Retrieved categories from repo"
+                )
+                return [self._to_dto(c) for c in categories]
+            assert False, "unreachable"
+
+        return await self._cache_service.get_or_load(  # type: ignore
+            key=self._user_categories_cache_key(user_id),
+            serializer=list[CategoryDTO],
+            loader=load,
+            ttl=get_settings().categories_list_ttl_seconds,
+            tags=[self._user_categories_cache_tag(user_id)],
         )
-        if cached_categories:
-            logger.bind(user_id=user_id, count=len(cached_categories)).debug(  # type: ignore
-                "Retrieved categories from cache"
-            )
-            return cached_categories  # type: ignore
-
-        async with self._unit_of_work as uow:
-            categories = await uow.category_repository.get_all_by_user_id(
-                user_id=user_id
-            )
-            dtos = [self._to_dto(c) for c in categories]
-            await self._cache_service.set(
-                key=cache_key,
-                value=dtos,
-                ttl=get_settings().categories_list_ttl_seconds,
-            )
-            logger.bind(user_id=user_id, count=len(dtos)).debug(
-                "Retrieved categories from repo and cached"
-            )
-            return dtos
-        assert False, "unreachable"
 
     async def create_category(self, category_data: CategoryCreateDTO) -> CategoryDTO:
         async with self._unit_of_work as uow:
@@ -111,15 +123,14 @@ class CategoryUseCases:
             logger.bind(category=category).debug("Created category in repo")
 
             dto = self._to_dto(category)
-            await self._cache_service.set(
-                key=self._category_cache_key(dto.id),
-                value=dto,
-                ttl=get_settings().category_dto_ttl_seconds,
-            )
-            # invalidate user categories cache
-            await self._cache_service.delete(
-                key=self._user_categories_cache_key(category.user_id)
-            )
+            async with self._cache_service.pipeline() as pipe:
+                pipe.set(
+                    key=self._category_cache_key(dto.id),
+                    value=dto,
+                    ttl=get_settings().category_dto_ttl_seconds,
+                )
+                # invalidate user categories cache
+                pipe.invalidate_tags(self._user_categories_cache_tag(category.user_id))
             return dto
         assert False, "unreachable"
 
@@ -149,15 +160,14 @@ class CategoryUseCases:
             )
 
             dto = self._to_dto(updated_category)
-            await self._cache_service.set(
-                key=self._category_cache_key(dto.id),
-                value=dto,
-                ttl=get_settings().category_dto_ttl_seconds,
-            )
-            # invalidate user categories cache
-            await self._cache_service.delete(
-                key=self._user_categories_cache_key(dto.user_id)
-            )
+            async with self._cache_service.pipeline() as pipe:
+                pipe.set(
+                    key=self._category_cache_key(dto.id),
+                    value=dto,
+                    ttl=get_settings().category_dto_ttl_seconds,
+                )
+                # invalidate user categories cache
+                pipe.invalidate_tags(self._user_categories_cache_tag(dto.user_id))
             return dto
         assert False, "unreachable"
 
@@ -170,9 +180,12 @@ class CategoryUseCases:
             await uow.category_repository.delete(category=category)
             logger.bind(category=category).debug("Deleted category in repo")
 
-            await self._cache_service.delete(key=self._category_cache_key(category_id))
-            await self._cache_service.delete(
-                key=self._user_categories_cache_key(category.user_id)
-            )
+            async with self._cache_service.pipeline() as pipe:
+                pipe.delete(self._category_cache_key(category_id))
+                pipe.invalidate_tags(
+                    self._user_categories_cache_tag(category.user_id),
+                    *self._user_cascaded_caches(category.user_id),
+                )
+                pipe.bump_version(*self._user_cascaded_caches(category.user_id))
             return None
         assert False, "unreachable"
@@ -1,17 +1,35 @@
+import base64
+import binascii
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from uuid import UUID
 
+import orjson
 import structlog
 
 from expenses_tracker.application.dto.expense import (
     ExpenseDTO,
     ExpenseCreateDTO,
     ExpenseUpdateDTO,
+    ExpensePageDTO,
+    ExpenseSummaryDTO,
+    ExpenseImportErrorDTO,
+    ExpenseImportResultDTO,
 )
-from expenses_tracker.application.interfaces.cache_service import ICacheService
+from expenses_tracker.application.interfaces.cache_service import (
+    TOMBSTONE,
+    ICacheService,
+)
+from expenses_tracker.application.use_cases.budget import (
+    user_budgets_utilisation_cache_key,
+)
+from expenses_tracker.core.constants import ExpenseGranularity
 from expenses_tracker.core.settings import get_settings
 from expenses_tracker.domain.entities.expense import Expense
-from expenses_tracker.domain.exceptions.expense import ExpenseNotFound
+from expenses_tracker.domain.exceptions.expense import (
+    ExpenseNotFound,
+    InvalidExpenseCursor,
+)
 from expenses_tracker.domain.repositories.uow import IUnitOfWork
 
 logger = structlog.get_logger(__name__)
@@ -21,7 +39,9 @@ class ExpenseUseCases:
     def __init__(
         self,
         unit_of_work: IUnitOfWork,
-        cache_service: ICacheService[ExpenseDTO | list[ExpenseDTO]],
+        cache_service: ICacheService[
+            ExpenseDTO | list[ExpenseDTO] | list[ExpenseSummaryDTO]
+        ],
     ):
         self._unit_of_work = unit_of_work
         self._cache_service = cache_service
@@ -51,11 +71,47 @@ class ExpenseUseCases:
     def _user_category_expenses_cache_key(user_id: UUID, category_id: UUID) -> str:
         return f"expenses:user:{user_id}:category:{category_id}"
 
+    _user_budgets_utilisation_cache_key = staticmethod(
+        user_budgets_utilisation_cache_key
+    )
+
+    @staticmethod
+    def _user_expenses_cache_tag(user_id: UUID) -> str:
+        """Every cached expense list of the user"""
+        return f"expenses:user:{user_id}"
+
+    @staticmethod
+    def _user_expenses_cache_namespace(user_id: UUID) -> str:
+        """Its version is embedded in the keys of parametrised expense queries"""
+        return f"expenses:user:{user_id}"
+
+    @staticmethod
+    def _user_expenses_query_cache_key(
+        user_id: UUID, version: int, *params: str
+    ) -> str:
+        return f"expenses:user:{user_id}:v{version}:{':'.join(params)}"
+
+    @staticmethod
+    def _encode_cursor(expense: Expense) -> str:
+        raw = orjson.dumps([expense.date.isoformat(), str(expense.id)])
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            date, expense_id = orjson.loads(base64.urlsafe_b64decode(padded))
+            return datetime.fromisoformat(date), UUID(expense_id)
+        except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as e:
+            raise InvalidExpenseCursor(f"Invalid cursor {cursor}") from e
+
     async def get_expense(self, expense_id: UUID) -> ExpenseDTO:
         cache_key = self._expense_cache_key(expense_id)
-        cached_expense = await self._cache_service.get(
+        cached_expense = await self._cache_service.get_or_tombstone(
             key=cache_key, serializer=ExpenseDTO
         )
+        if cached_expense is TOMBSTONE:
+            raise ExpenseNotFound(f"Expense with id {expense_id} not found")
         if cached_expense:
             logger.bind(expense_id=expense_id).debug("Retrieved expense from cache")
             return cached_expense  # type: ignore
@@ -63,6 +119,9 @@ class ExpenseUseCases:
         async with self._unit_of_work as uow:
             expense = await uow.expense_repository.get_by_id(expense_id=expense_id)
             if not expense:
+                ttl = get_settings().expense_tombstone_ttl_seconds
+                if ttl:
+                    await self._cache_service.set_tombstone(key=cache_key, ttl=ttl)
                 raise ExpenseNotFound(f"Expense with id {expense_id} not found")
 
             dto = self._to_dto(expense)
@@ -76,67 +135,167 @@ class ExpenseUseCases:
         assert False, "unreachable"
 
     async def get_expenses_by_user_id(self, user_id: UUID) -> list[ExpenseDTO]:
-        cache_key = self._user_expenses_cache_key(user_id)
-        cached_expenses = await self._cache_service.get(
-            key=cache_key, serializer=list[ExpenseDTO]
+        async def load() -> list[ExpenseDTO]:
+            async with self._unit_of_work as uow:
+                expenses = await uow.expense_repository.get_all_by_user_id(
+                    user_id=user_id
+                )
+                logger.bind(user_id=user_id, count=len(expenses)).debug(
+                    "Retrieved expenses by user from repo"
+                )
+                return [self._to_dto(e) for e in expenses]
+            assert False, "unreachable"
+
+        return await self._cache_service.get_or_load(  # type: ignore
+            key=self._user_expenses_cache_key(user_id),
+            serializer=list[ExpenseDTO],
+            loader=load,
+            ttl=get_settings().expenses_list_ttl_seconds,
+            tags=[self._user_expenses_cache_tag(user_id)],
         )
-        if cached_expenses:
-            logger.bind(user_id=user_id, count=len(cached_expenses)).debug(  # type: ignore
-                "Retrieved budgets from cache"
-            )
-            return cached_expenses  # type: ignore
 
+    async def get_expenses_page_by_user_id(
+        self, user_id: UUID, limit: int, cursor: str | None = None
+    ) -> ExpensePageDTO:
+        after = self._decode_cursor(cursor) if cursor else None
         async with self._unit_of_work as uow:
-            expenses = await uow.expense_repository.get_all_by_user_id(user_id=user_id)
-            dtos = [self._to_dto(e) for e in expenses]
-            await self._cache_service.set(
-                key=cache_key, value=dtos, ttl=get_settings().expenses_list_ttl_seconds
+            # one extra row tells whether there is a next page
+            expenses = await uow.expense_repository.get_page_by_user_id(
+                user_id=user_id, limit=limit + 1, after=after
+            )
+            page = expenses[:limit]
+            next_cursor = (
+                self._encode_cursor(page[-1]) if len(expenses) > limit else None
             )
-            logger.bind(user_id=user_id, count=len(dtos)).debug(
-                "Retrieved expenses by user from repo and cached"
+            logger.bind(user_id=user_id, count=len(page)).debug(
+                "Retrieved expenses page by user from repo"
+            )
+            return ExpensePageDTO(
+                items=[self._to_dto(e) for e in page], next_cursor=next_cursor
             )
-            return dtos
         assert False, "unreachable"
 
+    async def stream_expenses_by_user_id(
+        self, user_id: UUID
+    ) -> AsyncIterator[ExpenseDTO]:
+        async with self._unit_of_work as uow:
+            async for expense in uow.expense_repository.stream_by_user_id(
+                user_id=user_id, batch_size=get_settings().expenses_stream_batch_size
+            ):
+                yield self._to_dto(expense)
+        logger.bind(user_id=user_id).debug("Streamed expenses by user from repo")
+
+    async def export_expenses_csv(self, user_id: UUID) -> AsyncIterator[bytes]:
+        async with self._unit_of_work as uow:
+            async for chunk in uow.expense_repository.export_csv_by_user_id(
+                user_id=user_id, batch_size=get_settings().expenses_stream_batch_size
+            ):
+                yield chunk
+        logger.bind(user_id=user_id).debug("Exported expenses by user from repo")
+
     async def get_expenses_by_user_id_and_date_range(
         self, user_id: UUID, start_date: datetime, end_date: datetime
     ) -> list[ExpenseDTO]:
-        async with self._unit_of_work as uow:
-            expenses = await uow.expense_repository.get_by_user_id_and_date_range(
-                user_id=user_id, start_date=start_date, end_date=end_date
-            )
-            logger.bind(expenses=expenses).debug(
-                "Retrieved expenses by date range from repo"
-            )
-            return [self._to_dto(e) for e in expenses]
-        assert False, "unreachable"
+        async def load() -> list[ExpenseDTO]:
+            async with self._unit_of_work as uow:
+                expenses = await uow.expense_repository.get_by_user_id_and_date_range(
+                    user_id=user_id, start_date=start_date, end_date=end_date
+                )
+                logger.bind(user_id=user_id, count=len(expenses)).debug(
+                    "Retrieved expenses by date range from repo"
+                )
+                return [self._to_dto(e) for e in expenses]
+            assert False, "unreachable"
+
+        version = await self._cache_service.get_version(
+            namespace=self._user_expenses_cache_namespace(user_id)
+        )
+        if version is None:
+            return await load()
+        return await self._cache_service.get_or_load(  # type: ignore
+            key=self._user_expenses_query_cache_key(
+                user_id, version, "range", start_date.isoformat(), end_date.isoformat()
+            ),
+            serializer=list[ExpenseDTO],
+            loader=load,
+            ttl=get_settings().expenses_query_ttl_seconds,
+        )
+
+    async def get_expenses_summary(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: ExpenseGranularity | None = None,
+        group_by_category: bool = True,
+    ) -> list[ExpenseSummaryDTO]:
+        async def load() -> list[ExpenseSummaryDTO]:
+            async with self._unit_of_work as uow:
+                summaries = await uow.expense_repository.get_summary_by_user_id(
+                    user_id=user_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                    granularity=granularity,
+                    group_by_category=group_by_category,
+                )
+                logger.bind(user_id=user_id, buckets=len(summaries)).debug(
+                    "Retrieved expenses summary from repo"
+                )
+                return [
+                    ExpenseSummaryDTO(
+                        category_id=s.category_id,
+                        period_start=s.period_start,
+                        total_amount=s.total_amount,
+                        count=s.count,
+                        min_amount=s.min_amount,
+                        max_amount=s.max_amount,
+                        avg_amount=s.avg_amount,
+                    )
+                    for s in summaries
+                ]
+            assert False, "unreachable"
+
+        version = await self._cache_service.get_version(
+            namespace=self._user_expenses_cache_namespace(user_id)
+        )
+        if version is None:
+            return await load()
+        return await self._cache_service.get_or_load(  # type: ignore
+            key=self._user_expenses_query_cache_key(
+                user_id,
+                version,
+                "summary",
+                start_date.isoformat(),
+                end_date.isoformat(),
+                granularity.value if granularity else "total",
+                "category" if group_by_category else "all",
+            ),
+            serializer=list[ExpenseSummaryDTO],
+            loader=load,
+            ttl=get_settings().expenses_query_ttl_seconds,
+        )
 
     async def get_expenses_by_user_id_and_category_id(
         self, user_id: UUID, category_id: UUID
     ) -> list[ExpenseDTO]:
-        cache_key = self._user_category_expenses_cache_key(user_id, category_id)
-        cached_expenses = await self._cache_service.get(
-            key=cache_key, serializer=list[ExpenseDTO]
-        )
-        if cached_expenses:
-            logger.bind(user_id=user_id, count=len(cached_expenses)).debug(  # type: ignore
-                "Retrieved budgets from cache"
-            )
-            return cached_expenses  # type: ignore
+        async def load() -> list[ExpenseDTO]:
+            async with self._unit_of_work as uow:
+                expenses = await uow.expense_repository.get_by_user_id_and_category_id(
+                    user_id=user_id, category_id=category_id
+                )
+                logger.bind(user_id=user_id, count=len(expenses)).debug(
+                    "Retrieved expenses by user and category from repo"
+                )
+                return [self._to_dto(e) for e in expenses]
+            assert False, "unreachable"
 
-        async with self._unit_of_work as uow:
-            expenses = await uow.expense_repository.get_by_user_id_and_category_id(
-                user_id=user_id, category_id=category_id
-            )
-            dtos = [self._to_dto(e) for e in expenses]
-            await self._cache_service.set(
-                key=cache_key, value=dtos, ttl=get_settings().expenses_list_ttl_seconds
-            )
-            logger.bind(user_id=user_id, count=len(dtos)).debug(
-                "Retrieved expenses by user and category from repo and cached"
-            )
-            return dtos
-        assert False, "unreachable"
+        return await self._cache_service.get_or_load(  # type: ignore
+            key=self._user_category_expenses_cache_key(user_id, category_id),
+            serializer=list[ExpenseDTO],
+            loader=load,
+            ttl=get_settings().expenses_list_ttl_seconds,
+            tags=[self._user_expenses_cache_tag(user_id)],
+        )
 
     async def create_expense(self, expense_data: ExpenseCreateDTO) -> ExpenseDTO:
         async with self._unit_of_work as uow:
@@ -151,23 +310,73 @@ class ExpenseUseCases:
             logger.bind(expense=expense).debug("Created expense in repo")
             dto = self._to_dto(expense)
 
-            await self._cache_service.set(
-                key=self._expense_cache_key(dto.id),
-                value=dto,
-                ttl=get_settings().expense_dto_ttl_seconds,
-            )
-            # invalidate user expenses cache
-            await self._cache_service.delete(
-                key=self._user_expenses_cache_key(expense.user_id)
-            )
-            await self._cache_service.delete(
-                key=self._user_category_expenses_cache_key(
-                    expense.user_id, expense.category_id
+            async with self._cache_service.pipeline() as pipe:
+                pipe.set(
+                    key=self._expense_cache_key(dto.id),
+                    value=dto,
+                    ttl=get_settings().expense_dto_ttl_seconds,
                 )
-            )
+                # invalidate user expenses cache and spent amounts of the budgets
+                pipe.invalidate_tags(self._user_expenses_cache_tag(expense.user_id))
+                pipe.bump_version(self._user_expenses_cache_namespace(expense.user_id))
+                pipe.delete(self._user_budgets_utilisation_cache_key(expense.user_id))
             return dto
         assert False, "unreachable"
 
+    async def import_expenses(
+        self, expenses_data: list[ExpenseCreateDTO]
+    ) -> ExpenseImportResultDTO:
+        """All rows are inserted in one transaction, or none if any row is invalid"""
+        async with self._unit_of_work as uow:
+            user_categories: dict[UUID, set[UUID]] = {}
+            for user_id in {e.user_id for e in expenses_data}:
+                categories = await uow.category_repository.get_all_by_user_id(
+                    user_id=user_id
+                )
+                user_categories[user_id] = {c.id for c in categories}
+
+            errors = [
+                ExpenseImportErrorDTO(
+                    row=row, error=f"Category with id {e.category_id} not found"
+                )
+                for row, e in enumerate(expenses_data)
+                if e.category_id not in user_categories[e.user_id]
+            ]
+            if errors:
+                logger.bind(errors=len(errors)).debug("Rejected expenses import")
+                return ExpenseImportResultDTO(created=0, errors=errors)
+
+            created = await uow.expense_repository.create_many(
+                expenses=[
+                    Expense(
+                        amount=e.amount,
+                        date=e.date,
+                        user_id=e.user_id,
+                        category_id=e.category_id,
+                        description=e.description,
+                    )
+                    for e in expenses_data
+                ]
+            )
+            logger.bind(created=created).debug("Imported expenses in repo")
+
+            # one invalidation pass per affected user
+            async with self._cache_service.pipeline() as pipe:
+                pipe.invalidate_tags(
+                    *(self._user_expenses_cache_tag(u) for u in user_categories)
+                )
+                pipe.bump_version(
+                    *(self._user_expenses_cache_namespace(u) for u in user_categories)
+                )
+                pipe.delete(
+                    *(
+                        self._user_budgets_utilisation_cache_key(u)
+                        for u in user_categories
+                    )
+                )
+            return ExpenseImportResultDTO(created=created, errors=[])
+        assert False, "unreachable"
+
     async def update_expense(self, expense_data: ExpenseUpdateDTO) -> ExpenseDTO:
         async with self._unit_of_work as uow:
             expense = await uow.expense_repository.get_by_id(expense_id=expense_data.id)
@@ -190,20 +399,16 @@ class ExpenseUseCases:
             )
 
             dto = self._to_dto(updated_expense)
-            await self._cache_service.set(
-                key=self._expense_cache_key(dto.id),
-                value=dto,
-                ttl=get_settings().expense_dto_ttl_seconds,
-            )
-            # invalidate user expenses cache
-            await self._cache_service.delete(
-                key=self._user_expenses_cache_key(expense.user_id)
-            )
-            await self._cache_service.delete(
-                key=self._user_category_expenses_cache_key(
-                    expense.user_id, expense.category_id
+            async with self._cache_service.pipeline() as pipe:
+                pipe.set(
+                    key=self._expense_cache_key(dto.id),
+                    value=dto,
+                    ttl=get_settings().expense_dto_ttl_seconds,
                 )
-            )
+                # invalidate user expenses cache and spent amounts of the budgets
+                pipe.invalidate_tags(self._user_expenses_cache_tag(expense.user_id))
+                pipe.bump_version(self._user_expenses_cache_namespace(expense.user_id))
+                pipe.delete(self._user_budgets_utilisation_cache_key(expense.user_id))
             return dto
         assert False, "unreachable"
 
@@ -215,14 +420,12 @@ class ExpenseUseCases:
             await uow.expense_repository.delete(expense=expense)
             logger.bind(expense=expense).debug("Deleted expense in repo")
 
-            await self._cache_service.delete(key=self._expense_cache_key(expense_id))
-            await self._cache_service.delete(
-                key=self._user_expenses_cache_key(expense.user_id)
-            )
-            await self._cache_service.delete(
-                key=self._user_category_expenses_cache_key(
-                    expense.user_id, expense.category_id
+            async with self._cache_service.pipeline() as pipe:
+                pipe.delete(
+                    self._expense_cache_key(expense_id),
+                    self._user_budgets_utilisation_cache_key(expense.user_id),
                 )
-            )
+                pipe.invalidate_tags(self._user_expenses_cache_tag(expense.user_id))
+                pipe.bump_version(self._user_expenses_cache_namespace(expense.user_id))
             return None
         assert False, "unreachable"
@@ -3,15 +3,14 @@ from datetime import timedelta
 from uuid import uuid4
 
 import structlog
-from authlib.integrations.base_client import OAuthError
 
 from expenses_tracker.application.dto.token import TokenPairDTO
 from expenses_tracker.application.dto.user import UserCreateDTO
-from expenses_tracker.application.interfaces.password_hasher import IPasswordHasher
 from expenses_tracker.application.interfaces.token_service import ITokenService
 from expenses_tracker.core.constants import TokenType
 from expenses_tracker.core.settings import get_settings
-from expenses_tracker.domain.entities.user import User
+from expenses_tracker.domain.entities.user import UNUSABLE_PASSWORD, User
+from expenses_tracker.domain.exceptions.auth import OAuthError
 from expenses_tracker.domain.repositories.uow import IUnitOfWork
 
 logger = structlog.get_logger(__name__)
@@ -21,11 +20,9 @@ class OAuthUserUseCases:
     def __init__(
         self,
         unit_of_work: IUnitOfWork,
-        password_hasher: IPasswordHasher,
         token_service: ITokenService,
     ):
         self._unit_of_work = unit_of_work
-        self._password_hasher = password_hasher
         self._token_service = token_service
 
     def _create_tokens_for_user(self, user: User, refresh_jti: str) -> TokenPairDTO:
@@ -63,12 +60,10 @@ class OAuthUserUseCases:
                         "Username already taken, modified username for new user"
                     )
 
-                hashed_password = self._password_hasher.hash(
-                    password=user_data.password
-                )
+                # signs in through the provider only, until a password is reset
                 new_user = User(
                     username=user_data.username,
-                    hashed_password=hashed_password,
+                    hashed_password=UNUSABLE_PASSWORD,
                     email=user_data.email,
                     avatar_url=user_data.avatar_url,
                     last_refresh_jti=refresh_jti,
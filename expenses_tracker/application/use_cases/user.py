@@ -4,7 +4,10 @@ from uuid import UUID
 import structlog
 
 from expenses_tracker.application.dto.user import UserDTO, UserCreateDTO, UserUpdateDTO
-from expenses_tracker.application.interfaces.cache_service import ICacheService
+from expenses_tracker.application.interfaces.cache_service import (
+    TOMBSTONE,
+    ICacheService,
+)
 from expenses_tracker.application.interfaces.password_hasher import IPasswordHasher
 from expenses_tracker.core.settings import get_settings
 from expenses_tracker.domain.entities.user import User
@@ -57,7 +60,11 @@ class UserUseCases:
 
     async def get_user(self, user_id: UUID) -> UserDTO:
         cache_key = self._user_cache_key(user_id)
-        cached_user = await self._cache_service.get(key=cache_key, serializer=UserDTO)
+        cached_user = await self._cache_service.get_or_tombstone(
+            key=cache_key, serializer=UserDTO
+        )
+        if cached_user is TOMBSTONE:
+            raise UserNotFound(f"User with id {user_id} not found")
         if cached_user:
             logger.bind(user_id=cached_user.id).debug("Retrieved user from cache")
             return cached_user
@@ -65,6 +72,9 @@ class UserUseCases:
         async with self._unit_of_work as uow:
             user = await uow.user_repository.get_by_id(user_id=user_id)
             if not user:
+                ttl = get_settings().user_tombstone_ttl_seconds
+                if ttl:
+                    await self._cache_service.set_tombstone(key=cache_key, ttl=ttl)
                 raise UserNotFound(f"User with id {user_id} not found")
 
             user_dto = self._to_dto(user)
@@ -89,7 +99,9 @@ class UserUseCases:
             await self._validate_user_uniqueness(
                 uow=uow, new_email=user_data.email, new_username=user_data.username
             )
-            hashed_password = self._password_hasher.hash(password=user_data.password)
+            hashed_password = await self._password_hasher.hash(
+                password=user_data.password
+            )
             new_user = User(
                 username=user_data.username,
                 hashed_password=hashed_password,
@@ -120,7 +132,7 @@ class UserUseCases:
             if user_data.email_verified is not None:
                 user.email_verified = user_data.email_verified
             if user_data.password is not None:
-                user.hashed_password = self._password_hasher.hash(
+                user.hashed_password = await self._password_hasher.hash(
                     password=user_data.password
                 )
             user.updated_at = datetime.now(timezone.utc)
@@ -7,6 +7,12 @@ class BudgetPeriod(Enum):
     YEARLY = "YEARLY"
 
 
+class ExpenseGranularity(Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
 class Environment(Enum):
     TEST = "TEST"
     DEV = "DEV"
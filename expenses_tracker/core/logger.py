@@ -1,7 +1,12 @@
+import atexit
 import logging
+import queue
+import sys
+import threading
 from collections.abc import MutableMapping, Mapping
+from datetime import datetime, timezone
 from functools import lru_cache
-from typing import Any
+from typing import Any, BinaryIO, cast
 
 import orjson
 import structlog
@@ -16,10 +21,108 @@ def add_loki_labels(
     return event_dict
 
 
+class QueueLogSink:
+    """
+    structlog logger that only puts the processed event dict on a bounded
+    queue, a background thread renders it to JSON and writes lines to `file`
+    in batches of up to `batch_size`. When the queue is full the event is
+    dropped and counted, or with `block_when_full` the caller waits for room.
+    Values are rendered a moment after the call, an object mutated right
+    after being logged shows up with its new state.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO | None = None,
+        max_size: int = 10_000,
+        batch_size: int = 256,
+        block_when_full: bool = False,
+    ) -> None:
+        self._file = file or sys.stdout.buffer
+        self._queue: queue.Queue[MutableMapping[str, Any] | None] = queue.Queue(
+            maxsize=max_size
+        )
+        self._batch_size = batch_size
+        self._block_when_full = block_when_full
+        self._render = structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="log-sink", daemon=True)
+        self._thread.start()
+
+    def msg(self, **event_dict: Any) -> None:
+        try:
+            self._queue.put(event_dict, block=self._block_when_full)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    log = debug = info = warn = warning = msg
+    err = error = critical = exception = failure = fatal = msg
+
+    def _take_dropped(self) -> int:
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+
+    def _render_line(self, event_dict: MutableMapping[str, Any]) -> bytes:
+        try:
+            return cast(bytes, self._render(None, "", event_dict))
+        except Exception as e:
+            return orjson.dumps(
+                {"event": "Failed to render log event", "error": str(e)}
+            )
+
+    def _run(self) -> None:
+        closing = False
+        while not closing:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            closing = None in batch
+            lines = [self._render_line(event) for event in batch if event is not None]
+            if dropped := self._take_dropped():
+                lines.append(
+                    orjson.dumps(
+                        {
+                            "event": "Dropped log events, queue was full",
+                            "dropped": dropped,
+                            "level": "warning",
+                            "timestamp": datetime.now(timezone.utc),
+                        }
+                    )
+                )
+            if not lines:
+                continue
+            try:
+                self._file.write(b"\n".join(lines) + b"\n")
+                self._file.flush()
+            except (OSError, ValueError):
+                # stdout closed or broken, nothing left to report it to
+                pass
+
+    def close(self) -> None:
+        """Writes out what is queued, later events are not written"""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+
 @lru_cache(maxsize=1)
-def prepare_logger(log_level: str = "INFO") -> None:
+def prepare_logger(
+    log_level: str = "INFO",
+    queue_max_size: int = 10_000,
+    block_when_full: bool = False,
+) -> None:
+    sink = QueueLogSink(max_size=queue_max_size, block_when_full=block_when_full)
+    atexit.register(sink.close)
     structlog.configure(
         cache_logger_on_first_use=True,
+        # filtered levels are no-ops, their bound values are never rendered
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         processors=[
             structlog.processors.add_log_level,
@@ -27,7 +130,6 @@ def prepare_logger(log_level: str = "INFO") -> None:
             structlog.processors.TimeStamper(fmt="iso", utc=True),
             add_loki_labels,
             SentryProcessor(level=logging.WARNING),
-            structlog.processors.JSONRenderer(serializer=orjson.dumps),
         ],
-        logger_factory=structlog.BytesLoggerFactory(),
+        logger_factory=lambda *args: sink,
     )
@@ -27,8 +27,26 @@ class Settings(BaseSettings):
 
     environment: Environment = Environment.TEST
     log_level: str = "DEBUG"
+    # events waiting for the log writer thread, when it is full they are
+    # dropped unless log_queue_block_when_full makes the caller wait
+    log_queue_max_size: int = 10_000
+    log_queue_block_when_full: bool = False
     fast_api_debug: bool = False
     enable_profiling: bool = False
+    # fraction of requests profiled, the longest matching path prefix in
+    # profiling_path_sample_rates overrides it
+    profiling_sample_rate: float = 0.01
+    profiling_path_sample_rates: dict[str, float] = {}
+    # requests sending this header are always profiled
+    profiling_trigger_header: str = "x-profile"
+    # sampled requests faster than this are not stored, None keeps all of them
+    profiling_min_duration_ms: float | None = None
+    profiling_interval_seconds: float = 0.005
+    # profiles waiting to be stored, the rest are dropped
+    profiling_queue_max_size: int = 100
+    profiling_ttl_hours: int = 24
+    # most recent profiles merged by /api/profiling/aggregate
+    profiling_aggregate_max_profiles: int = 500
 
     app_host: str = "127.0.0.1"
     app_port: int = 8000
@@ -48,6 +66,12 @@ class Settings(BaseSettings):
     email_verification_token_expire_hours: int = 1
     password_reset_token_expire_hours: int = 1
     clock_skew_seconds: int = 180
+    # verified tokens remembered per worker until they expire, 0 disables it
+    token_cache_max_size: int = 10_000
+    # cost factor of new hashes, existing hashes keep the one they were made with
+    bcrypt_rounds: int = 12
+    # concurrent hash/verify calls per worker process, the rest wait in a queue
+    bcrypt_max_workers: int = 4
 
     google_client_id: str = "google-client-id"
     google_client_secret: str = "google-client-secret"
@@ -69,6 +93,24 @@ class Settings(BaseSettings):
     database_echo: bool = False
     database_pool_echo: bool = False
     pool_size: int = 50
+    max_overflow: int = 10
+    pool_timeout_seconds: float = 30
+    pool_recycle_seconds: int = 1800
+    pool_pre_ping: bool = True
+    # set both to 0 behind pgbouncer in transaction pooling mode
+    asyncpg_statement_cache_size: int = 100
+    asyncpg_prepared_statement_cache_size: int = 100
+
+    psycopg_pool_min_size: int = 1
+    psycopg_pool_max_size: int = 20
+    psycopg_pool_max_idle_seconds: float = 60 * 10
+    psycopg_pool_max_lifetime_seconds: float = 60 * 60
+    psycopg_pool_timeout_seconds: float = 30
+
+    expenses_page_max_limit: int = 500
+    expenses_stream_batch_size: int = 1000
+    expenses_import_max_rows: int = 10_000
+    expenses_import_max_bytes: int = 5 * 1024 * 1024
 
     redis_host: str = "localhost"
     redis_port: int = 6379
@@ -76,10 +118,52 @@ class Settings(BaseSettings):
     user_dto_ttl_seconds: int = 60 * 30
     budget_dto_ttl_seconds: int = 60 * 30
     budgets_list_ttl_seconds: int = 60 * 30
+    budgets_utilisation_ttl_seconds: int = 60 * 5
     expense_dto_ttl_seconds: int = 60 * 30
     expenses_list_ttl_seconds: int = 60 * 30
     category_dto_ttl_seconds: int = 60 * 30
     categories_list_ttl_seconds: int = 60 * 30
+    # not found lookups are remembered this long, None disables it
+    user_tombstone_ttl_seconds: int | None = 30
+    expense_tombstone_ttl_seconds: int | None = 30
+    budget_tombstone_ttl_seconds: int | None = 30
+    category_tombstone_ttl_seconds: int | None = 30
+    # versioned query keys are orphaned by a bump and left to expire
+    expenses_query_ttl_seconds: int = 60 * 10
+    budgets_query_ttl_seconds: int = 60 * 10
+    cache_compression_threshold_bytes: int | None = 4096
+    cache_compression_level: int = 1
+    cache_local_enabled: bool = True
+    cache_local_max_size: int = 10_000
+    # upper bound on staleness if an invalidation message is lost
+    cache_local_ttl_seconds: float = 30
+    cache_local_key_prefixes: tuple[str, ...] = (
+        "user:",
+        "expense:",
+        "category:",
+        "budget:",
+    )
+    cache_invalidation_channel: str = "cache:invalidate"
+    # higher values refresh hot keys earlier, 1.0 is the XFetch default
+    cache_early_refresh_beta: float = 1.0
+    cache_lock_ttl_seconds: float = 10
+    cache_lock_wait_seconds: float = 5
+    cache_lock_poll_seconds: float = 0.05
+    # fill the user, categories, budgets and budgets utilisation after login and
+    # refresh
+    cache_warmup_enabled: bool = True
+    cache_warmup_max_pending: int = 100
+    cache_warmup_timeout_seconds: float = 5
+    # how long a request waits for a service still initialising in the background
+    service_init_timeout_seconds: float = 10
+    # a failed initialisation is retried after this delay, doubled on every
+    # failure up to service_init_retry_max_seconds
+    service_init_retry_seconds: float = 1
+    service_init_retry_max_seconds: float = 30
+    # readiness probes of Postgres, Redis and MinIO, results are reused for
+    # health_check_cache_seconds, a failing MinIO doesn't fail readiness
+    health_check_timeout_seconds: float = 2
+    health_check_cache_seconds: float = 2
 
     minio_public_endpoint: str = "https://storage.example.com"
     minio_internal_endpoint: str = "http://minio:9000"
@@ -17,3 +17,19 @@ class Budget:
     created_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     updated_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     id: UUID = field(default_factory=uuid4)
+
+
+@dataclass
+class BudgetUtilisation:
+    budget: Budget
+    spent: float
+
+    @property
+    def remaining(self) -> float:
+        return self.budget.amount - self.spent
+
+    @property
+    def percentage(self) -> float:
+        if not self.budget.amount:
+            return 0.0
+        return round(self.spent / self.budget.amount * 100, 2)
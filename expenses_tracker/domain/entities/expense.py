@@ -14,3 +14,14 @@ class Expense:
     created_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     updated_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     id: UUID = field(default_factory=uuid4)
+
+
+@dataclass
+class ExpenseSummary:
+    total_amount: float
+    count: int
+    min_amount: float
+    max_amount: float
+    avg_amount: float
+    category_id: UUID | None = None
+    period_start: datetime | None = None
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from expenses_tracker.core.constants import TokenType
 
 
-@dataclass
+@dataclass(frozen=True)
 class TokenPayload:
     sub: str
     exp: float
@@ -3,6 +3,10 @@ from datetime import datetime, timezone
 from functools import partial
 from uuid import UUID, uuid4
 
+# stored instead of a hash for accounts created through an OAuth provider,
+# no password can match it
+UNUSABLE_PASSWORD = "!"
+
 
 @dataclass
 class User:
@@ -15,3 +19,7 @@ class User:
     created_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     updated_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     id: UUID = field(default_factory=uuid4)
+
+    @property
+    def has_usable_password(self) -> bool:
+        return not self.hashed_password.startswith(UNUSABLE_PASSWORD)
@@ -3,3 +3,7 @@ from expenses_tracker.domain.exceptions.base import DomainException
 
 class ExpenseNotFound(DomainException):
     pass
+
+
+class InvalidExpenseCursor(DomainException):
+    pass
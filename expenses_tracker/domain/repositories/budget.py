@@ -4,7 +4,7 @@ from typing import Optional
 from uuid import UUID
 
 from expenses_tracker.core.constants import BudgetPeriod
-from expenses_tracker.domain.entities.budget import Budget
+from expenses_tracker.domain.entities.budget import Budget, BudgetUtilisation
 
 
 class IBudgetRepository(ABC):
@@ -28,12 +28,6 @@ class IBudgetRepository(ABC):
     ) -> list[Budget]:
         pass
 
-    @abstractmethod
-    async def get_active_budgets_by_user_id(
-        self, user_id: UUID, current_date: datetime
-    ) -> list[Budget]:
-        pass
-
     @abstractmethod
     async def get_by_user_id_and_period(
         self, user_id: UUID, period: BudgetPeriod
@@ -57,3 +51,10 @@ class IBudgetRepository(ABC):
         self, user_id: UUID, start_date: datetime, end_date: datetime
     ) -> float:
         pass
+
+    @abstractmethod
+    async def get_utilisation_by_user_id(
+        self, user_id: UUID, current_date: datetime
+    ) -> list[BudgetUtilisation]:
+        """active budgets with expenses summed over their category and date range"""
+        pass
@@ -1,8 +1,20 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from uuid import UUID
 
-from expenses_tracker.domain.entities.expense import Expense
+from expenses_tracker.core.constants import ExpenseGranularity
+from expenses_tracker.domain.entities.expense import Expense, ExpenseSummary
+
+EXPENSE_CSV_COLUMNS = (
+    "id",
+    "amount",
+    "date",
+    "category_id",
+    "description",
+    "created_at",
+    "updated_at",
+)
 
 
 class IExpenseRepository(ABC):
@@ -14,6 +26,27 @@ class IExpenseRepository(ABC):
     async def get_all_by_user_id(self, user_id: UUID) -> list[Expense]:
         pass
 
+    @abstractmethod
+    async def get_page_by_user_id(
+        self, user_id: UUID, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> list[Expense]:
+        """keyset page ordered by (date, id) descending, starting after given key"""
+        pass
+
+    @abstractmethod
+    def stream_by_user_id(
+        self, user_id: UUID, batch_size: int = 1000
+    ) -> AsyncIterator[Expense]:
+        """server-side cursor ordered by (date, id) descending"""
+        pass
+
+    @abstractmethod
+    def export_csv_by_user_id(
+        self, user_id: UUID, batch_size: int = 1000
+    ) -> AsyncIterator[bytes]:
+        """CSV chunks with EXPENSE_CSV_COLUMNS header, ordered by (date, id) descending"""
+        pass
+
     @abstractmethod
     async def get_by_user_id_and_date_range(
         self, user_id: UUID, start_date: datetime, end_date: datetime
@@ -26,10 +59,27 @@ class IExpenseRepository(ABC):
     ) -> list[Expense]:
         pass
 
+    @abstractmethod
+    async def get_summary_by_user_id(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: ExpenseGranularity | None = None,
+        group_by_category: bool = True,
+    ) -> list[ExpenseSummary]:
+        """buckets ordered by (period_start, category_id), ungrouped keys are None"""
+        pass
+
     @abstractmethod
     async def create(self, expense: Expense) -> Expense:
         pass
 
+    @abstractmethod
+    async def create_many(self, expenses: list[Expense]) -> int:
+        """bulk insert in the current transaction, returns inserted rows count"""
+        pass
+
     @abstractmethod
     async def update(self, expense: Expense) -> Expense:
         pass
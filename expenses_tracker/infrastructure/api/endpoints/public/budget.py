@@ -15,6 +15,7 @@ from expenses_tracker.infrastructure.api.schemas.budget import (
     BudgetResponse,
     BudgetUpdateRequest,
     BudgetCreateRequest,
+    BudgetUtilisationResponse,
 )
 from expenses_tracker.infrastructure.di import get_budget_use_cases
 
@@ -46,6 +47,17 @@ async def get_budgets_by_user(
     return [BudgetResponse(**dto.__dict__) for dto in budget_dtos]
 
 
+@router.get("/utilisation")
+async def get_budgets_utilisation(
+    user_id: UUID = Depends(get_current_user_id),
+    budget_use_cases: BudgetUseCases = Depends(get_budget_use_cases),
+) -> list[BudgetUtilisationResponse]:
+    logger.bind(user_id=user_id).debug("Getting budgets utilisation for user...")
+    utilisation_dtos = await budget_use_cases.get_budgets_utilisation(user_id=user_id)
+    logger.bind(utilisation=utilisation_dtos).debug("Got budgets utilisation")
+    return [BudgetUtilisationResponse(**dto.__dict__) for dto in utilisation_dtos]
+
+
 @router.get("/get-by-user-date-range")
 async def get_budgets_by_user_and_date_range(
     start_date: datetime,
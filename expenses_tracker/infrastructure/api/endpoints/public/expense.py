@@ -1,8 +1,25 @@
+import csv
+import io
+import itertools
+import zlib
+from collections.abc import AsyncIterator
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from pydantic import ValidationError
+from starlette.responses import StreamingResponse
 
 from expenses_tracker.application.dto.expense import ExpenseCreateDTO, ExpenseUpdateDTO
 from expenses_tracker.application.use_cases.expense import ExpenseUseCases
@@ -11,7 +28,13 @@ from expenses_tracker.infrastructure.api.schemas.expense import (
     ExpenseResponse,
     ExpenseCreateRequest,
     ExpenseUpdateRequest,
+    ExpensePageResponse,
+    ExpenseSummaryResponse,
+    ExpenseImportResponse,
+    ExpenseImportRowError,
 )
+from expenses_tracker.core.constants import ExpenseGranularity
+from expenses_tracker.core.settings import get_settings
 from expenses_tracker.infrastructure.di import get_expense_use_cases
 
 router = APIRouter(prefix="/expenses", tags=["expenses"])
@@ -42,6 +65,78 @@ async def get_expenses_by_user(
     return [ExpenseResponse(**dto.__dict__) for dto in expense_dtos]
 
 
+@router.get("/get-by-user-paginated")
+async def get_expenses_by_user_paginated(
+    limit: int = Query(50, ge=1, le=get_settings().expenses_page_max_limit),
+    cursor: str | None = Query(None, description="Opaque cursor from previous page"),
+    user_id: UUID = Depends(get_current_user_id),
+    expense_use_cases: ExpenseUseCases = Depends(get_expense_use_cases),
+) -> ExpensePageResponse:
+    logger.bind(user_id=user_id, limit=limit, cursor=cursor).debug(
+        "Getting expenses page for user..."
+    )
+    page = await expense_use_cases.get_expenses_page_by_user_id(
+        user_id=user_id, limit=limit, cursor=cursor
+    )
+    logger.bind(count=len(page.items), next_cursor=page.next_cursor).debug(
+        "Got expenses page"
+    )
+    return ExpensePageResponse(
+        items=[ExpenseResponse(**dto.__dict__) for dto in page.items],
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.get("/stream-by-user", response_class=StreamingResponse)
+async def stream_expenses_by_user(
+    user_id: UUID = Depends(get_current_user_id),
+    expense_use_cases: ExpenseUseCases = Depends(get_expense_use_cases),
+) -> StreamingResponse:
+    logger.bind(user_id=user_id).debug("Streaming expenses for user...")
+
+    async def ndjson_lines(chunk_size: int = 100) -> AsyncIterator[bytes]:
+        chunk: list[bytes] = []
+        async for dto in expense_use_cases.stream_expenses_by_user_id(user_id=user_id):
+            chunk.append(ExpenseResponse(**dto.__dict__).model_dump_json().encode())
+            if len(chunk) >= chunk_size:
+                yield b"\n".join(chunk) + b"\n"
+                chunk.clear()
+        if chunk:
+            yield b"\n".join(chunk) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+async def _gzip_chunks(
+    chunks: AsyncIterator[bytes], min_chunk_size: int = 64 * 1024
+) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += compressor.compress(chunk)
+        if len(buffer) >= min_chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += compressor.flush()
+    yield bytes(buffer)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_expenses(
+    gzip: bool = Query(False, description="Compress the CSV with gzip"),
+    user_id: UUID = Depends(get_current_user_id),
+    expense_use_cases: ExpenseUseCases = Depends(get_expense_use_cases),
+) -> StreamingResponse:
+    logger.bind(user_id=user_id, gzip=gzip).debug("Exporting expenses for user...")
+    chunks = expense_use_cases.export_expenses_csv(user_id=user_id)
+    filename = "expenses.csv.gz" if gzip else "expenses.csv"
+    return StreamingResponse(
+        _gzip_chunks(chunks) if gzip else chunks,
+        media_type="application/gzip" if gzip else "text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/get-by-date-range")
 async def get_expenses_by_date_range(
     start_date: datetime,
@@ -59,6 +154,33 @@ async def get_expenses_by_date_range(
     return [ExpenseResponse(**dto.__dict__) for dto in expense_dtos]
 
 
+@router.get("/summary")
+async def get_expenses_summary(
+    start_date: datetime,
+    end_date: datetime,
+    granularity: ExpenseGranularity | None = None,
+    group_by_category: bool = True,
+    user_id: UUID = Depends(get_current_user_id),
+    expense_use_cases: ExpenseUseCases = Depends(get_expense_use_cases),
+) -> list[ExpenseSummaryResponse]:
+    logger.bind(
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
+        granularity=granularity,
+        group_by_category=group_by_category,
+    ).debug("Getting expenses summary...")
+    summary_dtos = await expense_use_cases.get_expenses_summary(
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
+        granularity=granularity,
+        group_by_category=group_by_category,
+    )
+    logger.bind(buckets=len(summary_dtos)).debug("Got expenses summary")
+    return [ExpenseSummaryResponse(**dto.__dict__) for dto in summary_dtos]
+
+
 @router.get("/get-by-category/{category_id}")
 async def get_expenses_by_category(
     category_id: UUID,
@@ -94,6 +216,154 @@ async def create_expense(
     return ExpenseResponse(**expense_dto.__dict__)
 
 
+def _parse_import_rows(
+    rows: list[dict[str, Any]], user_id: UUID
+) -> tuple[list[ExpenseCreateDTO], list[ExpenseImportRowError]]:
+    max_rows = get_settings().expenses_import_max_rows
+    if len(rows) > max_rows:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Import is limited to {max_rows} rows",
+        )
+    create_dtos, errors = [], []
+    for row, raw in enumerate(rows):
+        try:
+            expense_data = ExpenseCreateRequest.model_validate(raw)
+        except ValidationError as e:
+            message = "; ".join(
+                f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()
+            )
+            errors.append(ExpenseImportRowError(row=row, error=message))
+            continue
+        create_dtos.append(ExpenseCreateDTO(user_id=user_id, **expense_data.__dict__))
+    return create_dtos, errors
+
+
+async def _import_expenses(
+    rows: list[dict[str, Any]],
+    user_id: UUID,
+    expense_use_cases: ExpenseUseCases,
+    response: Response,
+) -> ExpenseImportResponse:
+    create_dtos, errors = _parse_import_rows(rows=rows, user_id=user_id)
+    if not errors:
+        result = await expense_use_cases.import_expenses(expenses_data=create_dtos)
+        errors = [ExpenseImportRowError(**e.__dict__) for e in result.errors]
+    if errors:
+        logger.bind(errors=len(errors)).debug("Expenses import rejected")
+        response.status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+        return ExpenseImportResponse(created=0, errors=errors)
+    logger.bind(created=result.created).debug("Imported expenses")
+    return ExpenseImportResponse(created=result.created, errors=[])
+
+
+async def _read_body(request: Request) -> bytes:
+    """
+    Reads the body while it streams in, so an oversized import is rejected
+    before it is read in full
+    """
+    max_bytes = get_settings().expenses_import_max_bytes
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Import is limited to {max_bytes} bytes",
+    )
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+    body, size = bytearray(), 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise too_large
+        body += chunk
+    return bytes(body)
+
+
+@router.post(
+    "/import",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"type": "object"}}
+                }
+            },
+        }
+    },
+)
+async def import_expenses(
+    request: Request,
+    response: Response,
+    user_id: UUID = Depends(get_current_user_id),
+    expense_use_cases: ExpenseUseCases = Depends(get_expense_use_cases),
+) -> ExpenseImportResponse:
+    """JSON list of expenses, the same fields as `/create`"""
+    try:
+        rows = orjson.loads(await _read_body(request))
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Malformed JSON: {e}"
+        )
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Import must be a JSON list of objects",
+        )
+    logger.bind(user_id=user_id, rows=len(rows)).debug("Importing expenses...")
+    return await _import_expenses(
+        rows=rows,
+        user_id=user_id,
+        expense_use_cases=expense_use_cases,
+        response=response,
+    )
+
+
+@router.post(
+    "/import-csv",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"text/csv": {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def import_expenses_csv(
+    request: Request,
+    response: Response,
+    user_id: UUID = Depends(get_current_user_id),
+    expense_use_cases: ExpenseUseCases = Depends(get_expense_use_cases),
+) -> ExpenseImportResponse:
+    """CSV with header `amount,date,category_id,description`, description optional"""
+    try:
+        body = (await _read_body(request)).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="CSV must be UTF-8 encoded",
+        )
+    # one row over the limit is enough for _parse_import_rows to reject it
+    reader = itertools.islice(
+        csv.DictReader(io.StringIO(body)), get_settings().expenses_import_max_rows + 1
+    )
+    try:
+        rows = [
+            {key: value or None for key, value in row.items() if key is not None}
+            for row in reader
+        ]
+    except csv.Error as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Malformed CSV: {e}"
+        )
+    logger.bind(user_id=user_id, rows=len(rows)).debug("Importing expenses from CSV...")
+    return await _import_expenses(
+        rows=rows,
+        user_id=user_id,
+        expense_use_cases=expense_use_cases,
+        response=response,
+    )
+
+
 @router.put("/update")
 async def update_expense(
     expense_data: ExpenseUpdateRequest,
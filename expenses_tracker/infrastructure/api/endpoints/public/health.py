@@ -1,11 +1,35 @@
+from dataclasses import asdict
+
 import structlog
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 
 router = APIRouter(tags=["status"])
 logger = structlog.getLogger(__name__)
 
 
 @router.get("/health", summary="Health check")
+@router.get("/health/live", summary="Liveness check")
 async def health() -> dict[str, str]:
     logger.debug("Health check")
     return {"status": "OK"}
+
+
+@router.get("/health/ready", summary="Readiness check")
+@router.get("/ready", summary="Readiness check")
+async def ready(request: Request) -> JSONResponse:
+    report = await request.app.state.health_checker.check()
+    # only Postgres and Redis gate readiness, the services initialised in the
+    # background are reported and retried by the tracker
+    is_ready = report.healthy
+    logger.bind(ready=is_ready).debug("Readiness check")
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={
+            "status": "OK" if is_ready else "NOT_READY",
+            "checked_at": report.checked_at.isoformat(),
+            "checks": {name: asdict(result) for name, result in report.checks.items()},
+            "pools": report.pools,
+            "services": request.app.state.readiness.status(),
+        },
+    )
@@ -1,5 +1,4 @@
 import structlog
-from authlib.integrations.base_client import OAuthError
 from fastapi import (
     APIRouter,
     Request,
@@ -10,9 +9,10 @@ from starlette.responses import RedirectResponse
 from expenses_tracker.application.dto.user import UserCreateDTO
 from expenses_tracker.application.use_cases.oauth import OAuthUserUseCases
 from expenses_tracker.core.settings import get_settings
+from expenses_tracker.domain.exceptions.auth import OAuthError
 from expenses_tracker.infrastructure.api.dependencies.auth import oauth_response
 from expenses_tracker.infrastructure.di import get_oauth_user_use_cases
-from expenses_tracker.infrastructure.security.oauth_providers import oauth
+from expenses_tracker.infrastructure.security.oauth_providers import get_oauth
 
 router = APIRouter(prefix="/oauth", tags=["oauth"])
 
@@ -22,6 +22,7 @@ logger = structlog.get_logger(__name__)
 @router.get("/login-google")
 async def login_via_google(request: Request) -> RedirectResponse:
     logger.debug("Logging in via Google")
+    oauth = get_oauth()
     redirect_uri = f"https://{get_settings().domain}/api/oauth/auth-via-google"
     result = await oauth.google.authorize_redirect(request, redirect_uri)
     logger.debug("Logged in via Google")
@@ -34,6 +35,10 @@ async def auth_via_google(
     oauth_use_cases: OAuthUserUseCases = Depends(get_oauth_user_use_cases),
 ) -> RedirectResponse:
     logger.debug("Authorizing via Google")
+    oauth = get_oauth()
+    # loaded by get_oauth, authlib is not imported before the first OAuth request
+    from authlib.integrations.base_client import OAuthError as ProviderOAuthError
+
     try:
         user_info = (await oauth.google.authorize_access_token(request)).get("userinfo")
         create_user_dto = UserCreateDTO(
@@ -47,7 +52,7 @@ async def auth_via_google(
         return oauth_response(
             access_token=token_pair.access_token, refresh_token=token_pair.refresh_token
         )
-    except OAuthError as e:
+    except (OAuthError, ProviderOAuthError) as e:
         logger.bind(e=e).warning("OAuth error")
         return oauth_response(error_message="oauth_cancelled")
     except Exception as e:
@@ -58,6 +63,7 @@ async def auth_via_google(
 @router.get("/login-github")
 async def login_via_github(request: Request) -> RedirectResponse:
     logger.debug("Logging in via GitHub")
+    oauth = get_oauth()
     redirect_uri = f"https://{get_settings().domain}/api/oauth/auth-via-github"
     result = await oauth.github.authorize_redirect(request, redirect_uri)
     logger.debug("Redirected to GitHub OAuth")
@@ -70,6 +76,10 @@ async def auth_via_github(
     oauth_use_cases: OAuthUserUseCases = Depends(get_oauth_user_use_cases),
 ) -> RedirectResponse:
     logger.debug("Authorizing via GitHub")
+    oauth = get_oauth()
+    # loaded by get_oauth, authlib is not imported before the first OAuth request
+    from authlib.integrations.base_client import OAuthError as ProviderOAuthError
+
     try:
         token = await oauth.github.authorize_access_token(request)
         user_info = (await oauth.github.get("user", token=token)).json()
@@ -91,7 +101,7 @@ async def auth_via_github(
         return oauth_response(
             access_token=token_pair.access_token, refresh_token=token_pair.refresh_token
         )
-    except OAuthError as e:
+    except (OAuthError, ProviderOAuthError) as e:
         logger.bind(e=e).warning("OAuth error with GitHub")
         return oauth_response(error_message="oauth_cancelled")
     except Exception as e:
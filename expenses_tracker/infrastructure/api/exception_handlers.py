@@ -14,17 +14,22 @@ from expenses_tracker.domain.exceptions.auth import (
 )
 from expenses_tracker.domain.exceptions.budget import BudgetNotFound
 from expenses_tracker.domain.exceptions.category import CategoryNotFound
-from expenses_tracker.domain.exceptions.expense import ExpenseNotFound
+from expenses_tracker.domain.exceptions.expense import (
+    ExpenseNotFound,
+    InvalidExpenseCursor,
+)
 from expenses_tracker.domain.exceptions.user import (
     UserAlreadyExists,
     UserNotFound,
 )
+from expenses_tracker.infrastructure.monitoring.readiness import ServiceNotReady
 
 EXCEPTION_STATUS_MAP: dict[type[Exception], int] = {
     UserAlreadyExists: status.HTTP_400_BAD_REQUEST,
     UserNotFound: status.HTTP_404_NOT_FOUND,
     CategoryNotFound: status.HTTP_404_NOT_FOUND,
     ExpenseNotFound: status.HTTP_404_NOT_FOUND,
+    InvalidExpenseCursor: status.HTTP_400_BAD_REQUEST,
     BudgetNotFound: status.HTTP_404_NOT_FOUND,
     EmailAlreadyVerified: status.HTTP_400_BAD_REQUEST,
     EmailSendingError: status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -34,6 +39,7 @@ EXCEPTION_STATUS_MAP: dict[type[Exception], int] = {
     InvalidToken: status.HTTP_401_UNAUTHORIZED,
     OAuthError: status.HTTP_400_BAD_REQUEST,
     RateLimitExceeded: status.HTTP_429_TOO_MANY_REQUESTS,
+    ServiceNotReady: status.HTTP_503_SERVICE_UNAVAILABLE,
 }
 
 
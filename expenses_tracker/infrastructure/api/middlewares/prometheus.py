@@ -1,39 +1,94 @@
 import time
-from typing import Callable, Awaitable
 
 from fastapi import Response, FastAPI
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from expenses_tracker.infrastructure.monitoring.metrics import (
     REQUEST_COUNT,
     REQUEST_LATENCY,
+    REQUEST_SIZE,
+    REQUESTS_IN_PROGRESS,
+    RESPONSE_SIZE,
 )
 
+# label of requests no route matched, raw paths would be unbounded
+UNMATCHED_ENDPOINT = "<unmatched>"
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        start_time = time.time()
-        response: Response = await call_next(request)
 
-        process_time = time.time() - start_time
-        endpoint = request.url.path
+def route_template(scope: Scope) -> str:
+    """Path template of the route the router matched, set in the shared scope"""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else UNMATCHED_ENDPOINT
 
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=endpoint,
-            http_status=response.status_code,
-        ).inc()
 
-        REQUEST_LATENCY.labels(
-            method=request.method,
-            endpoint=endpoint,
-        ).observe(process_time)
+class PrometheusMiddleware:
+    """
+    Plain ASGI middleware, the response is passed through message by message
+    so streaming responses are not buffered. Requests are labelled by route
+    template rather than by path to keep the amount of time series bounded.
+    """
 
-        return response
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        # stays 500 if the app raises before starting a response
+        status_code = 500
+        request_size = 0
+        response_size = 0
+        # handlers that never read the body leave only the declared length
+        content_length = next(
+            (value for name, value in scope["headers"] if name == b"content-length"),
+            b"0",
+        )
+        declared_size = int(content_length) if content_length.isdigit() else 0
+
+        async def receive_wrapper() -> Message:
+            nonlocal request_size
+            message = await receive()
+            if message["type"] == "http.request":
+                request_size += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            process_time = time.perf_counter() - start_time
+            in_progress.dec()
+            endpoint = route_template(scope)
+
+            REQUEST_COUNT.labels(
+                method=method,
+                endpoint=endpoint,
+                http_status=status_code,
+            ).inc()
+            REQUEST_LATENCY.labels(method=method, endpoint=endpoint).observe(
+                process_time
+            )
+            REQUEST_SIZE.labels(method=method, endpoint=endpoint).observe(
+                max(request_size, declared_size)
+            )
+            RESPONSE_SIZE.labels(method=method, endpoint=endpoint).observe(
+                response_size
+            )
 
 
 def setup_metrics_route(app: FastAPI) -> None:
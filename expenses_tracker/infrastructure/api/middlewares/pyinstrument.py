@@ -1,122 +1,221 @@
-from typing import Any
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Literal
 from uuid import uuid4
 
 import structlog
-from fastapi import Request, Response, FastAPI, HTTPException, Depends
+from fastapi import Response, FastAPI, HTTPException, Depends, Query
 from pyinstrument import Profiler
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import HTMLResponse
-from starlette.types import ASGIApp
+from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+from pyinstrument.session import Session
+from starlette.datastructures import MutableHeaders
+from starlette.responses import HTMLResponse, PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from expenses_tracker.application.interfaces.cache_service import ICacheService
+from expenses_tracker.core.settings import get_settings
+from expenses_tracker.infrastructure.api.middlewares.prometheus import route_template
 from expenses_tracker.infrastructure.di import get_cache_service
+from expenses_tracker.infrastructure.monitoring.metrics import PROFILES
+from expenses_tracker.infrastructure.monitoring.profiling import (
+    ProfileRecord,
+    RedisProfilingStorage,
+    collapse_stacks,
+    combine_sessions,
+)
 
 logger = structlog.getLogger(__name__)
 
 
-class RedisProfilingStorage:
-    def __init__(self, cache_service: ICacheService[str], ttl_hours: int = 24) -> None:
-        self.ttl_seconds = ttl_hours * 3600
-        self.cache_service = cache_service
-
-    @staticmethod
-    def _profile_cache_key(profile_id: str) -> str:
-        return f"profile:{profile_id}"
-
-    async def add_profile(self, profile_id: str, html_content: str) -> None:
-        await self.cache_service.set(
-            key=self._profile_cache_key(profile_id),
-            value=html_content,
-            ttl=self.ttl_seconds,
-        )
-        logger.bind(profile_id=profile_id).debug("Added profile to Redis")
-
-    async def get_profile(self, profile_id: str) -> str | None:
-        return await self.cache_service.get(
-            key=self._profile_cache_key(profile_id), serializer=str
-        )
-
-    async def delete_profile(self, profile_id: str) -> None:
-        await self.cache_service.delete(key=self._profile_cache_key(profile_id))
-
-    async def get_stats(self) -> dict[str, int | list[str]]:
-        keys = await self.cache_service.get_keys_by_pattern("profile:*")
-        return {
-            "keys": [key.split("profile:")[1] for key in keys],
-            "total_profiles": len(keys),
-            "ttl_hours": self.ttl_seconds // 3600,
-        }
-
-    async def clear_all_profiles(self) -> None:
-        await self.cache_service.delete_keys_by_pattern(pattern="profile:*")
-        return None
-
-
 def get_profiling_storage(
     cache_service: ICacheService[Any] = Depends(get_cache_service),
 ) -> RedisProfilingStorage:
     return RedisProfilingStorage(cache_service=cache_service)
 
 
-class PyInstrumentMiddleware(BaseHTTPMiddleware):
+class PyInstrumentMiddleware:
+    """
+    Profiles a sample of the requests, `sample_rate` of them or the rate of
+    the longest matching prefix in `path_sample_rates`, and every request that
+    sends `trigger_header`. Sampled requests faster than `min_duration_ms`
+    are discarded. The session is handed to `app.state.profile_recorder`,
+    serialising and storing it happens off the request path.
+    """
+
     def __init__(
         self,
         app: ASGIApp,
         excluded_paths: list[str] | None = None,
+        sample_rate: float | None = None,
+        path_sample_rates: dict[str, float] | None = None,
+        trigger_header: str | None = None,
+        min_duration_ms: float | None = None,
+        interval_seconds: float | None = None,
     ):
-        super().__init__(app)
-        self.excluded_paths = excluded_paths or [
-            "/api/internal/static",
-            "/api/health",
-            "/api/profiling",
-            "/api/metrics",
-            "/api/internal/docs",
-            "/api/internal/openapi.json",
-        ]
-
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        if not self._should_profile(request):
-            return await call_next(request)
-
-        profiler = Profiler(interval=0.001, async_mode="enabled")
+        settings = get_settings()
+        self.app = app
+        self.excluded_paths = tuple(
+            excluded_paths
+            or [
+                "/api/internal/static",
+                "/api/health",
+                "/api/ready",
+                "/api/profiling",
+                "/api/metrics",
+                "/api/internal/docs",
+                "/api/internal/openapi.json",
+            ]
+        )
+        self.sample_rate = (
+            settings.profiling_sample_rate if sample_rate is None else sample_rate
+        )
+        # longest prefix first, the first match wins
+        self.path_sample_rates = sorted(
+            (
+                path_sample_rates
+                if path_sample_rates is not None
+                else settings.profiling_path_sample_rates
+            ).items(),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self.trigger_header = (
+            (trigger_header or settings.profiling_trigger_header)
+            .lower()
+            .encode("latin-1")
+        )
+        min_duration_ms = (
+            settings.profiling_min_duration_ms
+            if min_duration_ms is None
+            else min_duration_ms
+        )
+        self.min_duration_seconds = (
+            None if min_duration_ms is None else min_duration_ms / 1000
+        )
+        self.interval_seconds = interval_seconds or settings.profiling_interval_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        recorder = getattr(scope["app"].state, "profile_recorder", None)
+        triggered = any(name == self.trigger_header for name, _ in scope["headers"])
+        if recorder is None or not (triggered or self._should_profile(scope["path"])):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = str(uuid4())
+        # the duration is not known yet when the headers go out, an id is only
+        # promised if the profile can't be discarded as too fast
+        announce_id = triggered or self.min_duration_seconds is None
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if announce_id:
+                    MutableHeaders(scope=message).append("X-Profiling-ID", profile_id)
+            await send(message)
+
+        started_at = datetime.now(timezone.utc)
+        profiler = Profiler(interval=self.interval_seconds, async_mode="enabled")
         profiler.start()
-        response = await call_next(request)
-        profiler.stop()
-
         try:
-            html_content = profiler.output_html()
-            profile_id = str(uuid4())
-            cache_service = request.app.state.cache_service
-            storage = RedisProfilingStorage(cache_service=cache_service)
-            await storage.add_profile(profile_id, html_content)
-            response.headers["X-Profiling-ID"] = profile_id
-            logger.bind(profile_id=profile_id, url_path=request.url.path).info(
-                "Profiled request completed"
-            )
-        except Exception as e:
-            logger.error(f"Failed to save profile: {e}")
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            session = profiler.stop()
+            if (
+                not triggered
+                and self.min_duration_seconds is not None
+                and session.duration < self.min_duration_seconds
+            ):
+                PROFILES.labels(result="discarded").inc()
+            else:
+                record = ProfileRecord(
+                    id=profile_id,
+                    method=scope["method"],
+                    path=scope["path"],
+                    route=route_template(scope),
+                    status_code=status_code,
+                    started_at=started_at,
+                    duration_seconds=session.duration,
+                    session={},
+                )
+                recorder.submit(record, session)
+
+    def _should_profile(self, path: str) -> bool:
+        if path.startswith(self.excluded_paths):
+            return False
+        rate = next(
+            (
+                rate
+                for prefix, rate in self.path_sample_rates
+                if path.startswith(prefix)
+            ),
+            self.sample_rate,
+        )
+        return random.random() < rate
+
+
+def _render(record: ProfileRecord, output_format: str) -> str:
+    session = Session.from_json(record.session)
+    if output_format == "speedscope":
+        return SpeedscopeRenderer().render(session)  # type: ignore[no-any-return]
+    return HTMLRenderer().render(session)  # type: ignore[no-any-return]
 
-        return response
 
-    def _should_profile(self, request: Request) -> bool:
-        path = request.url.path
-        for excluded in self.excluded_paths:
-            if path.startswith(excluded):
-                return False
-        return True
+def _render_aggregate(records: list[ProfileRecord], output_format: str) -> str:
+    if output_format == "collapsed":
+        return collapse_stacks(records)
+    session = combine_sessions(records)
+    if output_format == "speedscope":
+        return SpeedscopeRenderer().render(session)  # type: ignore[no-any-return]
+    return HTMLRenderer().render(session)  # type: ignore[no-any-return]
 
 
 def setup_pyinstrument_routes(app: FastAPI) -> None:
+    # registered before /api/profiling/{profile_id}, it would match "aggregate"
+    @app.get("/api/profiling/aggregate")
+    async def get_aggregated_profile(
+        route: list[str] | None = Query(default=None),
+        route_prefix: str | None = None,
+        window_minutes: int = Query(default=60, gt=0),
+        output_format: Literal["collapsed", "html", "speedscope"] = "collapsed",
+        storage: RedisProfilingStorage = Depends(get_profiling_storage),
+    ) -> Response:
+        records = await storage.get_profiles(
+            since=datetime.now(timezone.utc) - timedelta(minutes=window_minutes),
+            routes=route,
+            route_prefix=route_prefix,
+        )
+        if not records:
+            raise HTTPException(status_code=404, detail="No profiles in the window")
+        content = await asyncio.to_thread(_render_aggregate, records, output_format)
+        headers = {"X-Profiles-Aggregated": str(len(records))}
+        if output_format == "html":
+            return HTMLResponse(content=content, headers=headers)
+        if output_format == "speedscope":
+            return Response(
+                content=content, media_type="application/json", headers=headers
+            )
+        return PlainTextResponse(content=content, headers=headers)
+
     @app.get("/api/profiling/{profile_id}", response_class=HTMLResponse)
     async def get_profile(
-        profile_id: str, storage: RedisProfilingStorage = Depends(get_profiling_storage)
-    ) -> HTMLResponse:
-        html = await storage.get_profile(profile_id)
-        if html is None:
+        profile_id: str,
+        output_format: Literal["html", "speedscope"] = "html",
+        storage: RedisProfilingStorage = Depends(get_profiling_storage),
+    ) -> Response:
+        record = await storage.get_profile(profile_id)
+        if record is None:
             raise HTTPException(status_code=404, detail="Profile not found or expired")
-        return HTMLResponse(content=html)
+        content = await asyncio.to_thread(_render, record, output_format)
+        if output_format == "speedscope":
+            return Response(content=content, media_type="application/json")
+        return HTMLResponse(content=content)
 
     @app.get("/api/profiling")
     async def get_profiling_stats(
@@ -18,6 +18,18 @@ class BudgetResponse(BaseModel):
     updated_at: datetime
 
 
+class BudgetUtilisationResponse(BaseModel):
+    budget_id: UUID
+    category_id: UUID
+    period: BudgetPeriod
+    start_date: datetime
+    end_date: datetime
+    amount: float
+    spent: float
+    remaining: float
+    percentage: float
+
+
 class BudgetCreateRequest(BaseModel):
     amount: float
     period: BudgetPeriod
@@ -41,6 +41,21 @@ class ExpenseResponse(BaseModel):
     updated_at: datetime
 
 
+class ExpensePageResponse(BaseModel):
+    items: list[ExpenseResponse]
+    next_cursor: str | None
+
+
+class ExpenseSummaryResponse(BaseModel):
+    category_id: UUID | None
+    period_start: datetime | None
+    total_amount: float
+    count: int
+    min_amount: float
+    max_amount: float
+    avg_amount: float
+
+
 class ExpenseCreateRequest(BaseModel):
     amount: float
     date: datetime
@@ -48,6 +63,16 @@ class ExpenseCreateRequest(BaseModel):
     description: str | None = None
 
 
+class ExpenseImportRowError(BaseModel):
+    row: int
+    error: str
+
+
+class ExpenseImportResponse(BaseModel):
+    created: int
+    errors: list[ExpenseImportRowError]
+
+
 class ExpenseUpdateRequest(BaseModel):
     id: UUID
     amount: float | None = None
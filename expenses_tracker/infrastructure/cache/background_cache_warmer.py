@@ -0,0 +1,94 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+import structlog
+
+from expenses_tracker.application.interfaces.cache_service import ICacheService
+from expenses_tracker.application.interfaces.cache_warmer import ICacheWarmer
+from expenses_tracker.application.interfaces.password_hasher import IPasswordHasher
+from expenses_tracker.application.use_cases.budget import BudgetUseCases
+from expenses_tracker.application.use_cases.category import CategoryUseCases
+from expenses_tracker.application.use_cases.user import UserUseCases
+from expenses_tracker.core.settings import get_settings
+from expenses_tracker.domain.repositories.uow import IUnitOfWork
+from expenses_tracker.infrastructure.monitoring.metrics import CACHE_WARMUPS
+
+logger = structlog.get_logger(__name__)
+
+
+class BackgroundCacheWarmer(ICacheWarmer):
+    """
+    Reads the user, the category list, the budget list that active budgets
+    are served from and the budgets utilisation through their use cases, so
+    the requests that follow a login hit the cache. At most `max_pending` warmups run at once, a user already
+    being warmed is skipped and anything over the limit is dropped.
+    """
+
+    def __init__(
+        self,
+        unit_of_work_factory: Callable[[], IUnitOfWork],
+        cache_service: ICacheService[Any],
+        password_hasher: IPasswordHasher,
+        max_pending: int | None = None,
+        timeout_seconds: float | None = None,
+    ) -> None:
+        settings = get_settings()
+        self._unit_of_work_factory = unit_of_work_factory
+        self._cache_service = cache_service
+        self._password_hasher = password_hasher
+        self._max_pending = max_pending or settings.cache_warmup_max_pending
+        self._timeout_seconds = timeout_seconds or settings.cache_warmup_timeout_seconds
+        self._pending: dict[UUID, asyncio.Task[None]] = {}
+
+    def schedule(self, user_id: UUID) -> None:
+        if user_id in self._pending:
+            CACHE_WARMUPS.labels(result="skipped").inc()
+            return
+        if len(self._pending) >= self._max_pending:
+            CACHE_WARMUPS.labels(result="dropped").inc()
+            logger.bind(user_id=user_id).debug("Cache warmup dropped")
+            return
+        task = asyncio.create_task(self._warm(user_id))
+        self._pending[user_id] = task
+        task.add_done_callback(lambda _: self._pending.pop(user_id, None))
+
+    async def _warm(self, user_id: UUID) -> None:
+        # each use case gets its own unit of work, they run concurrently
+        user_use_cases = UserUseCases(
+            unit_of_work=self._unit_of_work_factory(),
+            password_hasher=self._password_hasher,
+            cache_service=self._cache_service,
+        )
+        category_use_cases = CategoryUseCases(
+            unit_of_work=self._unit_of_work_factory(),
+            cache_service=self._cache_service,
+        )
+        budget_use_cases = BudgetUseCases(
+            unit_of_work=self._unit_of_work_factory(),
+            cache_service=self._cache_service,
+        )
+        utilisation_use_cases = BudgetUseCases(
+            unit_of_work=self._unit_of_work_factory(),
+            cache_service=self._cache_service,
+        )
+        try:
+            async with asyncio.timeout(self._timeout_seconds):
+                await asyncio.gather(
+                    user_use_cases.get_user(user_id=user_id),
+                    category_use_cases.get_categories_by_user_id(user_id=user_id),
+                    budget_use_cases.get_budgets_by_user_id(user_id=user_id),
+                    utilisation_use_cases.get_budgets_utilisation(user_id=user_id),
+                )
+            CACHE_WARMUPS.labels(result="completed").inc()
+            logger.bind(user_id=user_id).debug("Cache warmed up")
+        except Exception as e:
+            CACHE_WARMUPS.labels(result="failed").inc()
+            logger.bind(user_id=user_id, error=str(e)).warning("Cache warmup failed")
+
+    async def close(self) -> None:
+        tasks = list(self._pending.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,135 @@
+import types
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+from functools import cache, lru_cache
+from typing import Any, TypeVar, Union, cast, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+import orjson
+
+T = TypeVar("T")
+Decoder = Callable[[Any], Any]
+
+# zlib/JSON/text payloads never start with a NUL byte
+COMPRESSED_PREFIX = b"\x00z"
+
+# UUID() is the slowest part of a decode, and foreign keys such as user_id
+# repeat across every item of a cached list. UUIDs are immutable, so the
+# parsed instances can be shared
+_parse_uuid = lru_cache(maxsize=4096)(UUID)
+
+
+class CacheCodec(ABC):
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes, serializer: type[T]) -> T:
+        pass
+
+
+@cache
+def _decoder_for(tp: Any) -> Decoder | None:
+    """Build the decoder for a type once, None means the JSON value is used as is"""
+    origin = get_origin(tp)
+    if origin is list:
+        item = _decoder_for(get_args(tp)[0])
+        if item is None:
+            return None
+        return lambda v: [item(i) for i in v]
+    if origin in (Union, types.UnionType):
+        args = [a for a in get_args(tp) if a is not type(None)]
+        if len(args) != 1:
+            return None
+        inner = _decoder_for(args[0])
+        if inner is None:
+            return None
+        return lambda v: None if v is None else inner(v)
+    if tp is UUID:
+        return _parse_uuid
+    if tp is datetime:
+        return datetime.fromisoformat
+    if tp is date:
+        return date.fromisoformat
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        return tp
+    if is_dataclass(tp) and isinstance(tp, type):
+        return _compile_dataclass_decoder(tp)
+    if hasattr(tp, "model_validate"):
+        return cast(Decoder, tp.model_validate)
+    return None
+
+
+def _compile_dataclass_decoder(model: type[Any]) -> Decoder:
+    """Resolve the field decoders once, fields stored as is skip the call"""
+    hints = get_type_hints(model)
+    plain: list[str] = []
+    typed: list[tuple[str, Decoder]] = []
+    for f in fields(model):
+        if not f.init:
+            continue
+        decoder = _decoder_for(hints[f.name])
+        if decoder is None:
+            plain.append(f.name)
+        else:
+            typed.append((f.name, decoder))
+
+    def decode(v: Any) -> Any:
+        kwargs = {name: v[name] for name in plain}
+        for name, decoder in typed:
+            kwargs[name] = decoder(v[name])
+        return model(**kwargs)
+
+    return decode
+
+
+def _default(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if hasattr(value, "__dict__"):
+        return dict(value.__dict__)
+    raise TypeError(f"Unsupported type for serialization: {type(value)}")
+
+
+class OrjsonCodec(CacheCodec):
+    """
+    Dataclasses, UUIDs, datetimes and enums are encoded natively by orjson and
+    rebuilt with typed decoders precompiled per serializer. Payloads of at least
+    `compression_threshold` bytes are zlib compressed, None disables compression.
+    """
+
+    def __init__(
+        self, compression_threshold: int | None = None, compression_level: int = 1
+    ) -> None:
+        self._compression_threshold = compression_threshold
+        self._compression_level = compression_level
+
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, bytes):
+            data = value
+        elif isinstance(value, str):
+            data = value.encode("utf-8")
+        else:
+            data = orjson.dumps(value, default=_default)
+        if (
+            self._compression_threshold is not None
+            and len(data) >= self._compression_threshold
+        ):
+            return COMPRESSED_PREFIX + zlib.compress(data, self._compression_level)
+        return data
+
+    def decode(self, data: bytes, serializer: type[T]) -> T:
+        if data.startswith(COMPRESSED_PREFIX):
+            data = zlib.decompress(data[len(COMPRESSED_PREFIX) :])
+        if serializer is bytes:
+            return cast(T, data)
+        if serializer is str:
+            return cast(T, data.decode("utf-8"))
+        obj = orjson.loads(data)
+        decoder = _decoder_for(cast(Any, serializer))
+        return cast(T, decoder(obj) if decoder else obj)
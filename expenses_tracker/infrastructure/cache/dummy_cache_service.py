@@ -1,22 +1,84 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from typing import Generic, TypeVar
 
-from expenses_tracker.application.interfaces.cache_service import ICacheService
+from expenses_tracker.application.interfaces.cache_service import (
+    ICacheService,
+    ICachePipeline,
+    Tombstone,
+)
 
 T = TypeVar("T")
 
 
+class DummyCachePipeline(ICachePipeline[T], Generic[T]):
+    def set(
+        self, key: str, value: T, ttl: int | None = None, tags: list[str] | None = None
+    ) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def invalidate_tags(self, *tags: str) -> None:
+        pass
+
+    def bump_version(self, *namespaces: str) -> None:
+        pass
+
+
 class DummyCacheService(ICacheService[T], Generic[T]):
     async def get(self, key: str, serializer: type[T]) -> T | None:
         return None
 
-    async def get_keys_by_pattern(self, pattern: str) -> list[str]:
-        return []
-
-    async def delete_keys_by_pattern(self, pattern: str) -> None:
+    async def get_or_tombstone(
+        self, key: str, serializer: type[T]
+    ) -> T | Tombstone | None:
         return None
 
-    async def set(self, key: str, value: T, ttl: int | None = 300) -> None:
+    async def get_many(self, keys: list[str], serializer: type[T]) -> list[T | None]:
+        return [None] * len(keys)
+
+    async def get_or_load(
+        self,
+        key: str,
+        serializer: type[T],
+        loader: Callable[[], Awaitable[T]],
+        ttl: int | None = None,
+        tags: list[str] | None = None,
+    ) -> T:
+        return await loader()
+
+    async def set(
+        self,
+        key: str,
+        value: T,
+        ttl: int | None = 300,
+        tags: list[str] | None = None,
+    ) -> None:
+        pass
+
+    async def set_tombstone(self, key: str, ttl: int) -> None:
+        pass
+
+    async def set_many(self, items: dict[str, T], ttl: int | None = None) -> None:
         pass
 
     async def delete(self, key: str) -> None:
         pass
+
+    async def delete_many(self, keys: list[str]) -> None:
+        pass
+
+    async def get_tag_members(self, tag: str) -> list[str]:
+        return []
+
+    async def invalidate_tags(self, tags: list[str]) -> None:
+        pass
+
+    async def get_version(self, namespace: str) -> int | None:
+        return None
+
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[ICachePipeline[T]]:
+        yield DummyCachePipeline()
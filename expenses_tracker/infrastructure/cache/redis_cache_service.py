@@ -1,93 +1,345 @@
-from dataclasses import is_dataclass, asdict
-from typing import TypeVar, Generic, get_origin, get_args, cast, Any
+import asyncio
+import math
+import random
+import struct
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import TypeVar, Generic, cast
+from uuid import uuid4
 
-import orjson
 import redis.asyncio as redis
 import structlog
+from redis.asyncio.client import Pipeline
 
-from expenses_tracker.application.interfaces.cache_service import ICacheService
+from expenses_tracker.application.interfaces.cache_service import (
+    TOMBSTONE,
+    ICacheService,
+    ICachePipeline,
+    Tombstone,
+)
 from expenses_tracker.core.settings import get_settings
+from expenses_tracker.infrastructure.cache.codec import CacheCodec, OrjsonCodec
+from expenses_tracker.infrastructure.monitoring.metrics import CACHE_TOMBSTONE_HITS
 
 T = TypeVar("T")
 logger = structlog.get_logger(__name__)
 
+# values written by get_or_load carry how long the loader took
+LOADED_PREFIX = b"\x00t"
+LOAD_SECONDS = struct.Struct("<f")
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+TOMBSTONE_VALUE = b"\x00n"
+# tag indexes are sorted sets of keys scored by their expiry timestamp
+TAG_PREFIX = "tag:"
+INVALIDATE_TAGS_SCRIPT = """
+for _, tag in ipairs(KEYS) do
+    local members = redis.call("zrange", tag, 0, -1)
+    for i = 1, #members, 1000 do
+        redis.call("del", unpack(members, i, math.min(i + 999, #members)))
+    end
+    redis.call("del", tag)
+end
+return 0
+"""
+# a missing version is seeded from the clock instead of starting over at 1,
+# so losing the counter can't bring back keys of an old version
+VERSION_PREFIX = "version:"
+BUMP_VERSION_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    if redis.call("exists", key) == 1 then
+        redis.call("incr", key)
+    else
+        redis.call("set", key, ARGV[1])
+    end
+end
+return 0
+"""
+# redis.asyncio.ConnectionPool size when max_connections is not set
+UNBOUNDED_POOL_SIZE = 2**31
+
+
+def _tag_key(tag: str) -> str:
+    return f"{TAG_PREFIX}{tag}"
+
+
+def _version_key(namespace: str) -> str:
+    return f"{VERSION_PREFIX}{namespace}"
+
+
+def _version_seed() -> int:
+    return time.time_ns() // 1000
+
+
+def _add_to_tags(pipe: Pipeline, key: str, ttl: int | None, tags: list[str]) -> None:
+    now = time.time()
+    expires_at = now + ttl if ttl else math.inf
+    for tag in tags:
+        # drop members that already expired, so the index stays bounded
+        pipe.zremrangebyscore(_tag_key(tag), "-inf", now)
+        pipe.zadd(_tag_key(tag), {key: expires_at})
+
+
+class RedisPipeline(Generic[T], ICachePipeline[T]):
+    def __init__(self, pipeline: Pipeline, serialize: Callable[[T], bytes]) -> None:
+        self._pipeline = pipeline
+        self._serialize = serialize
+
+    def set(
+        self, key: str, value: T, ttl: int | None = None, tags: list[str] | None = None
+    ) -> None:
+        try:
+            self._pipeline.set(key, self._serialize(value), ex=ttl)
+            _add_to_tags(self._pipeline, key, ttl, tags or [])
+        except Exception as e:
+            logger.bind(key=key, error=str(e)).warning("Redis PIPELINE SET failed")
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._pipeline.delete(*keys)
+
+    def invalidate_tags(self, *tags: str) -> None:
+        if tags:
+            self._pipeline.eval(
+                INVALIDATE_TAGS_SCRIPT, len(tags), *(_tag_key(tag) for tag in tags)
+            )
+
+    def bump_version(self, *namespaces: str) -> None:
+        if namespaces:
+            self._pipeline.eval(
+                BUMP_VERSION_SCRIPT,
+                len(namespaces),
+                *(_version_key(namespace) for namespace in namespaces),
+                _version_seed(),
+            )
+
+    def publish(self, channel: str, message: bytes) -> None:
+        self._pipeline.publish(channel, message)
+
 
 class RedisService(Generic[T], ICacheService[T]):
-    def __init__(self, url: str | None = None) -> None:
-        self._redis = redis.Redis.from_url(
-            url=url or get_settings().redis_dsn, encoding="utf-8", decode_responses=True
+    def __init__(self, url: str | None = None, codec: CacheCodec | None = None) -> None:
+        self._redis = redis.Redis.from_url(url=url or get_settings().redis_dsn)
+        self._codec = codec or OrjsonCodec(
+            compression_threshold=get_settings().cache_compression_threshold_bytes,
+            compression_level=get_settings().cache_compression_level,
         )
+        self._release_lock = self._redis.register_script(RELEASE_LOCK_SCRIPT)
+        self._invalidate_tags = self._redis.register_script(INVALIDATE_TAGS_SCRIPT)
+        self._flights: dict[str, asyncio.Task[T]] = {}
         logger.info("RedisService initialized")
 
     def _serialize(self, value: T) -> bytes:
-        """Serialize an object (DTO, dataclass, dict, list) to JSON bytes."""
-        if isinstance(value, str):
-            return value.encode("utf-8")
-        elif isinstance(value, bytes):
-            return value
-        elif isinstance(value, list):
-            data = [self._model_dump(v) for v in value]
-        else:
-            data = self._model_dump(value)  # type: ignore
-        return orjson.dumps(data)
+        return self._codec.encode(value)
 
     @staticmethod
-    def _deserialize(value: str, serializer: type[T]) -> T | None:
-        """Deserialize JSON from Redis to an object/list."""
-        try:
-            if serializer is str:
-                if isinstance(value, str):
-                    return cast(T, value)
-                elif isinstance(value, bytes):
-                    return cast(T, value.decode("utf-8"))
-            if serializer is bytes:
-                if isinstance(value, bytes):
-                    return cast(T, value)
-                elif isinstance(value, str):
-                    return cast(T, value.encode("utf-8"))
-
-            obj = orjson.loads(value)
-            if get_origin(serializer) is list:
-                model = get_args(serializer)[0]
-                return cast(T, [model(**item) for item in obj])
-
-            return serializer(**obj)
+    def _split_load_seconds(value: bytes) -> tuple[float, bytes]:
+        if not value.startswith(LOADED_PREFIX):
+            return 0.0, value
+        offset = len(LOADED_PREFIX) + LOAD_SECONDS.size
+        (load_seconds,) = LOAD_SECONDS.unpack(value[len(LOADED_PREFIX) : offset])
+        return load_seconds, value[offset:]
+
+    def _deserialize(self, value: bytes, serializer: type[T]) -> T | None:
+        if value == TOMBSTONE_VALUE:
+            return None
+        try:
+            _, value = self._split_load_seconds(value)
+            return self._codec.decode(value, serializer)
         except Exception as e:
             logger.bind(error=str(e)).warning("Redis DESERIALIZE failed")
             return None
 
-    @staticmethod
-    def _model_dump(value: object) -> dict[str, Any]:
-        """Convert supported object types into a plain dict."""
-        if hasattr(value, "model_dump"):
-            return value.model_dump()  # type: ignore
-        if is_dataclass(value) and not isinstance(value, type):
-            return asdict(value)
-        if hasattr(value, "__dict__"):
-            return dict(value.__dict__)
-        if isinstance(value, dict):
-            return dict(value)
-        raise TypeError(f"Unsupported type for serialization: {type(value)}")
-
     async def get(self, key: str, serializer: type[T]) -> T | None:
         try:
             value = await self._redis.get(key)
             if value is None:
                 return None
             logger.bind(key=key).debug("Hit cache")
-            return self._deserialize(value, serializer)
+            return self._deserialize(cast(bytes, value), serializer)
         except Exception as e:
             logger.bind(key=key, error=str(e)).warning("Redis GET failed")
             return None
 
-    async def set(self, key: str, value: T, ttl: int | None = None) -> None:
+    async def get_or_tombstone(
+        self, key: str, serializer: type[T]
+    ) -> T | Tombstone | None:
+        try:
+            value = await self._redis.get(key)
+            if value is None:
+                return None
+            if value == TOMBSTONE_VALUE:
+                CACHE_TOMBSTONE_HITS.labels(entity=key.split(":", 1)[0]).inc()
+                logger.bind(key=key).debug("Hit cache tombstone")
+                return TOMBSTONE
+            logger.bind(key=key).debug("Hit cache")
+            return self._deserialize(cast(bytes, value), serializer)
+        except Exception as e:
+            logger.bind(key=key, error=str(e)).warning("Redis GET failed")
+            return None
+
+    async def get_many(self, keys: list[str], serializer: type[T]) -> list[T | None]:
+        if not keys:
+            return []
+        try:
+            values = await self._redis.mget(keys)
+            logger.bind(keys=len(keys)).debug("Hit cache many")
+            return [
+                self._deserialize(cast(bytes, value), serializer)
+                if value is not None
+                else None
+                for value in values
+            ]
+        except Exception as e:
+            logger.bind(keys=keys, error=str(e)).warning("Redis MGET failed")
+            return [None] * len(keys)
+
+    async def get_or_load(
+        self,
+        key: str,
+        serializer: type[T],
+        loader: Callable[[], Awaitable[T]],
+        ttl: int | None = None,
+        tags: list[str] | None = None,
+    ) -> T:
+        # concurrent callers in this process share one load
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.create_task(
+                self._get_or_load(key, serializer, loader, ttl, tags or [])
+            )
+            self._flights[key] = flight
+            flight.add_done_callback(lambda _: self._flights.pop(key, None))
+        return await asyncio.shield(flight)
+
+    @staticmethod
+    def _should_refresh_early(load_seconds: float, ttl_ms: int) -> bool:
+        """XFetch: refresh before expiry with a probability growing as it nears"""
+        if load_seconds <= 0 or ttl_ms <= 0:
+            return False
+        beta = get_settings().cache_early_refresh_beta
+        return -load_seconds * beta * math.log(random.random()) >= ttl_ms / 1000
+
+    async def _get_or_load(
+        self,
+        key: str,
+        serializer: type[T],
+        loader: Callable[[], Awaitable[T]],
+        ttl: int | None,
+        tags: list[str],
+    ) -> T:
+        cached: T | None = None
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.pttl(key)
+                raw, ttl_ms = await pipe.execute()
+            if raw is not None:
+                load_seconds, _ = self._split_load_seconds(raw)
+                cached = self._deserialize(raw, serializer)
+                if cached is not None and not self._should_refresh_early(
+                    load_seconds, ttl_ms
+                ):
+                    logger.bind(key=key).debug("Hit cache")
+                    return cached
+        except Exception as e:
+            logger.bind(key=key, error=str(e)).warning("Redis GET failed")
+
+        # across workers only the holder of the lock runs the loader
+        lock_key, token = f"lock:{key}", uuid4().hex
+        settings = get_settings()
+        try:
+            locked = await self._redis.set(
+                lock_key, token, nx=True, px=int(settings.cache_lock_ttl_seconds * 1000)
+            )
+        except Exception as e:
+            logger.bind(key=key, error=str(e)).warning("Redis LOCK failed")
+            locked = True
+        if not locked:
+            if cached is not None:
+                # another worker is already refreshing it early
+                return cached
+            waited = await self._wait_for_load(key, serializer)
+            if waited is not None:
+                return waited
+            logger.bind(key=key).warning("Cache load lock wait timed out")
+
+        try:
+            started = time.perf_counter()
+            value = await loader()
+            load_seconds = time.perf_counter() - started
+            try:
+                data = (
+                    LOADED_PREFIX
+                    + LOAD_SECONDS.pack(load_seconds)
+                    + self._serialize(value)
+                )
+                async with self._redis.pipeline(transaction=True) as pipe:
+                    pipe.set(key, data, ex=ttl)
+                    _add_to_tags(pipe, key, ttl, tags)
+                    await pipe.execute()
+                logger.bind(key=key, load_seconds=load_seconds).debug("Loaded cache")
+            except Exception as e:
+                logger.bind(key=key, error=str(e)).warning("Redis SET failed")
+            return value
+        finally:
+            if locked:
+                try:
+                    await self._release_lock(keys=[lock_key], args=[token])
+                except Exception as e:
+                    logger.bind(key=key, error=str(e)).warning("Redis UNLOCK failed")
+
+    async def _wait_for_load(self, key: str, serializer: type[T]) -> T | None:
+        settings = get_settings()
+        deadline = time.monotonic() + settings.cache_lock_wait_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.cache_lock_poll_seconds)
+            value = await self.get(key, serializer)
+            if value is not None:
+                return value
+        return None
+
+    async def set(
+        self, key: str, value: T, ttl: int | None = None, tags: list[str] | None = None
+    ) -> None:
         try:
             data = self._serialize(value)
-            await self._redis.set(key, data, ex=ttl)
+            if tags:
+                async with self._redis.pipeline(transaction=True) as pipe:
+                    pipe.set(key, data, ex=ttl)
+                    _add_to_tags(pipe, key, ttl, tags)
+                    await pipe.execute()
+            else:
+                await self._redis.set(key, data, ex=ttl)
             logger.bind(key=key).debug("Set cache")
         except Exception as e:
             logger.bind(key=key, error=str(e)).warning("Redis SET failed")
 
+    async def set_tombstone(self, key: str, ttl: int) -> None:
+        try:
+            # NX, a concurrent create may have cached the entity meanwhile
+            await self._redis.set(key, TOMBSTONE_VALUE, ex=ttl, nx=True)
+            logger.bind(key=key).debug("Set cache tombstone")
+        except Exception as e:
+            logger.bind(key=key, error=str(e)).warning("Redis SET TOMBSTONE failed")
+
+    async def set_many(self, items: dict[str, T], ttl: int | None = None) -> None:
+        if not items:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, self._serialize(value), ex=ttl)
+                await pipe.execute()
+            logger.bind(keys=len(items)).debug("Set cache many")
+        except Exception as e:
+            logger.bind(keys=list(items), error=str(e)).warning("Redis SET MANY failed")
+
     async def delete(self, key: str) -> None:
         try:
             await self._redis.delete(key)
@@ -95,39 +347,96 @@ class RedisService(Generic[T], ICacheService[T]):
         except Exception as e:
             logger.bind(key=key, error=str(e)).warning("Redis DELETE failed")
 
-    async def get_keys_by_pattern(self, pattern: str) -> list[str]:
+    async def delete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
         try:
-            keys = []
-            cursor = "0"
-            while cursor != 0:  # type: ignore
-                cursor, found_keys = await self._redis.scan(
-                    cursor=cursor, match=pattern, count=1000
-                )
-                keys.extend(found_keys)
-            return keys
+            await self._redis.delete(*keys)
+            logger.bind(keys=len(keys)).debug("Delete cache many")
         except Exception as e:
-            logger.bind(pattern=pattern, error=str(e)).warning(
-                "Redis GET KEYS BY PATTERN failed"
+            logger.bind(keys=keys, error=str(e)).warning("Redis DELETE MANY failed")
+
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[RedisPipeline[T]]:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            yield RedisPipeline(pipe, self._serialize)
+            try:
+                await pipe.execute()
+                logger.debug("Executed cache pipeline")
+            except Exception as e:
+                logger.bind(error=str(e)).warning("Redis PIPELINE failed")
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        """Yield messages published to the channel, errors are left to the caller"""
+        async with self._redis.pubsub() as pubsub:
+            await pubsub.subscribe(channel)
+            logger.bind(channel=channel).debug("Subscribed to channel")
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"]
+
+    async def get_tag_members(self, tag: str) -> list[str]:
+        try:
+            members = cast(
+                list[bytes],
+                await self._redis.zrangebyscore(_tag_key(tag), time.time(), "+inf"),
             )
+            if not members:
+                return []
+            # keys deleted one by one stay in the index until they would expire
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for member in members:
+                    pipe.exists(member)
+                exists = await pipe.execute()
+            deleted = [m for m, found in zip(members, exists) if not found]
+            if deleted:
+                await self._redis.zrem(_tag_key(tag), *deleted)
+            return [m.decode("utf-8") for m, found in zip(members, exists) if found]
+        except Exception as e:
+            logger.bind(tag=tag, error=str(e)).warning("Redis GET TAG MEMBERS failed")
             return []
 
-    async def delete_keys_by_pattern(self, pattern: str) -> None:
-        """
-        Delete all keys by pattern
-        """
+    async def invalidate_tags(self, tags: list[str]) -> None:
+        if not tags:
+            return
         try:
-            cursor = "0"
-            while cursor != 0:  # type: ignore
-                cursor, keys = await self._redis.scan(
-                    cursor=cursor, match=f"*{pattern}*", count=5000
-                )
-                if keys:
-                    await self._redis.delete(*keys)
-            logger.bind(pattern=pattern).debug("Deleted keys by pattern")
+            await self._invalidate_tags(keys=[_tag_key(tag) for tag in tags])
+            logger.bind(tags=tags).debug("Invalidated cache tags")
         except Exception as e:
-            logger.bind(pattern=pattern, error=str(e)).warning(
-                "Redis DELETE BY PATTERN failed"
+            logger.bind(tags=tags, error=str(e)).warning("Redis INVALIDATE TAGS failed")
+
+    async def get_version(self, namespace: str) -> int | None:
+        key = _version_key(namespace)
+        try:
+            version = await self._redis.get(key)
+            if version is not None:
+                return int(version)
+            # first use, SET NX GET returns the seed of a concurrent reader
+            seed = _version_seed()
+            existing = await self._redis.set(key, seed, nx=True, get=True)
+            return seed if existing is None else int(existing)
+        except Exception as e:
+            logger.bind(namespace=namespace, error=str(e)).warning(
+                "Redis GET VERSION failed"
             )
+            return None
+
+    async def ping(self) -> None:
+        """Unlike the cache calls, raises when Redis can't be reached"""
+        await self._redis.ping()
+
+    def pool_stats(self) -> dict[str, int | None]:
+        pool = self._redis.connection_pool
+        # redis 6 has no public accessor for the connection counts
+        return {
+            "in_use": len(pool._in_use_connections),
+            "idle": len(pool._available_connections),
+            "max": (
+                pool.max_connections
+                if pool.max_connections < UNBOUNDED_POOL_SIZE
+                else None
+            ),
+        }
 
     async def close(self) -> None:
         try:
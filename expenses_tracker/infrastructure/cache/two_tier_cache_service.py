@@ -0,0 +1,352 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any, Generic, TypeVar
+from uuid import uuid4
+
+import orjson
+import structlog
+
+from expenses_tracker.application.interfaces.cache_service import (
+    ICacheService,
+    ICachePipeline,
+    Tombstone,
+)
+from expenses_tracker.core.settings import get_settings
+from expenses_tracker.infrastructure.cache.redis_cache_service import (
+    RedisPipeline,
+    RedisService,
+)
+from expenses_tracker.infrastructure.monitoring.metrics import (
+    CACHE_INVALIDATIONS_RECEIVED,
+    CACHE_LOCAL_ENTRIES,
+    CACHE_REQUESTS,
+)
+
+T = TypeVar("T")
+logger = structlog.get_logger(__name__)
+
+MISSING = object()
+
+
+class LocalCache:
+    """
+    Bounded LRU, every entry also expires `ttl_seconds` after it was stored,
+    or after its own shorter ttl
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any, tuple[str, ...]]] = (
+            OrderedDict()
+        )
+        self._tags: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        tags: tuple[str, ...] = (),
+        ttl_seconds: float | None = None,
+    ) -> None:
+        self._remove(key)
+        if ttl_seconds is None or ttl_seconds > self._ttl_seconds:
+            ttl_seconds = self._ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl_seconds, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self._max_size:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            members = self._tags.get(tag)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._tags[tag]
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._remove(key)
+
+    def delete_tags(self, *tags: str) -> None:
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+
+class TwoTierPipeline(Generic[T], ICachePipeline[T]):
+    def __init__(self, pipeline: RedisPipeline[T]) -> None:
+        self._pipeline = pipeline
+        # (key, value, tags, ttl), None value means the key was deleted
+        self.mutations: list[tuple[str, T | None, tuple[str, ...], int | None]] = []
+        self.invalidated_tags: list[str] = []
+
+    def set(
+        self, key: str, value: T, ttl: int | None = None, tags: list[str] | None = None
+    ) -> None:
+        self._pipeline.set(key, value, ttl=ttl, tags=tags)
+        self.mutations.append((key, value, tuple(tags or ()), ttl))
+
+    def delete(self, *keys: str) -> None:
+        self._pipeline.delete(*keys)
+        self.mutations.extend((key, None, (), None) for key in keys)
+
+    def invalidate_tags(self, *tags: str) -> None:
+        self._pipeline.invalidate_tags(*tags)
+        self.invalidated_tags.extend(tags)
+
+    def bump_version(self, *namespaces: str) -> None:
+        self._pipeline.bump_version(*namespaces)
+
+
+class TwoTierCacheService(Generic[T], ICacheService[T]):
+    """
+    In-process LRU in front of redis for keys starting with one of
+    `key_prefixes`. Every mutation publishes the touched keys on a redis
+    channel in the same transaction, other workers drop them from their
+    local tier when the message arrives.
+    """
+
+    def __init__(
+        self,
+        remote: RedisService[T],
+        max_size: int | None = None,
+        ttl_seconds: float | None = None,
+        key_prefixes: tuple[str, ...] | None = None,
+        channel: str | None = None,
+    ) -> None:
+        settings = get_settings()
+        self._remote = remote
+        self._local = LocalCache(
+            max_size=max_size or settings.cache_local_max_size,
+            ttl_seconds=ttl_seconds or settings.cache_local_ttl_seconds,
+        )
+        self._key_prefixes = key_prefixes or settings.cache_local_key_prefixes
+        self._channel = channel or settings.cache_invalidation_channel
+        self._sender = uuid4().hex
+        # bumped on every invalidation, received or local, a get only fills
+        # the local tier if no invalidation happened while it was waiting for
+        # redis
+        self._generation = 0
+        self._listener: asyncio.Task[None] | None = None
+        logger.info("TwoTierCacheService initialized")
+
+    async def start(self) -> None:
+        self._listener = asyncio.create_task(self._listen())
+
+    def _is_local(self, key: str) -> bool:
+        return key.startswith(self._key_prefixes)
+
+    def _message(self, keys: list[str], tags: list[str]) -> bytes:
+        return orjson.dumps({"sender": self._sender, "keys": keys, "tags": tags})
+
+    def _store(
+        self,
+        key: str,
+        value: T | None,
+        tags: tuple[str, ...] = (),
+        ttl: int | None = None,
+    ) -> None:
+        if not self._is_local(key):
+            return
+        if value is None:
+            self._local.delete(key)
+        else:
+            self._local.set(key, value, tags, ttl)
+        CACHE_LOCAL_ENTRIES.set(len(self._local))
+
+    async def _listen(self) -> None:
+        while True:
+            # messages may have been missed while not subscribed
+            self._local.clear()
+            try:
+                async for message in self._remote.subscribe(self._channel):
+                    self._invalidate(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.bind(error=str(e)).warning("Cache invalidation listener failed")
+            await asyncio.sleep(1)
+
+    def _invalidate(self, message: bytes) -> None:
+        data = orjson.loads(message)
+        if data["sender"] == self._sender:
+            return
+        self._generation += 1
+        CACHE_INVALIDATIONS_RECEIVED.inc()
+        self._local.delete(*data["keys"])
+        self._local.delete_tags(*data["tags"])
+        CACHE_LOCAL_ENTRIES.set(len(self._local))
+
+    async def get(self, key: str, serializer: type[T]) -> T | None:
+        is_local = self._is_local(key)
+        if is_local:
+            value = self._local.get(key)
+            if value is not MISSING:
+                CACHE_REQUESTS.labels(tier="local", result="hit").inc()
+                return value  # type: ignore[no-any-return]
+            CACHE_REQUESTS.labels(tier="local", result="miss").inc()
+
+        generation = self._generation
+        value = await self._remote.get(key, serializer)
+        CACHE_REQUESTS.labels(
+            tier="redis", result="miss" if value is None else "hit"
+        ).inc()
+        if is_local and value is not None and generation == self._generation:
+            self._store(key, value)
+        return value  # type: ignore[no-any-return]
+
+    async def get_or_tombstone(
+        self, key: str, serializer: type[T]
+    ) -> T | Tombstone | None:
+        is_local = self._is_local(key)
+        if is_local:
+            value = self._local.get(key)
+            if value is not MISSING:
+                CACHE_REQUESTS.labels(tier="local", result="hit").inc()
+                return value  # type: ignore[no-any-return]
+            CACHE_REQUESTS.labels(tier="local", result="miss").inc()
+
+        # tombstones stay in redis only, local entries are always values
+        generation = self._generation
+        value = await self._remote.get_or_tombstone(key, serializer)
+        CACHE_REQUESTS.labels(
+            tier="redis", result="miss" if value is None else "hit"
+        ).inc()
+        if (
+            is_local
+            and value is not None
+            and not isinstance(value, Tombstone)
+            and generation == self._generation
+        ):
+            self._store(key, value)
+        return value  # type: ignore[no-any-return]
+
+    async def get_many(self, keys: list[str], serializer: type[T]) -> list[T | None]:
+        values: list[Any] = [
+            self._local.get(key) if self._is_local(key) else MISSING for key in keys
+        ]
+        missing = [i for i, value in enumerate(values) if value is MISSING]
+        CACHE_REQUESTS.labels(tier="local", result="hit").inc(len(keys) - len(missing))
+        if not missing:
+            return values
+        CACHE_REQUESTS.labels(tier="local", result="miss").inc(len(missing))
+
+        generation = self._generation
+        fetched = await self._remote.get_many([keys[i] for i in missing], serializer)
+        for i, value in zip(missing, fetched):
+            values[i] = value
+            CACHE_REQUESTS.labels(
+                tier="redis", result="miss" if value is None else "hit"
+            ).inc()
+            if value is not None and generation == self._generation:
+                self._store(keys[i], value)
+        return values
+
+    async def get_or_load(
+        self,
+        key: str,
+        serializer: type[T],
+        loader: Callable[[], Awaitable[T]],
+        ttl: int | None = None,
+        tags: list[str] | None = None,
+    ) -> T:
+        is_local = self._is_local(key)
+        if is_local:
+            value = self._local.get(key)
+            if value is not MISSING:
+                CACHE_REQUESTS.labels(tier="local", result="hit").inc()
+                return value  # type: ignore[no-any-return]
+            CACHE_REQUESTS.labels(tier="local", result="miss").inc()
+
+        generation = self._generation
+        value = await self._remote.get_or_load(key, serializer, loader, ttl, tags)
+        if is_local and generation == self._generation:
+            self._store(key, value, tuple(tags or ()), ttl)
+        return value
+
+    async def set(
+        self, key: str, value: T, ttl: int | None = None, tags: list[str] | None = None
+    ) -> None:
+        async with self.pipeline() as pipe:
+            pipe.set(key, value, ttl=ttl, tags=tags)
+
+    async def set_tombstone(self, key: str, ttl: int) -> None:
+        await self._remote.set_tombstone(key, ttl)
+
+    async def set_many(self, items: dict[str, T], ttl: int | None = None) -> None:
+        async with self.pipeline() as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        async with self.pipeline() as pipe:
+            pipe.delete(key)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        async with self.pipeline() as pipe:
+            pipe.delete(*keys)
+
+    async def get_tag_members(self, tag: str) -> list[str]:
+        return await self._remote.get_tag_members(tag)
+
+    async def invalidate_tags(self, tags: list[str]) -> None:
+        if not tags:
+            return
+        async with self.pipeline() as pipe:
+            pipe.invalidate_tags(*tags)
+
+    async def get_version(self, namespace: str) -> int | None:
+        # not kept locally, a bump must be seen by the next read on any worker
+        return await self._remote.get_version(namespace)
+
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[ICachePipeline[T]]:
+        async with self._remote.pipeline() as remote_pipe:
+            pipe = TwoTierPipeline(remote_pipe)
+            yield pipe
+            keys = [key for key, *_ in pipe.mutations if self._is_local(key)]
+            if keys or pipe.invalidated_tags:
+                remote_pipe.publish(
+                    self._channel, self._message(keys, pipe.invalidated_tags)
+                )
+        if keys or pipe.invalidated_tags:
+            # a get that read redis before this write must not fill the local
+            # tier with what it read
+            self._generation += 1
+        for key, value, tags, ttl in pipe.mutations:
+            self._store(key, value, tags, ttl)
+        self._local.delete_tags(*pipe.invalidated_tags)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+        await self._remote.close()
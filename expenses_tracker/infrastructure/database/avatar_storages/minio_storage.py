@@ -92,6 +92,9 @@ class MinioAvatarStorage(IAvatarStorage):
         except ClientError as e:
             logger.bind(e=e).warning("Could not set bucket policy")
 
+    def ping(self) -> None:
+        self.internal_client.head_bucket(Bucket=self._bucket_name)
+
     def get_public_url(self, object_name: str) -> str:
         return (
             f"{get_settings().minio_public_endpoint}/{self._bucket_name}/{object_name}"
@@ -1,6 +1,10 @@
+from psycopg_pool import AsyncConnectionPool
+from sqlalchemy import QueuePool, text
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
 )
 
 from expenses_tracker.core.settings import get_settings
@@ -12,4 +16,61 @@ def create_sqlalchemy_engine() -> AsyncEngine:
         echo=get_settings().database_echo,
         echo_pool=get_settings().database_pool_echo,
         pool_size=get_settings().pool_size,
+        max_overflow=get_settings().max_overflow,
+        pool_timeout=get_settings().pool_timeout_seconds,
+        pool_recycle=get_settings().pool_recycle_seconds,
+        pool_pre_ping=get_settings().pool_pre_ping,
+        connect_args={
+            "statement_cache_size": get_settings().asyncpg_statement_cache_size,
+            "prepared_statement_cache_size": (
+                get_settings().asyncpg_prepared_statement_cache_size
+            ),
+        },
     )
+
+
+def create_sqlalchemy_session_factory(
+    engine: AsyncEngine,
+) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+
+def create_psycopg_pool() -> AsyncConnectionPool:
+    """Pool is created closed, open it with `await pool.open()` inside a running loop"""
+    return AsyncConnectionPool(
+        conninfo=get_settings().sync_postgres_url,
+        min_size=get_settings().psycopg_pool_min_size,
+        max_size=get_settings().psycopg_pool_max_size,
+        max_idle=get_settings().psycopg_pool_max_idle_seconds,
+        max_lifetime=get_settings().psycopg_pool_max_lifetime_seconds,
+        timeout=get_settings().psycopg_pool_timeout_seconds,
+        name="psycopg",
+        open=False,
+    )
+
+
+async def ping_sqlalchemy_engine(engine: AsyncEngine) -> None:
+    """Checks a connection out of the engine pool, waits for one when it's exhausted"""
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+def sqlalchemy_pool_stats(engine: AsyncEngine) -> dict[str, int]:
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    return {
+        "in_use": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "max": get_settings().pool_size + get_settings().max_overflow,
+    }
+
+
+def psycopg_pool_stats(pool: AsyncConnectionPool) -> dict[str, int]:
+    stats = pool.get_stats()
+    return {
+        "in_use": stats["pool_size"] - stats["pool_available"],
+        "idle": stats["pool_available"],
+        "max": pool.max_size,
+        "waiting": stats["requests_waiting"],
+    }
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import Float, ForeignKey, DateTime, Enum
+from sqlalchemy import Float, ForeignKey, DateTime, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from expenses_tracker.core.constants import BudgetPeriod
@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 
 class BudgetModel(Base):
     __tablename__ = "budgets"
+    __table_args__ = (
+        Index("ix_budgets_user_id_category_id", "user_id", "category_id"),
+        Index("ix_budgets_user_id_period", "user_id", "period"),
+    )
 
     amount: Mapped[float] = mapped_column(Float, nullable=False)
     period: Mapped[BudgetPeriod] = mapped_column(Enum(BudgetPeriod), nullable=False)
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import Float, DateTime, ForeignKey
+from sqlalchemy import Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from expenses_tracker.domain.entities.expense import Expense
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
 
 class ExpenseModel(Base):
     __tablename__ = "expenses"
+    __table_args__ = (
+        Index("ix_expenses_user_id_date_id", "user_id", "date", "id"),
+        Index("ix_expenses_user_id_category_id_date", "user_id", "category_id", "date"),
+    )
 
     amount: Mapped[float] = mapped_column(Float, nullable=False)
     date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
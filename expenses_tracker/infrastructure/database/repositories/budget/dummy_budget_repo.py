@@ -1,15 +1,21 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
 from expenses_tracker.core.constants import BudgetPeriod
-from expenses_tracker.domain.entities.budget import Budget
+from expenses_tracker.domain.entities.budget import Budget, BudgetUtilisation
 from expenses_tracker.domain.repositories.budget import IBudgetRepository
+from expenses_tracker.infrastructure.database.repositories.expense.dummy_expense_repo import (
+    DummyExpenseRepository,
+)
 
 
 class DummyBudgetRepository(IBudgetRepository):
-    def __init__(self) -> None:
+    def __init__(
+        self, expense_repository: DummyExpenseRepository | None = None
+    ) -> None:
         self.budgets: dict[UUID, Budget] = {}
+        self._expense_repository = expense_repository or DummyExpenseRepository()
 
     async def get_by_id(self, budget_id: UUID) -> Optional[Budget]:
         return self.budgets.get(budget_id)
@@ -39,18 +45,6 @@ class DummyBudgetRepository(IBudgetRepository):
             if (budget.user_id == user_id and budget.category_id == category_id)
         ]
 
-    async def get_active_budgets_by_user_id(
-        self, user_id: UUID, current_date: datetime
-    ) -> list[Budget]:
-        return [
-            budget
-            for budget in self.budgets.values()
-            if (
-                budget.user_id == user_id
-                and budget.start_date <= current_date <= budget.end_date
-            )
-        ]
-
     async def get_by_user_id_and_period(
         self, user_id: UUID, period: BudgetPeriod
     ) -> list[Budget]:
@@ -84,3 +78,40 @@ class DummyBudgetRepository(IBudgetRepository):
             )
         ]
         return sum(budget.amount for budget in user_budgets)
+
+    @staticmethod
+    def _as_aware(date: datetime) -> datetime:
+        # expenses.date is a naive column, Postgres compares it as UTC
+        return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+
+    async def get_utilisation_by_user_id(
+        self, user_id: UUID, current_date: datetime
+    ) -> list[BudgetUtilisation]:
+        now = self._as_aware(current_date)
+        budgets = sorted(
+            (
+                budget
+                for budget in self.budgets.values()
+                if budget.user_id == user_id
+                and self._as_aware(budget.start_date)
+                <= now
+                <= self._as_aware(budget.end_date)
+            ),
+            key=lambda b: (self._as_aware(b.start_date), str(b.id)),
+        )
+        expenses = self._expense_repository.expenses.values()
+        return [
+            BudgetUtilisation(
+                budget=budget,
+                spent=sum(
+                    expense.amount
+                    for expense in expenses
+                    if expense.user_id == user_id
+                    and expense.category_id == budget.category_id
+                    and self._as_aware(budget.start_date)
+                    <= self._as_aware(expense.date)
+                    <= self._as_aware(budget.end_date)
+                ),
+            )
+            for budget in budgets
+        ]
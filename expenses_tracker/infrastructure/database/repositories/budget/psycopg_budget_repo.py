@@ -5,7 +5,7 @@ from psycopg import AsyncConnection
 from psycopg.rows import dict_row
 
 from expenses_tracker.core.constants import BudgetPeriod
-from expenses_tracker.domain.entities.budget import Budget
+from expenses_tracker.domain.entities.budget import Budget, BudgetUtilisation
 from expenses_tracker.domain.repositories.budget import IBudgetRepository
 
 
@@ -69,22 +69,6 @@ class PsycopgBudgetRepository(IBudgetRepository):
             rows = await cursor.fetchall()
             return [self._row_to_budget(r) for r in rows]
 
-    async def get_active_budgets_by_user_id(
-        self, user_id: UUID, current_date: datetime
-    ) -> list[Budget]:
-        async with self._conn.cursor(row_factory=dict_row) as cursor:
-            await cursor.execute(
-                """
-                SELECT * FROM budgets 
-                WHERE user_id = %s 
-                AND start_date <= %s 
-                AND end_date >= %s
-                """,
-                (str(user_id), current_date, current_date),
-            )
-            rows = await cursor.fetchall()
-            return [self._row_to_budget(r) for r in rows]
-
     async def get_by_user_id_and_period(
         self, user_id: UUID, period: BudgetPeriod
     ) -> list[Budget]:
@@ -167,3 +151,31 @@ class PsycopgBudgetRepository(IBudgetRepository):
             )
             result = await cursor.fetchone()
             return result[0] if result else 0.0
+
+    async def get_utilisation_by_user_id(
+        self, user_id: UUID, current_date: datetime
+    ) -> list[BudgetUtilisation]:
+        async with self._conn.cursor(row_factory=dict_row) as cursor:
+            await cursor.execute(
+                """
+                SELECT b.*, COALESCE(SUM(e.amount), 0) AS spent
+                FROM budgets b
+                LEFT JOIN expenses e
+                    ON e.user_id = b.user_id
+                    AND e.category_id = b.category_id
+                    AND e.date BETWEEN b.start_date AND b.end_date
+                WHERE b.user_id = %s
+                AND b.start_date <= %s
+                AND b.end_date >= %s
+                GROUP BY b.id
+                ORDER BY b.start_date, b.id
+                """,
+                (str(user_id), current_date, current_date),
+            )
+            rows = await cursor.fetchall()
+            return [
+                BudgetUtilisation(
+                    spent=float(row.pop("spent")), budget=self._row_to_budget(row)
+                )
+                for row in rows
+            ]
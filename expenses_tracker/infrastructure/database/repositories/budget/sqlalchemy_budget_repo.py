@@ -1,13 +1,13 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from expenses_tracker.core.constants import BudgetPeriod
-from expenses_tracker.domain.entities.budget import Budget
+from expenses_tracker.domain.entities.budget import Budget, BudgetUtilisation
 from expenses_tracker.domain.repositories.budget import IBudgetRepository
-from expenses_tracker.infrastructure.database.models import BudgetModel
+from expenses_tracker.infrastructure.database.models import BudgetModel, ExpenseModel
 
 
 class SQLAlchemyBudgetRepository(IBudgetRepository):
@@ -50,20 +50,6 @@ class SQLAlchemyBudgetRepository(IBudgetRepository):
         models = result.scalars().all()
         return [m.to_entity() for m in models]
 
-    async def get_active_budgets_by_user_id(
-        self, user_id: UUID, current_date: datetime
-    ) -> list[Budget]:
-        stmt = select(BudgetModel).where(
-            and_(
-                BudgetModel.user_id == user_id,
-                BudgetModel.start_date <= current_date,
-                BudgetModel.end_date >= current_date,
-            )
-        )
-        result = await self._session.execute(stmt)
-        models = result.scalars().all()
-        return [m.to_entity() for m in models]
-
     async def get_by_user_id_and_period(
         self, user_id: UUID, period: BudgetPeriod
     ) -> list[Budget]:
@@ -104,3 +90,36 @@ class SQLAlchemyBudgetRepository(IBudgetRepository):
         result = await self._session.execute(stmt)
         amounts = result.scalars().all()
         return sum(amounts) if amounts else 0.0
+
+    async def get_utilisation_by_user_id(
+        self, user_id: UUID, current_date: datetime
+    ) -> list[BudgetUtilisation]:
+        stmt = (
+            select(
+                BudgetModel,
+                func.coalesce(func.sum(ExpenseModel.amount), 0.0).label("spent"),
+            )
+            .outerjoin(
+                ExpenseModel,
+                and_(
+                    ExpenseModel.user_id == BudgetModel.user_id,
+                    ExpenseModel.category_id == BudgetModel.category_id,
+                    ExpenseModel.date >= BudgetModel.start_date,
+                    ExpenseModel.date <= BudgetModel.end_date,
+                ),
+            )
+            .where(
+                and_(
+                    BudgetModel.user_id == user_id,
+                    BudgetModel.start_date <= current_date,
+                    BudgetModel.end_date >= current_date,
+                )
+            )
+            .group_by(BudgetModel.id)
+            .order_by(BudgetModel.start_date, BudgetModel.id)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            BudgetUtilisation(budget=model.to_entity(), spent=float(spent))
+            for model, spent in result.all()
+        ]
@@ -25,7 +25,9 @@ class DummyUnitOfWork(IUnitOfWork):
         self._user_repository = DummyUserRepository()
         self._category_repository = DummyCategoryRepository()
         self._expense_repository = DummyExpenseRepository()
-        self._budget_repository = DummyBudgetRepository()
+        self._budget_repository = DummyBudgetRepository(
+            expense_repository=self._expense_repository
+        )
 
     @property
     def user_repository(self) -> IUserRepository:
@@ -0,0 +1,18 @@
+import csv
+import io
+from collections.abc import Iterable
+
+from expenses_tracker.domain.entities.expense import Expense
+from expenses_tracker.domain.repositories.expense import EXPENSE_CSV_COLUMNS
+
+
+def expenses_to_csv(expenses: Iterable[Expense], header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPENSE_CSV_COLUMNS)
+    writer.writerows(
+        [getattr(expense, column) for column in EXPENSE_CSV_COLUMNS]
+        for expense in expenses
+    )
+    return buffer.getvalue().encode("utf-8")
@@ -1,8 +1,14 @@
-from datetime import datetime
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
 from uuid import UUID
 
-from expenses_tracker.domain.entities.expense import Expense
+from expenses_tracker.core.constants import ExpenseGranularity
+from expenses_tracker.domain.entities.expense import Expense, ExpenseSummary
 from expenses_tracker.domain.repositories.expense import IExpenseRepository
+from expenses_tracker.infrastructure.database.repositories.expense.csv_export import (
+    expenses_to_csv,
+)
 
 
 class DummyExpenseRepository(IExpenseRepository):
@@ -17,6 +23,35 @@ class DummyExpenseRepository(IExpenseRepository):
             expense for expense in self.expenses.values() if expense.user_id == user_id
         ]
 
+    def _sorted_by_user_id(self, user_id: UUID) -> list[Expense]:
+        return sorted(
+            (e for e in self.expenses.values() if e.user_id == user_id),
+            key=lambda e: (e.date, e.id),
+            reverse=True,
+        )
+
+    async def get_page_by_user_id(
+        self, user_id: UUID, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> list[Expense]:
+        expenses = self._sorted_by_user_id(user_id)
+        if after is not None:
+            expenses = [e for e in expenses if (e.date, e.id) < after]
+        return expenses[:limit]
+
+    async def stream_by_user_id(
+        self, user_id: UUID, batch_size: int = 1000
+    ) -> AsyncIterator[Expense]:
+        for expense in self._sorted_by_user_id(user_id):
+            yield expense
+
+    async def export_csv_by_user_id(
+        self, user_id: UUID, batch_size: int = 1000
+    ) -> AsyncIterator[bytes]:
+        expenses = self._sorted_by_user_id(user_id)
+        yield expenses_to_csv(expenses[:batch_size], header=True)
+        for start in range(batch_size, len(expenses), batch_size):
+            yield expenses_to_csv(expenses[start : start + batch_size])
+
     async def get_by_user_id_and_date_range(
         self, user_id: UUID, start_date: datetime, end_date: datetime
     ) -> list[Expense]:
@@ -35,10 +70,60 @@ class DummyExpenseRepository(IExpenseRepository):
             if expense.user_id == user_id and expense.category_id == category_id
         ]
 
+    @staticmethod
+    def _truncate(date: datetime, granularity: ExpenseGranularity) -> datetime:
+        day = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        if granularity == ExpenseGranularity.WEEK:
+            return day - timedelta(days=day.weekday())
+        if granularity == ExpenseGranularity.MONTH:
+            return day.replace(day=1)
+        return day
+
+    async def get_summary_by_user_id(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: ExpenseGranularity | None = None,
+        group_by_category: bool = True,
+    ) -> list[ExpenseSummary]:
+        buckets: dict[tuple[datetime | None, UUID | None], list[float]] = defaultdict(
+            list
+        )
+        for expense in await self.get_by_user_id_and_date_range(
+            user_id=user_id, start_date=start_date, end_date=end_date
+        ):
+            period_start = (
+                self._truncate(expense.date, granularity) if granularity else None
+            )
+            category_id = expense.category_id if group_by_category else None
+            buckets[(period_start, category_id)].append(expense.amount)
+
+        return [
+            ExpenseSummary(
+                total_amount=sum(amounts),
+                count=len(amounts),
+                min_amount=min(amounts),
+                max_amount=max(amounts),
+                avg_amount=sum(amounts) / len(amounts),
+                category_id=category_id,
+                period_start=period_start,
+            )
+            for (period_start, category_id), amounts in sorted(
+                buckets.items(),
+                key=lambda item: (item[0][0] or datetime.min, str(item[0][1] or "")),
+            )
+        ]
+
     async def create(self, expense: Expense) -> Expense:
         self.expenses[expense.id] = expense
         return expense
 
+    async def create_many(self, expenses: list[Expense]) -> int:
+        for expense in expenses:
+            self.expenses[expense.id] = expense
+        return len(expenses)
+
     async def update(self, expense: Expense) -> Expense:
         self.expenses[expense.id] = expense
         return expense
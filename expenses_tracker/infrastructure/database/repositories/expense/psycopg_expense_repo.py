@@ -1,11 +1,16 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from psycopg import AsyncConnection
+from psycopg import AsyncConnection, sql
 from psycopg.rows import dict_row
 
-from expenses_tracker.domain.entities.expense import Expense
-from expenses_tracker.domain.repositories.expense import IExpenseRepository
+from expenses_tracker.core.constants import ExpenseGranularity
+from expenses_tracker.domain.entities.expense import Expense, ExpenseSummary
+from expenses_tracker.domain.repositories.expense import (
+    EXPENSE_CSV_COLUMNS,
+    IExpenseRepository,
+)
 
 
 class PsycopgExpenseRepository(IExpenseRepository):
@@ -28,6 +33,70 @@ class PsycopgExpenseRepository(IExpenseRepository):
             rows = await cursor.fetchall()
             return [Expense(**row) for row in rows]
 
+    async def get_page_by_user_id(
+        self, user_id: UUID, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> list[Expense]:
+        async with self._conn.cursor(row_factory=dict_row) as cursor:
+            if after is None:
+                await cursor.execute(
+                    """
+                    SELECT * FROM expenses
+                    WHERE user_id = %s
+                    ORDER BY date DESC, id DESC
+                    LIMIT %s
+                    """,
+                    (str(user_id), limit),
+                )
+            else:
+                after_date, after_id = after
+                await cursor.execute(
+                    """
+                    SELECT * FROM expenses
+                    WHERE user_id = %s
+                    AND (date, id) < (%s, %s)
+                    ORDER BY date DESC, id DESC
+                    LIMIT %s
+                    """,
+                    (str(user_id), after_date, str(after_id), limit),
+                )
+            rows = await cursor.fetchall()
+            return [Expense(**row) for row in rows]
+
+    async def stream_by_user_id(
+        self, user_id: UUID, batch_size: int = 1000
+    ) -> AsyncIterator[Expense]:
+        async with self._conn.cursor(
+            name=f"expenses_stream_{uuid4().hex}", row_factory=dict_row
+        ) as cursor:
+            cursor.itersize = batch_size
+            await cursor.execute(
+                "SELECT * FROM expenses WHERE user_id = %s ORDER BY date DESC, id DESC",
+                (str(user_id),),
+            )
+            async for row in cursor:
+                yield Expense(**row)
+
+    async def export_csv_by_user_id(
+        self, user_id: UUID, batch_size: int = 1000
+    ) -> AsyncIterator[bytes]:
+        # COPY streams CSV produced by the server, rows never become Python objects
+        query = sql.SQL(
+            """
+            COPY (
+                SELECT {columns} FROM expenses
+                WHERE user_id = {user_id}
+                ORDER BY date DESC, id DESC
+            ) TO STDOUT WITH (FORMAT CSV, HEADER)
+            """
+        ).format(
+            columns=sql.SQL(", ").join(map(sql.Identifier, EXPENSE_CSV_COLUMNS)),
+            user_id=sql.Literal(str(user_id)),
+        )
+        async with self._conn.cursor() as cursor:
+            async with cursor.copy(query) as copy:
+                async for data in copy:
+                    yield bytes(data)
+
     async def get_by_user_id_and_date_range(
         self, user_id: UUID, start_date: datetime, end_date: datetime
     ) -> list[Expense]:
@@ -50,6 +119,40 @@ class PsycopgExpenseRepository(IExpenseRepository):
             rows = await cursor.fetchall()
             return [Expense(**row) for row in rows]
 
+    async def get_summary_by_user_id(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: ExpenseGranularity | None = None,
+        group_by_category: bool = True,
+    ) -> list[ExpenseSummary]:
+        category = sql.SQL("category_id" if group_by_category else "NULL::uuid")
+        period = (
+            sql.SQL("date_trunc({}, date)").format(sql.Literal(granularity.value))
+            if granularity
+            else sql.SQL("NULL::timestamp")
+        )
+        query = sql.SQL(
+            """
+            SELECT {category} AS category_id,
+                   {period} AS period_start,
+                   SUM(amount) AS total_amount,
+                   COUNT(*) AS count,
+                   MIN(amount) AS min_amount,
+                   MAX(amount) AS max_amount,
+                   AVG(amount) AS avg_amount
+            FROM expenses
+            WHERE user_id = %s AND date BETWEEN %s AND %s
+            GROUP BY 1, 2
+            ORDER BY 2, 1
+            """
+        ).format(category=category, period=period)
+        async with self._conn.cursor(row_factory=dict_row) as cursor:
+            await cursor.execute(query, (str(user_id), start_date, end_date))
+            rows = await cursor.fetchall()
+            return [ExpenseSummary(**row) for row in rows]
+
     async def create(self, expense: Expense) -> Expense:
         async with self._conn.cursor(row_factory=dict_row) as cursor:
             await cursor.execute(
@@ -70,6 +173,29 @@ class PsycopgExpenseRepository(IExpenseRepository):
             )
         return expense
 
+    async def create_many(self, expenses: list[Expense]) -> int:
+        async with self._conn.cursor() as cursor:
+            async with cursor.copy(
+                """
+                COPY expenses (id, amount, date, user_id, category_id, description, created_at, updated_at)
+                FROM STDIN
+                """
+            ) as copy:
+                for expense in expenses:
+                    await copy.write_row(
+                        (
+                            expense.id,
+                            expense.amount,
+                            expense.date,
+                            expense.user_id,
+                            expense.category_id,
+                            expense.description,
+                            expense.created_at,
+                            expense.updated_at,
+                        )
+                    )
+        return len(expenses)
+
     async def update(self, expense: Expense) -> Expense:
         async with self._conn.cursor(row_factory=dict_row) as cursor:
             await cursor.execute(
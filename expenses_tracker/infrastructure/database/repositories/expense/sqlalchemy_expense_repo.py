@@ -1,12 +1,17 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from expenses_tracker.domain.entities.expense import Expense
+from expenses_tracker.core.constants import ExpenseGranularity
+from expenses_tracker.domain.entities.expense import Expense, ExpenseSummary
 from expenses_tracker.domain.repositories.expense import IExpenseRepository
 from expenses_tracker.infrastructure.database.models.expense import ExpenseModel
+from expenses_tracker.infrastructure.database.repositories.expense.csv_export import (
+    expenses_to_csv,
+)
 
 
 class SQLAlchemyExpenseRepository(IExpenseRepository):
@@ -25,6 +30,46 @@ class SQLAlchemyExpenseRepository(IExpenseRepository):
         models = result.scalars().all()
         return [m.to_entity() for m in models]
 
+    async def get_page_by_user_id(
+        self, user_id: UUID, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> list[Expense]:
+        stmt = select(ExpenseModel).where(ExpenseModel.user_id == user_id)
+        if after is not None:
+            stmt = stmt.where(tuple_(ExpenseModel.date, ExpenseModel.id) < after)
+        stmt = stmt.order_by(ExpenseModel.date.desc(), ExpenseModel.id.desc()).limit(
+            limit
+        )
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        return [m.to_entity() for m in models]
+
+    async def stream_by_user_id(
+        self, user_id: UUID, batch_size: int = 1000
+    ) -> AsyncIterator[Expense]:
+        stmt = (
+            select(ExpenseModel)
+            .where(ExpenseModel.user_id == user_id)
+            .order_by(ExpenseModel.date.desc(), ExpenseModel.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream_scalars(stmt)
+        async for model in result:
+            yield model.to_entity()
+
+    async def export_csv_by_user_id(
+        self, user_id: UUID, batch_size: int = 1000
+    ) -> AsyncIterator[bytes]:
+        stmt = (
+            select(ExpenseModel)
+            .where(ExpenseModel.user_id == user_id)
+            .order_by(ExpenseModel.date.desc(), ExpenseModel.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream_scalars(stmt)
+        yield expenses_to_csv([], header=True)
+        async for models in result.partitions():
+            yield expenses_to_csv(m.to_entity() for m in models)
+
     async def get_by_user_id_and_date_range(
         self, user_id: UUID, start_date: datetime, end_date: datetime
     ) -> list[Expense]:
@@ -47,11 +92,73 @@ class SQLAlchemyExpenseRepository(IExpenseRepository):
         models = result.scalars().all()
         return [m.to_entity() for m in models]
 
+    async def get_summary_by_user_id(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: ExpenseGranularity | None = None,
+        group_by_category: bool = True,
+    ) -> list[ExpenseSummary]:
+        keys = []
+        if granularity:
+            keys.append(
+                func.date_trunc(granularity.value, ExpenseModel.date).label(
+                    "period_start"
+                )
+            )
+        if group_by_category:
+            keys.append(ExpenseModel.category_id.label("category_id"))
+        stmt = (
+            select(
+                *keys,
+                func.sum(ExpenseModel.amount).label("total_amount"),
+                func.count().label("count"),
+                func.min(ExpenseModel.amount).label("min_amount"),
+                func.max(ExpenseModel.amount).label("max_amount"),
+                func.avg(ExpenseModel.amount).label("avg_amount"),
+            )
+            .where(
+                ExpenseModel.user_id == user_id,
+                ExpenseModel.date >= start_date,
+                ExpenseModel.date <= end_date,
+            )
+            .group_by(*keys)
+            # without keys this is a plain aggregate, one row of NULLs when
+            # nothing is in range
+            .having(func.count() > 0)
+            .order_by(*keys)
+        )
+        result = await self._session.execute(stmt)
+        return [ExpenseSummary(**row._asdict()) for row in result.all()]
+
     async def create(self, expense: Expense) -> Expense:
         model = ExpenseModel.from_entity(expense)
         self._session.add(model)
         return model.to_entity()
 
+    async def create_many(self, expenses: list[Expense]) -> int:
+        if not expenses:
+            return 0
+        # executemany with insertmanyvalues batching, no ORM unit of work overhead
+        await self._session.execute(
+            insert(ExpenseModel),
+            [
+                {
+                    "id": expense.id,
+                    "amount": expense.amount,
+                    "date": expense.date,
+                    "user_id": expense.user_id,
+                    "category_id": expense.category_id,
+                    "description": expense.description,
+                    "created_at": expense.created_at,
+                    "updated_at": expense.updated_at,
+                }
+                for expense in expenses
+            ],
+        )
+        return len(expenses)
+
     async def update(self, expense: Expense) -> Expense:
         model = ExpenseModel.from_entity(expense)
         await self._session.merge(model)
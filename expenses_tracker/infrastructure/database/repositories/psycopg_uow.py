@@ -1,7 +1,9 @@
+import time
 from types import TracebackType
 from typing import Type
 
 from psycopg import AsyncConnection
+from psycopg_pool import AsyncConnectionPool
 
 from expenses_tracker.domain.repositories.budget import IBudgetRepository
 from expenses_tracker.domain.repositories.category import ICategoryRepository
@@ -20,11 +22,18 @@ from expenses_tracker.infrastructure.database.repositories.expense.psycopg_expen
 from expenses_tracker.infrastructure.database.repositories.user.psycopg_user_repo import (
     PsycopgUserRepository,
 )
+from expenses_tracker.infrastructure.monitoring.metrics import (
+    DB_POOL_WAIT_TIME,
+    DB_POOL_CONNECTIONS_IN_USE,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_REQUESTS_WAITING,
+)
 
 
 class PsycopgUnitOfWork(IUnitOfWork):
-    def __init__(self, dns: str) -> None:
-        self.dns: str = dns
+    def __init__(self, pool: AsyncConnectionPool) -> None:
+        self._pool = pool
+        self._conn: AsyncConnection | None = None
         self._user_repository: PsycopgUserRepository | None = None
         self._category_repository: PsycopgCategoryRepository | None = None
         self._expense_repository: PsycopgExpenseRepository | None = None
@@ -54,8 +63,24 @@ class PsycopgUnitOfWork(IUnitOfWork):
             raise RuntimeError("Repository accessed outside of UnitOfWork context")
         return self._budget_repository
 
+    def _record_pool_gauges(self) -> None:
+        pool_name = self._pool.name
+        stats = self._pool.get_stats()
+        DB_POOL_CONNECTIONS_IN_USE.labels(pool=pool_name).set(
+            stats.get("pool_size", 0) - stats.get("pool_available", 0)
+        )
+        DB_POOL_MAX_SIZE.labels(pool=pool_name).set(self._pool.max_size)
+        DB_POOL_REQUESTS_WAITING.labels(pool=pool_name).set(
+            stats.get("requests_waiting", 0)
+        )
+
     async def __aenter__(self) -> "PsycopgUnitOfWork":
-        self._conn = await AsyncConnection.connect(self.dns)
+        start_time = time.perf_counter()
+        self._conn = await self._pool.getconn()
+        DB_POOL_WAIT_TIME.labels(pool=self._pool.name).observe(
+            time.perf_counter() - start_time
+        )
+        self._record_pool_gauges()
         self._user_repository = PsycopgUserRepository(conn=self._conn)
         self._category_repository = PsycopgCategoryRepository(conn=self._conn)
         self._expense_repository = PsycopgExpenseRepository(conn=self._conn)
@@ -68,11 +93,15 @@ class PsycopgUnitOfWork(IUnitOfWork):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> bool:
+        if not self._conn:
+            return False
         try:
             if exc_type is None:
                 await self._conn.commit()
             else:
                 await self._conn.rollback()
         finally:
-            await self._conn.close()
+            await self._pool.putconn(self._conn)
+            self._conn = None
+            self._record_pool_gauges()
         return False
@@ -1,14 +1,14 @@
 from typing import Any
 
 from fastapi import Depends, Request
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from expenses_tracker.application.dto.budget import BudgetDTO
+from expenses_tracker.application.dto.budget import BudgetDTO, BudgetUtilisationDTO
 from expenses_tracker.application.dto.category import CategoryDTO
-from expenses_tracker.application.dto.expense import ExpenseDTO
+from expenses_tracker.application.dto.expense import ExpenseDTO, ExpenseSummaryDTO
 from expenses_tracker.application.dto.user import UserDTO
 from expenses_tracker.application.interfaces.avatar_storage import IAvatarStorage
 from expenses_tracker.application.interfaces.cache_service import ICacheService
+from expenses_tracker.application.interfaces.cache_warmer import ICacheWarmer
 from expenses_tracker.application.interfaces.email_service import IEmailService
 from expenses_tracker.application.interfaces.password_hasher import IPasswordHasher
 from expenses_tracker.application.interfaces.token_service import ITokenService
@@ -39,31 +39,32 @@ def get_cache_service(request: Request) -> ICacheService[Any]:
     return request.app.state.cache_service  # type: ignore
 
 
+def get_cache_warmer(request: Request) -> ICacheWarmer | None:
+    return request.app.state.cache_warmer  # type: ignore
+
+
 def get_password_hasher(request: Request) -> IPasswordHasher:
     return request.app.state.password_hasher  # type: ignore
 
 
-def get_email_service(request: Request) -> IEmailService:
+async def get_email_service(request: Request) -> IEmailService:
+    await request.app.state.readiness.wait("email_service")
     return request.app.state.email_service  # type: ignore
 
 
-def get_avatar_storage(request: Request) -> IAvatarStorage:
+async def get_avatar_storage(request: Request) -> IAvatarStorage:
+    await request.app.state.readiness.wait("avatar_storage")
     return request.app.state.avatar_storage  # type: ignore
 
 
 async def get_sqlalchemy_uow(request: Request) -> SqlAlchemyUnitOfWork:
-    async_engine = request.app.state.sqlalchemy_engine
-    session_factory = async_sessionmaker(
-        bind=async_engine,
-        expire_on_commit=False,
-        class_=AsyncSession,
-    )
+    session_factory = request.app.state.sqlalchemy_session_factory
     return SqlAlchemyUnitOfWork(session_factory=session_factory)
 
 
 async def get_psycopg_uow(request: Request) -> PsycopgUnitOfWork:
-    dsn = request.app.state.psycopg_dsn
-    return PsycopgUnitOfWork(dns=dsn)
+    pool = request.app.state.psycopg_pool
+    return PsycopgUnitOfWork(pool=pool)
 
 
 async def get_user_use_cases(
@@ -101,18 +102,18 @@ async def get_category_use_cases(
 
 async def get_expense_use_cases(
     uow: IUnitOfWork = Depends(get_sqlalchemy_uow),
-    cache_service: ICacheService[ExpenseDTO | list[ExpenseDTO]] = Depends(
-        get_cache_service
-    ),
+    cache_service: ICacheService[
+        ExpenseDTO | list[ExpenseDTO] | list[ExpenseSummaryDTO]
+    ] = Depends(get_cache_service),
 ) -> ExpenseUseCases:
     return ExpenseUseCases(unit_of_work=uow, cache_service=cache_service)
 
 
 async def get_budget_use_cases(
     uow: IUnitOfWork = Depends(get_sqlalchemy_uow),
-    cache_service: ICacheService[BudgetDTO | list[BudgetDTO]] = Depends(
-        get_cache_service
-    ),
+    cache_service: ICacheService[
+        BudgetDTO | list[BudgetDTO] | list[BudgetUtilisationDTO]
+    ] = Depends(get_cache_service),
 ) -> BudgetUseCases:
     return BudgetUseCases(unit_of_work=uow, cache_service=cache_service)
 
@@ -123,6 +124,7 @@ async def get_auth_user_use_cases(
     password_hasher: IPasswordHasher = Depends(get_password_hasher),
     email_service: IEmailService = Depends(get_email_service),
     cache_service: ICacheService[TokenPayload] = Depends(get_cache_service),
+    cache_warmer: ICacheWarmer | None = Depends(get_cache_warmer),
 ) -> AuthUserUseCases:
     return AuthUserUseCases(
         unit_of_work=uow,
@@ -130,14 +132,12 @@ async def get_auth_user_use_cases(
         token_service=token_service,
         cache_service=cache_service,
         email_service=email_service,
+        cache_warmer=cache_warmer,
     )
 
 
 async def get_oauth_user_use_cases(
     uow: IUnitOfWork = Depends(get_sqlalchemy_uow),
     token_service: ITokenService = Depends(get_token_service),
-    password_hasher: IPasswordHasher = Depends(get_password_hasher),
 ) -> OAuthUserUseCases:
-    return OAuthUserUseCases(
-        unit_of_work=uow, password_hasher=password_hasher, token_service=token_service
-    )
+    return OAuthUserUseCases(unit_of_work=uow, token_service=token_service)
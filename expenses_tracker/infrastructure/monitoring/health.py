@@ -0,0 +1,124 @@
+import asyncio
+import time
+from collections.abc import Callable, Collection, Coroutine, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+import structlog
+
+from expenses_tracker.core.settings import get_settings
+from expenses_tracker.infrastructure.monitoring.metrics import POOL_SATURATION
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CheckResult:
+    ok: bool
+    latency_ms: float
+    # only the exception type, the response is public
+    error: str | None = None
+    # a failed optional check is reported but doesn't fail the report
+    required: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class HealthReport:
+    checked_at: datetime
+    checks: dict[str, CheckResult]
+    # in_use, idle and max connections and the in_use / max saturation,
+    # max and saturation are None for an unbounded pool
+    pools: dict[str, dict[str, float | str | None]]
+
+    @property
+    def healthy(self) -> bool:
+        return all(result.ok for result in self.checks.values() if result.required)
+
+
+class HealthChecker:
+    """
+    Runs every probe concurrently, each under `timeout_seconds`, and reuses
+    the report for `cache_seconds` so frequent health checks don't add load.
+    A probe that is still running from an earlier check is waited on again
+    instead of being started a second time. The probes named in `optional`
+    are reported without affecting `HealthReport.healthy`.
+    """
+
+    def __init__(
+        self,
+        probes: dict[str, Callable[[], Coroutine[Any, Any, None]]],
+        pools: dict[str, Callable[[], Mapping[str, int | None]]],
+        timeout_seconds: float | None = None,
+        cache_seconds: float | None = None,
+        optional: Collection[str] = (),
+    ) -> None:
+        self._probes = probes
+        self._optional = frozenset(optional)
+        self._pools = pools
+        self._timeout_seconds = (
+            timeout_seconds or get_settings().health_check_timeout_seconds
+        )
+        self._cache_seconds = (
+            get_settings().health_check_cache_seconds
+            if cache_seconds is None
+            else cache_seconds
+        )
+        self._running: dict[str, asyncio.Task[None]] = {}
+        self._report: HealthReport | None = None
+        self._expires_at = 0.0
+
+    async def check(self) -> HealthReport:
+        if self._report is not None and time.monotonic() < self._expires_at:
+            return self._report
+        results = await asyncio.gather(*map(self._probe, self._probes))
+        report = HealthReport(
+            checked_at=datetime.now(timezone.utc),
+            checks=dict(zip(self._probes, results)),
+            pools={name: self._pool_stats(name) for name in self._pools},
+        )
+        self._report = report
+        self._expires_at = time.monotonic() + self._cache_seconds
+        return report
+
+    async def _probe(self, name: str) -> CheckResult:
+        task = self._running.get(name)
+        if task is None or task.done():
+            task = asyncio.create_task(self._probes[name]())
+            # the failure is reported by `_probe`
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._running[name] = task
+        started = time.perf_counter()
+        error = None
+        try:
+            await asyncio.wait_for(asyncio.shield(task), self._timeout_seconds)
+        except Exception as e:
+            error = type(e).__name__
+            logger.bind(check=name, error=repr(e)).warning("Health check failed")
+        latency_ms = round((time.perf_counter() - started) * 1000, 3)
+        return CheckResult(
+            ok=error is None,
+            latency_ms=latency_ms,
+            error=error,
+            required=name not in self._optional,
+        )
+
+    def _pool_stats(self, name: str) -> dict[str, float | str | None]:
+        try:
+            stats: dict[str, float | str | None] = dict(self._pools[name]())
+        except Exception as e:
+            logger.bind(pool=name, error=repr(e)).warning("Pool stats failed")
+            return {"error": type(e).__name__}
+        in_use, max_size = stats.get("in_use"), stats.get("max")
+        if isinstance(in_use, int) and isinstance(max_size, int) and max_size > 0:
+            stats["saturation"] = round(in_use / max_size, 3)
+            POOL_SATURATION.labels(pool=name).set(in_use / max_size)
+        else:
+            stats["saturation"] = None
+        return stats
+
+    async def close(self) -> None:
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 REQUEST_COUNT = Counter(
     "http_requests_total",
@@ -11,3 +11,99 @@ REQUEST_LATENCY = Histogram(
     "HTTP request latency in seconds",
     ["method", "endpoint"],
 )
+
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled",
+    ["method"],
+)
+
+REQUEST_SIZE = Histogram(
+    "http_request_size_bytes",
+    "HTTP request body size in bytes",
+    ["method", "endpoint"],
+    buckets=(0, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size in bytes",
+    ["method", "endpoint"],
+    buckets=(0, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+
+DB_POOL_WAIT_TIME = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a connection from the database pool",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+DB_POOL_CONNECTIONS_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out from the database pool",
+    ["pool"],
+)
+
+DB_POOL_MAX_SIZE = Gauge(
+    "db_pool_max_size",
+    "Maximum amount of connections the database pool can open",
+    ["pool"],
+)
+
+DB_POOL_REQUESTS_WAITING = Gauge(
+    "db_pool_requests_waiting",
+    "Requests currently waiting for a connection from the database pool",
+    ["pool"],
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by tier and result",
+    ["tier", "result"],
+)
+
+CACHE_LOCAL_ENTRIES = Gauge(
+    "cache_local_entries",
+    "Entries currently held in the in-process cache",
+)
+
+CACHE_INVALIDATIONS_RECEIVED = Counter(
+    "cache_invalidations_received_total",
+    "Invalidation messages received from other workers",
+)
+
+CACHE_TOMBSTONE_HITS = Counter(
+    "cache_tombstone_hits_total",
+    "Lookups of missing entities answered by a cached tombstone",
+    ["entity"],
+)
+
+CACHE_WARMUPS = Counter(
+    "cache_warmups_total",
+    "Background cache warmups after login or refresh by result",
+    ["result"],
+)
+
+PASSWORD_HASHER_QUEUE_DEPTH = Gauge(
+    "password_hasher_queue_depth",
+    "bcrypt hash and verify calls queued or running on the worker pool",
+)
+
+PROFILES = Counter(
+    "profiles_total",
+    "Sampled request profiles by result",
+    ["result"],
+)
+
+SERVICE_READY = Gauge(
+    "service_ready",
+    "1 once a service initialised in the background is ready",
+    ["service"],
+)
+
+POOL_SATURATION = Gauge(
+    "pool_saturation",
+    "Connections in use over the pool maximum, updated by the readiness check",
+    ["pool"],
+)
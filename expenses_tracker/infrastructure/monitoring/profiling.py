@@ -0,0 +1,182 @@
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import reduce
+from typing import Any
+
+import structlog
+from pyinstrument.session import Session
+
+from expenses_tracker.application.interfaces.cache_service import ICacheService
+from expenses_tracker.core.settings import get_settings
+from expenses_tracker.infrastructure.monitoring.metrics import PROFILES
+
+logger = structlog.getLogger(__name__)
+
+PROFILES_CACHE_TAG = "profiles"
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileRecord:
+    id: str
+    method: str
+    path: str
+    route: str
+    status_code: int
+    started_at: datetime
+    duration_seconds: float
+    # pyinstrument `Session.to_json()`, rendered only when it is viewed
+    session: dict[str, Any]
+
+
+class RedisProfilingStorage:
+    def __init__(
+        self, cache_service: ICacheService[ProfileRecord], ttl_hours: int | None = None
+    ) -> None:
+        self.ttl_seconds = (ttl_hours or get_settings().profiling_ttl_hours) * 3600
+        self.cache_service = cache_service
+
+    @staticmethod
+    def _profile_cache_key(profile_id: str) -> str:
+        return f"profile:{profile_id}"
+
+    @staticmethod
+    def _route_cache_tag(route: str) -> str:
+        return f"{PROFILES_CACHE_TAG}:route:{route}"
+
+    async def add_profile(self, record: ProfileRecord) -> None:
+        await self.cache_service.set(
+            key=self._profile_cache_key(record.id),
+            value=record,
+            ttl=self.ttl_seconds,
+            tags=[PROFILES_CACHE_TAG, self._route_cache_tag(record.route)],
+        )
+        logger.bind(profile_id=record.id).debug("Added profile to Redis")
+
+    async def get_profile(self, profile_id: str) -> ProfileRecord | None:
+        return await self.cache_service.get(
+            key=self._profile_cache_key(profile_id), serializer=ProfileRecord
+        )
+
+    async def get_profiles(
+        self,
+        since: datetime,
+        routes: list[str] | None = None,
+        route_prefix: str | None = None,
+        limit: int | None = None,
+    ) -> list[ProfileRecord]:
+        """Newest first, at most `limit` of them are read"""
+        limit = limit or get_settings().profiling_aggregate_max_profiles
+        tags = [self._route_cache_tag(route) for route in routes or ()]
+        keys: list[str] = []
+        for tag in tags or [PROFILES_CACHE_TAG]:
+            # every profile has the same ttl, members come oldest first
+            keys.extend((await self.cache_service.get_tag_members(tag))[-limit:])
+        records = [
+            record
+            for record in await self.cache_service.get_many(keys, ProfileRecord)
+            if record is not None
+            and record.started_at >= since
+            and (route_prefix is None or record.route.startswith(route_prefix))
+        ]
+        records.sort(key=lambda record: record.started_at, reverse=True)
+        return records[:limit]
+
+    async def delete_profile(self, profile_id: str) -> None:
+        await self.cache_service.delete(key=self._profile_cache_key(profile_id))
+
+    async def get_stats(self) -> dict[str, int | list[str]]:
+        keys = await self.cache_service.get_tag_members(PROFILES_CACHE_TAG)
+        return {
+            "keys": [key.split("profile:")[1] for key in keys],
+            "total_profiles": len(keys),
+            "ttl_hours": self.ttl_seconds // 3600,
+        }
+
+    async def clear_all_profiles(self) -> None:
+        await self.cache_service.invalidate_tags(tags=[PROFILES_CACHE_TAG])
+        return None
+
+
+def _frame_label(identifier: str) -> str:
+    # pyinstrument identifiers are "function\x00path\x00line", attributes
+    # follow after \x01. Synthetic frames such as "[await]" or "[self]" are
+    # a bare name
+    parts = identifier.split("\x01", 1)[0].split("\x00")
+    if len(parts) < 3:
+        return parts[0].replace(";", ",")
+    function, path, line = parts[:3]
+    if path == "<thread>":
+        # the thread id would split identical stacks apart
+        return function
+    return f"{function} ({path}:{line})".replace(";", ",")
+
+
+def collapse_stacks(records: list[ProfileRecord]) -> str:
+    """
+    Merged samples in the collapsed stack format read by flamegraph.pl and
+    speedscope, one "frame;frame;frame microseconds" line per distinct stack.
+    Stacks are rooted at "METHOD route" so every route is its own subtree.
+    """
+    weights: Counter[str] = Counter()
+    for record in records:
+        root = f"{record.method} {record.route}"
+        for call_stack, seconds in record.session["frame_records"]:
+            weights[";".join([root, *map(_frame_label, call_stack)])] += seconds
+    return "\n".join(
+        f"{stack} {round(seconds * 1e6)}" for stack, seconds in sorted(weights.items())
+    )
+
+
+def combine_sessions(records: list[ProfileRecord]) -> Session:
+    sessions = (Session.from_json(record.session) for record in records)
+    return reduce(Session.combine, sessions)  # type: ignore[no-any-return]
+
+
+class ProfileRecorder:
+    """
+    Serialises and stores sampled sessions on a background task, so the
+    profiled request only pays for the sampling itself. At most
+    `max_queue_size` profiles wait to be stored, anything over it is dropped.
+    """
+
+    def __init__(
+        self, storage: RedisProfilingStorage, max_queue_size: int | None = None
+    ) -> None:
+        self._storage = storage
+        self._queue: asyncio.Queue[tuple[ProfileRecord, Session]] = asyncio.Queue(
+            maxsize=max_queue_size or get_settings().profiling_queue_max_size
+        )
+        self._worker: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._worker = asyncio.create_task(self._run())
+
+    def submit(self, record: ProfileRecord, session: Session) -> None:
+        """`record.session` is filled in from `session` by the worker"""
+        try:
+            self._queue.put_nowait((record, session))
+        except asyncio.QueueFull:
+            PROFILES.labels(result="dropped").inc()
+            logger.bind(profile_id=record.id).debug("Profile dropped")
+
+    async def _run(self) -> None:
+        while True:
+            record, session = await self._queue.get()
+            try:
+                data = await asyncio.to_thread(session.to_json)
+                await self._storage.add_profile(replace(record, session=data))
+                PROFILES.labels(result="recorded").inc()
+            except Exception as e:
+                PROFILES.labels(result="failed").inc()
+                logger.bind(profile_id=record.id, error=str(e)).warning(
+                    "Failed to save profile"
+                )
+            finally:
+                self._queue.task_done()
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
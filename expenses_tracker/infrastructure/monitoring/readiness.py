@@ -0,0 +1,122 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+import structlog
+
+from expenses_tracker.core.settings import get_settings
+from expenses_tracker.infrastructure.monitoring.metrics import SERVICE_READY
+
+logger = structlog.get_logger(__name__)
+
+
+class ServiceNotReady(Exception):
+    pass
+
+
+class ReadinessTracker:
+    """
+    Initialises the services that are not needed to start serving in the
+    background, all of them concurrently. A request that needs one waits for
+    it with `wait`. An initialisation that failed is retried with exponential
+    backoff, or right away by the next `wait`.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float | None = None,
+        retry_seconds: float | None = None,
+        retry_max_seconds: float | None = None,
+    ) -> None:
+        self._timeout_seconds = (
+            timeout_seconds or get_settings().service_init_timeout_seconds
+        )
+        self._retry_seconds = retry_seconds or get_settings().service_init_retry_seconds
+        self._retry_max_seconds = (
+            retry_max_seconds or get_settings().service_init_retry_max_seconds
+        )
+        self._initializers: dict[str, Callable[[], Awaitable[None]]] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._failures: dict[str, int] = {}
+        self._retries: dict[str, asyncio.TimerHandle] = {}
+        self._closed = False
+
+    def start(self, name: str, initializer: Callable[[], Awaitable[None]]) -> None:
+        self._initializers[name] = initializer
+        self._run(name)
+
+    def _run(self, name: str) -> asyncio.Task[None]:
+        retry = self._retries.pop(name, None)
+        if retry is not None:
+            retry.cancel()
+        task = asyncio.create_task(self._initialize(name))
+        task.add_done_callback(lambda t: self._schedule_retry(name, t))
+        self._tasks[name] = task
+        return task
+
+    def _schedule_retry(self, name: str, task: asyncio.Task[None]) -> None:
+        # the failure is logged by `_initialize`, waiters get it from `wait`
+        if task.cancelled() or task.exception() is None:
+            self._failures.pop(name, None)
+            return
+        if self._closed or self._tasks.get(name) is not task:
+            return
+        failures = self._failures.get(name, 0) + 1
+        self._failures[name] = failures
+        delay = min(self._retry_seconds * 2 ** (failures - 1), self._retry_max_seconds)
+        logger.bind(service=name, delay=delay).info(
+            "Service initialization retry scheduled"
+        )
+        self._retries[name] = asyncio.get_running_loop().call_later(
+            delay, self._run, name
+        )
+
+    async def _initialize(self, name: str) -> None:
+        SERVICE_READY.labels(service=name).set(0)
+        started = time.perf_counter()
+        try:
+            await self._initializers[name]()
+        except Exception as e:
+            logger.bind(service=name, error=str(e)).error(
+                "Service initialization failed"
+            )
+            raise
+        SERVICE_READY.labels(service=name).set(1)
+        logger.bind(service=name, seconds=round(time.perf_counter() - started, 3)).info(
+            "Service initialized"
+        )
+
+    async def wait(self, name: str) -> None:
+        task = self._tasks[name]
+        if task.done() and (task.cancelled() or task.exception() is not None):
+            task = self._run(name)
+        try:
+            # shielded, a waiter that times out leaves the initialisation running
+            await asyncio.wait_for(asyncio.shield(task), self._timeout_seconds)
+        except Exception as e:
+            raise ServiceNotReady(f"Service {name} is not available") from e
+
+    def status(self) -> dict[str, str]:
+        statuses = {}
+        for name, task in self._tasks.items():
+            if not task.done():
+                statuses[name] = "starting"
+            elif task.cancelled() or task.exception() is not None:
+                statuses[name] = "failed"
+            else:
+                statuses[name] = "ready"
+        return statuses
+
+    @property
+    def ready(self) -> bool:
+        return all(status == "ready" for status in self.status().values())
+
+    async def close(self) -> None:
+        self._closed = True
+        for retry in self._retries.values():
+            retry.cancel()
+        self._retries.clear()
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
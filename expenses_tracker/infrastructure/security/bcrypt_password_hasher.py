@@ -1,11 +1,54 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
 import bcrypt
 
 from expenses_tracker.application.interfaces.password_hasher import IPasswordHasher
+from expenses_tracker.core.settings import get_settings
+from expenses_tracker.domain.entities.user import UNUSABLE_PASSWORD
+from expenses_tracker.infrastructure.monitoring.metrics import (
+    PASSWORD_HASHER_QUEUE_DEPTH,
+)
+
+T = TypeVar("T")
 
 
 class BcryptPasswordHasher(IPasswordHasher):
-    def hash(self, password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    """
+    bcrypt releases the GIL, so hashing runs on a thread pool of
+    `max_workers` and the event loop keeps serving other requests
+    """
+
+    def __init__(self, rounds: int | None = None, max_workers: int | None = None):
+        settings = get_settings()
+        self._rounds = rounds or settings.bcrypt_rounds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or settings.bcrypt_max_workers,
+            thread_name_prefix="bcrypt",
+        )
+
+    async def _run(self, func: Callable[[], T]) -> T:
+        PASSWORD_HASHER_QUEUE_DEPTH.inc()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, func
+            )
+        finally:
+            PASSWORD_HASHER_QUEUE_DEPTH.dec()
+
+    async def hash(self, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=self._rounds)
+        hashed = await self._run(lambda: bcrypt.hashpw(password.encode("utf-8"), salt))
+        return hashed.decode("utf-8")
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        if hashed.startswith(UNUSABLE_PASSWORD):
+            return False
+        return await self._run(
+            lambda: bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+        )
 
-    def verify(self, password: str, hashed: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,4 +1,7 @@
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from hashlib import blake2b
 from uuid import uuid4
 
 import jwt
@@ -11,6 +14,29 @@ from expenses_tracker.domain.exceptions.auth import TokenExpired, InvalidToken
 
 
 class JWTTokenService(ITokenService):
+    """
+    Verified payloads are kept in a bounded LRU keyed by the token digest
+    until their `exp`, a client resending the same token skips the HMAC
+    check. Invalid tokens are never cached.
+    """
+
+    def __init__(
+        self,
+        secret_key: str | None = None,
+        algorithm: str | None = None,
+        cache_max_size: int | None = None,
+    ) -> None:
+        settings = get_settings()
+        self._algorithm = algorithm or settings.algorithm
+        self._algorithms = [self._algorithm]
+        self._key = jwt.get_algorithm_by_name(self._algorithm).prepare_key(
+            secret_key or settings.secret_key
+        )
+        self._cache_max_size = (
+            settings.token_cache_max_size if cache_max_size is None else cache_max_size
+        )
+        self._cache: OrderedDict[bytes, TokenPayload] = OrderedDict()
+
     def create_token(
         self,
         subject: str,
@@ -30,19 +56,30 @@ class JWTTokenService(ITokenService):
             "jti": jti or str(uuid4()),
             "type": token_type.value,
         }
-        return jwt.encode(
-            payload,
-            get_settings().secret_key,
-            algorithm=get_settings().algorithm,
-        )
+        return jwt.encode(payload, self._key, algorithm=self._algorithm)
 
     def decode_token(self, token: str) -> TokenPayload:
+        if not self._cache_max_size:
+            return self._verify(token)
+
+        digest = blake2b(token.encode(), digest_size=16).digest()
+        payload = self._cache.get(digest)
+        if payload is not None:
+            if payload.exp <= time.time():
+                del self._cache[digest]
+                raise TokenExpired("Token has expired")
+            self._cache.move_to_end(digest)
+            return payload
+
+        payload = self._verify(token)
+        self._cache[digest] = payload
+        if len(self._cache) > self._cache_max_size:
+            self._cache.popitem(last=False)
+        return payload
+
+    def _verify(self, token: str) -> TokenPayload:
         try:
-            payload = jwt.decode(
-                token,
-                get_settings().secret_key,
-                algorithms=[get_settings().algorithm],
-            )
+            payload = jwt.decode(token, self._key, algorithms=self._algorithms)
             payload["type"] = TokenType(payload["type"])
             return TokenPayload(**payload)
         except jwt.ExpiredSignatureError as e:
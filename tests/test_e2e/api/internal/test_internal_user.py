@@ -9,6 +9,18 @@ class TestInternalUserApi:
         assert response.status_code == 200
         assert response.json() == {"status": "OK"}
 
+    async def test_health_ready_probes_dependencies(self, async_client):
+        response = await async_client.get("/api/health/ready")
+        body = response.json()
+
+        assert response.status_code == 200
+        assert body["checks"]["postgres"]["ok"] is True
+        assert body["checks"]["redis"]["ok"] is True
+        # MinIO may still be initialising in the background
+        assert body["checks"]["minio"]["required"] is False
+        assert set(body["pools"]) == {"sqlalchemy", "psycopg", "redis"}
+        assert 0 <= body["pools"]["sqlalchemy"]["saturation"] <= 1
+
     async def test_docs(self, async_client):
         response = await async_client.get("/api/internal/docs")
 
@@ -83,6 +95,16 @@ class TestInternalUserApi:
         assert response.status_code == 404
         assert response.json()["detail"].startswith("User with id")
 
+    async def test_metrics_labelled_by_route_template(self, async_client):
+        user_id = uuid4()
+        await async_client.get(f"/api/internal/users/get/{user_id}")
+
+        response = await async_client.get("/api/metrics")
+
+        assert response.status_code == 200
+        assert 'endpoint="/api/internal/users/get/{user_id}"' in response.text
+        assert str(user_id) not in response.text
+
     async def test_get_all_users_success(
         self, async_client, unique_user_create_request
     ):
@@ -0,0 +1,78 @@
+from fastapi import status
+
+from expenses_tracker.core.settings import get_settings
+
+
+class TestExpenseApi:
+    async def _register_user(self, async_client, user_create_request):
+        register_response = await async_client.post(
+            "/api/auth/register", json=user_create_request.model_dump()
+        )
+        assert register_response.status_code == status.HTTP_200_OK, (
+            f"Register failed: {register_response.text}"
+        )
+        access_token = register_response.cookies.get("access_token")
+        if not access_token:
+            response_data = register_response.json()
+            access_token = response_data.get("access_token")
+        return access_token
+
+    async def _get_auth_headers(self, async_client, access_token=None):
+        headers = {"Content-Type": "text/csv"}
+        if not access_token:
+            access_token = async_client.cookies.get("access_token")
+        if access_token:
+            headers["Authorization"] = f"Bearer {access_token}"
+        csrf_token = async_client.cookies.get("csrf_token")
+        if csrf_token:
+            headers["X-CSRF-Token"] = csrf_token
+        return headers
+
+    async def test_import_csv_rejects_non_utf8(
+        self, async_client, unique_user_create_request
+    ):
+        access_token = await self._register_user(
+            async_client, unique_user_create_request
+        )
+        response = await async_client.post(
+            "/api/expenses/import-csv",
+            content="amount,date,category_id,description\n1,2025-01-01,,Café\n".encode(
+                "latin-1"
+            ),
+            headers=await self._get_auth_headers(async_client, access_token),
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "CSV must be UTF-8 encoded"
+
+    async def test_import_csv_rejects_oversized_body(
+        self, async_client, unique_user_create_request
+    ):
+        access_token = await self._register_user(
+            async_client, unique_user_create_request
+        )
+        max_bytes = get_settings().expenses_import_max_bytes
+        response = await async_client.post(
+            "/api/expenses/import-csv",
+            content=b"amount,date,category_id,description\n" + b"x" * max_bytes,
+            headers=await self._get_auth_headers(async_client, access_token),
+        )
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    async def test_import_json_rejects_oversized_body(
+        self, async_client, unique_user_create_request
+    ):
+        access_token = await self._register_user(
+            async_client, unique_user_create_request
+        )
+        max_bytes = get_settings().expenses_import_max_bytes
+        headers = await self._get_auth_headers(async_client, access_token)
+        headers["Content-Type"] = "application/json"
+        response = await async_client.post(
+            "/api/expenses/import",
+            content=b'[{"description": "' + b"x" * max_bytes + b'"}]',
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
@@ -3,6 +3,7 @@ from datetime import datetime, timezone, timedelta
 import redis.asyncio as redis
 from psycopg import AsyncConnection
 from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 from pytest_asyncio import fixture
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from testcontainers.postgres import PostgresContainer
@@ -94,6 +95,16 @@ async def async_connection(postgres_container_sync_url):
     await conn.close()
 
 
+@fixture
+async def psycopg_pool(postgres_container_sync_url):
+    pool = AsyncConnectionPool(
+        conninfo=postgres_container_sync_url, min_size=1, max_size=5, open=False
+    )
+    await pool.open()
+    yield pool
+    await pool.close()
+
+
 @fixture
 async def async_engine(postgres_container_async_url):
     engine = create_async_engine(postgres_container_async_url, echo=False)
@@ -395,7 +406,9 @@ def unique_budget_update_dto(unique_budget_entity):
 def password_hasher(request):
     match request.param:
         case "bcrypt_hasher":
-            return BcryptPasswordHasher()
+            hasher = BcryptPasswordHasher()
+            yield hasher
+            hasher.close()
         case _:
             raise ValueError(f"Unknown password_hasher {request.param}")
 
@@ -410,14 +423,14 @@ def token_service(request):
 
 
 @fixture(params=["dummy", "sqlalchemy", "psycopg"])
-def unit_of_work(request, async_session_factory, postgres_container_sync_url):
+def unit_of_work(request, async_session_factory, psycopg_pool):
     match request.param:
         case "dummy":
             return DummyUnitOfWork()
         case "sqlalchemy":
             return SqlAlchemyUnitOfWork(session_factory=async_session_factory)
         case "psycopg":
-            return PsycopgUnitOfWork(dns=postgres_container_sync_url)
+            return PsycopgUnitOfWork(pool=psycopg_pool)
         case _:
             raise ValueError(f"Unknown repo {request.param}")
 
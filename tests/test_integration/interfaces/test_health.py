@@ -0,0 +1,128 @@
+import asyncio
+
+from expenses_tracker.infrastructure.monitoring.health import HealthChecker
+
+
+class TestHealthChecker:
+    async def test_report_is_reused_within_cache_interval(self):
+        calls = 0
+
+        async def probe():
+            nonlocal calls
+            calls += 1
+
+        checker = HealthChecker(
+            probes={"postgres": probe}, pools={}, timeout_seconds=1, cache_seconds=60
+        )
+
+        first = await checker.check()
+        second = await checker.check()
+
+        assert calls == 1
+        assert first is second
+        assert first.healthy is True
+        assert first.checks["postgres"].ok is True
+
+    async def test_failed_and_timed_out_probes(self):
+        async def failing():
+            raise ConnectionRefusedError("10.0.0.1:6379")
+
+        async def hanging():
+            await asyncio.sleep(10)
+
+        checker = HealthChecker(
+            probes={"redis": failing, "minio": hanging},
+            pools={},
+            timeout_seconds=0.05,
+            cache_seconds=0,
+        )
+
+        report = await checker.check()
+
+        assert report.healthy is False
+        assert report.checks["redis"].error == "ConnectionRefusedError"
+        assert report.checks["minio"].error == "TimeoutError"
+        await checker.close()
+
+    async def test_failed_optional_probe_is_reported_but_healthy(self):
+        async def probe():
+            pass
+
+        async def failing():
+            raise ConnectionRefusedError("minio:9000")
+
+        checker = HealthChecker(
+            probes={"postgres": probe, "minio": failing},
+            pools={},
+            timeout_seconds=1,
+            optional={"minio"},
+        )
+
+        report = await checker.check()
+
+        assert report.healthy is True
+        assert report.checks["postgres"].required is True
+        assert report.checks["minio"].ok is False
+        assert report.checks["minio"].required is False
+
+    async def test_running_probe_is_not_started_again(self):
+        started = 0
+
+        async def hanging():
+            nonlocal started
+            started += 1
+            await asyncio.sleep(10)
+
+        checker = HealthChecker(
+            probes={"postgres": hanging},
+            pools={},
+            timeout_seconds=0.05,
+            cache_seconds=0,
+        )
+
+        await checker.check()
+        await checker.check()
+
+        assert started == 1
+        await checker.close()
+
+    async def test_pool_saturation(self):
+        async def probe():
+            pass
+
+        checker = HealthChecker(
+            probes={"postgres": probe},
+            pools={"sqlalchemy": lambda: {"in_use": 15, "idle": 5, "max": 60}},
+            timeout_seconds=1,
+        )
+
+        report = await checker.check()
+
+        assert report.pools["sqlalchemy"] == {
+            "in_use": 15,
+            "idle": 5,
+            "max": 60,
+            "saturation": 0.25,
+        }
+
+    async def test_unbounded_and_failing_pools(self):
+        async def probe():
+            pass
+
+        def broken():
+            raise AttributeError("get_connection_count")
+
+        checker = HealthChecker(
+            probes={"redis": probe},
+            pools={
+                "redis": lambda: {"in_use": 3, "idle": 1, "max": None},
+                "psycopg": broken,
+            },
+            timeout_seconds=1,
+        )
+
+        report = await checker.check()
+
+        assert report.healthy is True
+        assert report.pools["redis"]["saturation"] is None
+        assert report.pools["psycopg"] == {"error": "AttributeError"}
@@ -1,9 +1,29 @@
+from expenses_tracker.domain.entities.user import UNUSABLE_PASSWORD
+from expenses_tracker.infrastructure.security.bcrypt_password_hasher import (
+    BcryptPasswordHasher,
+)
+
+
 class TestPasswordHasher:
-    def test_password_hasher_hash_and_verify_success(self, password_hasher):
+    async def test_password_hasher_hash_and_verify_success(self, password_hasher):
         hasher = password_hasher
         raw_password = "super-secret"
-        hashed = hasher.hash(raw_password)
+        hashed = await hasher.hash(raw_password)
 
         assert hashed != raw_password
-        assert hasher.verify(raw_password, hashed) is True
-        assert hasher.verify("wrong-password", hashed) is False
+        assert await hasher.verify(raw_password, hashed) is True
+        assert await hasher.verify("wrong-password", hashed) is False
+
+    async def test_password_hasher_uses_configured_rounds(self):
+        hasher = BcryptPasswordHasher(rounds=4, max_workers=1)
+
+        hashed = await hasher.hash("super-secret")
+        hasher.close()
+
+        assert hashed.startswith("$2b$04$")
+
+    async def test_password_hasher_rejects_unusable_password(self, password_hasher):
+        assert await password_hasher.verify("", UNUSABLE_PASSWORD) is False
+        assert (
+            await password_hasher.verify(UNUSABLE_PASSWORD, UNUSABLE_PASSWORD) is False
+        )
@@ -0,0 +1,129 @@
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from pyinstrument import Profiler
+from pytest_asyncio import fixture
+
+from expenses_tracker.infrastructure.cache.redis_cache_service import RedisService
+from expenses_tracker.infrastructure.monitoring.profiling import (
+    ProfileRecord,
+    ProfileRecorder,
+    RedisProfilingStorage,
+    collapse_stacks,
+)
+
+
+def _profile(route="/api/expenses/get/{expense_id}", started_at=None):
+    profiler = Profiler(interval=0.001)
+    profiler.start()
+    sum(range(1_000_000))
+    session = profiler.stop()
+    record = ProfileRecord(
+        id=str(uuid4()),
+        method="GET",
+        path="/api/expenses/get/1",
+        route=route,
+        status_code=200,
+        started_at=started_at or datetime.now(timezone.utc),
+        duration_seconds=session.duration,
+        session={},
+    )
+    return record, session
+
+
+@fixture
+async def storage(redis_container):
+    cache_service = RedisService[ProfileRecord](url=redis_container["dsn"])
+    storage = RedisProfilingStorage(cache_service=cache_service)
+    yield storage
+    await storage.clear_all_profiles()
+    await cache_service.close()
+
+
+class TestProfileRecorder:
+    async def test_recorder_stores_session(self, storage):
+        recorder = ProfileRecorder(storage=storage)
+        recorder.start()
+        record, session = _profile()
+
+        recorder.submit(record, session)
+        await asyncio.sleep(0.2)
+        await recorder.close()
+
+        stored = await storage.get_profile(record.id)
+        assert stored is not None
+        assert stored.route == record.route
+        assert stored.session["sample_count"] == session.sample_count
+
+    async def test_recorder_drops_over_queue_size(self, storage):
+        # not started, nothing leaves the queue
+        recorder = ProfileRecorder(storage=storage, max_queue_size=1)
+        first, second = _profile(), _profile()
+
+        recorder.submit(*first)
+        recorder.submit(*second)
+        recorder.start()
+        await asyncio.sleep(0.2)
+        await recorder.close()
+
+        assert await storage.get_profile(first[0].id) is not None
+        assert await storage.get_profile(second[0].id) is None
+
+
+class TestProfileAggregation:
+    async def _store(self, storage, route, started_at=None):
+        record, session = _profile(route=route, started_at=started_at)
+        record = replace(record, session=session.to_json())
+        await storage.add_profile(record)
+        return record
+
+    async def test_get_profiles_filters_by_route_and_window(self, storage):
+        since = datetime.now(timezone.utc) - timedelta(minutes=5)
+        expense = await self._store(storage, "/api/expenses/get/{expense_id}")
+        budget = await self._store(storage, "/api/budgets/get/{budget_id}")
+        await self._store(
+            storage, "/api/expenses/get/{expense_id}", since - timedelta(minutes=1)
+        )
+
+        assert [r.id for r in await storage.get_profiles(since=since)] == [
+            budget.id,
+            expense.id,
+        ]
+        by_route = await storage.get_profiles(
+            since=since, routes=["/api/budgets/get/{budget_id}"]
+        )
+        assert [r.id for r in by_route] == [budget.id]
+        by_prefix = await storage.get_profiles(
+            since=since, route_prefix="/api/expenses"
+        )
+        assert [r.id for r in by_prefix] == [expense.id]
+
+    async def test_collapse_stacks_with_await_frames(self):
+        profiler = Profiler(interval=0.001, async_mode="enabled")
+        profiler.start()
+        for _ in range(20):
+            await asyncio.sleep(0.005)
+        session = profiler.stop()
+        record, _ = _profile()
+        record = replace(record, session=session.to_json())
+
+        collapsed = collapse_stacks([record])
+
+        assert "[await]" in collapsed
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed.splitlines())
+
+    async def test_collapse_stacks_roots_every_route(self, storage):
+        since = datetime.now(timezone.utc) - timedelta(minutes=5)
+        await self._store(storage, "/api/expenses/get/{expense_id}")
+        await self._store(storage, "/api/budgets/get/{budget_id}")
+
+        collapsed = collapse_stacks(await storage.get_profiles(since=since))
+
+        lines = collapsed.splitlines()
+        assert {line.split(";")[0] for line in lines} == {
+            "GET /api/expenses/get/{expense_id}",
+            "GET /api/budgets/get/{budget_id}",
+        }
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
@@ -1,8 +1,15 @@
 import asyncio
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import uuid4
 
+import pytest
 from pytest_asyncio import fixture
 
+from expenses_tracker.application.dto.budget import BudgetDTO
+from expenses_tracker.application.interfaces.cache_service import TOMBSTONE
+from expenses_tracker.core.constants import BudgetPeriod
+from expenses_tracker.infrastructure.cache.codec import OrjsonCodec
 from expenses_tracker.infrastructure.cache.redis_cache_service import RedisService
 
 
@@ -45,16 +52,89 @@ class TestRedisService:
 
         assert cached is None
 
-    async def test_delete_keys_by_pattern(self, redis_service: RedisService[DummyDTO]):
-        dto1 = DummyDTO(id=3, name="a")
-        dto2 = DummyDTO(id=4, name="b")
-        await redis_service.set("pattern:3", dto1)
-        await redis_service.set("pattern:4", dto2)
+    async def test_invalidate_tags(self, redis_service: RedisService[DummyDTO]):
+        await redis_service.set("tagged:3", DummyDTO(id=3, name="a"), tags=["t1"])
+        await redis_service.set(
+            "tagged:4", DummyDTO(id=4, name="b"), ttl=10, tags=["t1", "t2"]
+        )
+        await redis_service.set("tagged:5", DummyDTO(id=5, name="c"), tags=["t2"])
 
-        await redis_service.delete_keys_by_pattern("pattern")
+        await redis_service.invalidate_tags(["t1"])
 
-        assert await redis_service.get("pattern:3", DummyDTO) is None
-        assert await redis_service.get("pattern:4", DummyDTO) is None
+        assert await redis_service.get("tagged:3", DummyDTO) is None
+        assert await redis_service.get("tagged:4", DummyDTO) is None
+        assert await redis_service.get("tagged:5", DummyDTO) is not None
+        assert await redis_service.get_tag_members("t1") == []
+
+    async def test_get_tag_members_skips_expired_and_deleted(
+        self, redis_service: RedisService[DummyDTO]
+    ):
+        await redis_service.set("members:1", DummyDTO(id=1, name="a"), tags=["m"])
+        await redis_service.set(
+            "members:2", DummyDTO(id=2, name="b"), ttl=1, tags=["m"]
+        )
+        await redis_service.set("members:3", DummyDTO(id=3, name="c"), tags=["m"])
+        await redis_service.delete("members:3")
+
+        await asyncio.sleep(1.2)
+
+        assert await redis_service.get_tag_members("m") == ["members:1"]
+
+    async def test_pipeline_invalidate_tags(
+        self, redis_service: RedisService[DummyDTO]
+    ):
+        await redis_service.set("pipe:tagged", DummyDTO(id=1, name="a"), tags=["p"])
+
+        async with redis_service.pipeline() as pipe:
+            pipe.set("pipe:fresh", DummyDTO(id=2, name="b"))
+            pipe.invalidate_tags("p")
+
+        assert await redis_service.get("pipe:tagged", DummyDTO) is None
+        assert await redis_service.get("pipe:fresh", DummyDTO) is not None
+
+    async def test_get_version_is_stable_until_bumped(
+        self, redis_service: RedisService[DummyDTO]
+    ):
+        version = await redis_service.get_version("versions:1")
+        assert await redis_service.get_version("versions:1") == version
+
+        async with redis_service.pipeline() as pipe:
+            pipe.bump_version("versions:1")
+
+        assert await redis_service.get_version("versions:1") == version + 1
+
+    async def test_bump_version_seeds_missing_counter(
+        self, redis_service: RedisService[DummyDTO], redis_client
+    ):
+        async with redis_service.pipeline() as pipe:
+            pipe.bump_version("versions:2")
+
+        # seeded from the clock, not restarted at 1
+        assert await redis_service.get_version("versions:2") > 1
+        assert await redis_client.ttl("version:versions:2") == -1
+
+    async def test_tombstone(self, redis_service: RedisService[DummyDTO]):
+        await redis_service.set_tombstone("gone:1", ttl=10)
+
+        assert await redis_service.get_or_tombstone("gone:1", DummyDTO) is TOMBSTONE
+        assert await redis_service.get("gone:1", DummyDTO) is None
+
+        await redis_service.set("gone:1", DummyDTO(id=1, name="created"))
+
+        assert await redis_service.get_or_tombstone("gone:1", DummyDTO) == DummyDTO(
+            id=1, name="created"
+        )
+
+    async def test_tombstone_does_not_overwrite_value(
+        self, redis_service: RedisService[DummyDTO]
+    ):
+        await redis_service.set("gone:2", DummyDTO(id=2, name="exists"))
+
+        await redis_service.set_tombstone("gone:2", ttl=10)
+
+        assert await redis_service.get("gone:2", DummyDTO) == DummyDTO(
+            id=2, name="exists"
+        )
 
     async def test_set_with_ttl_expires(self, redis_service: RedisService[DummyDTO]):
         dto = DummyDTO(id=5, name="temp")
@@ -64,3 +144,134 @@ class TestRedisService:
         cached = await redis_service.get("temp:5", DummyDTO)
 
         assert cached is None
+
+    async def test_set_many_and_get_many(self, redis_service: RedisService[DummyDTO]):
+        await redis_service.set_many(
+            {"many:1": DummyDTO(id=1, name="a"), "many:2": DummyDTO(id=2, name="b")},
+            ttl=10,
+        )
+
+        cached = await redis_service.get_many(
+            ["many:1", "missing:many", "many:2"], DummyDTO
+        )
+
+        assert cached[0] == DummyDTO(id=1, name="a")
+        assert cached[1] is None
+        assert cached[2] == DummyDTO(id=2, name="b")
+
+    async def test_delete_many(self, redis_service: RedisService[DummyDTO]):
+        await redis_service.set_many(
+            {"del:1": DummyDTO(id=1, name="a"), "del:2": DummyDTO(id=2, name="b")}
+        )
+
+        await redis_service.delete_many(["del:1", "del:2"])
+
+        assert await redis_service.get_many(["del:1", "del:2"], DummyDTO) == [
+            None,
+            None,
+        ]
+
+    async def test_pipeline_applies_all_mutations(
+        self, redis_service: RedisService[DummyDTO]
+    ):
+        await redis_service.set("pipe:old", DummyDTO(id=1, name="old"))
+
+        async with redis_service.pipeline() as pipe:
+            pipe.set("pipe:new", DummyDTO(id=2, name="new"), ttl=10)
+            pipe.delete("pipe:old")
+
+        assert await redis_service.get("pipe:new", DummyDTO) == DummyDTO(
+            id=2, name="new"
+        )
+        assert await redis_service.get("pipe:old", DummyDTO) is None
+
+    async def test_pipeline_discarded_on_error(
+        self, redis_service: RedisService[DummyDTO]
+    ):
+        with pytest.raises(RuntimeError):
+            async with redis_service.pipeline() as pipe:
+                pipe.set("pipe:discarded", DummyDTO(id=3, name="discarded"))
+                raise RuntimeError("boom")
+
+        assert await redis_service.get("pipe:discarded", DummyDTO) is None
+
+    async def test_typed_fields_round_trip(self, redis_container):
+        service = RedisService[list[BudgetDTO]](url=redis_container["dsn"])
+        now = datetime.now(timezone.utc)
+        budgets = [
+            BudgetDTO(
+                id=uuid4(),
+                amount=100.0,
+                period=BudgetPeriod.MONTHLY,
+                start_date=now,
+                end_date=now,
+                user_id=uuid4(),
+                category_id=uuid4(),
+                created_at=now,
+                updated_at=now,
+            )
+        ]
+        await service.set("typed:budgets", budgets)
+
+        cached = await service.get("typed:budgets", list[BudgetDTO])
+        await service.close()
+
+        assert cached == budgets
+        assert isinstance(cached[0].period, BudgetPeriod)
+
+    async def test_compressed_value_round_trip(self, redis_container):
+        service = RedisService[str](
+            url=redis_container["dsn"], codec=OrjsonCodec(compression_threshold=16)
+        )
+        await service.set("compressed:html", "<html>" * 100)
+
+        cached = await service.get("compressed:html", str)
+        await service.close()
+
+        assert cached == "<html>" * 100
+
+    async def test_get_or_load_coalesces_concurrent_misses(self, redis_container):
+        services = [
+            RedisService[DummyDTO](url=redis_container["dsn"]) for _ in range(2)
+        ]
+        calls = 0
+
+        async def loader() -> DummyDTO:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.1)
+            return DummyDTO(id=7, name="loaded")
+
+        results = await asyncio.gather(
+            *(
+                service.get_or_load("coalesced:7", DummyDTO, loader, ttl=10)
+                for service in services
+                for _ in range(20)
+            )
+        )
+        cached = await services[0].get("coalesced:7", DummyDTO)
+        for service in services:
+            await service.close()
+
+        assert calls == 1
+        assert all(result == DummyDTO(id=7, name="loaded") for result in results)
+        assert cached == DummyDTO(id=7, name="loaded")
+
+    async def test_get_or_load_propagates_loader_error(
+        self, redis_service: RedisService[DummyDTO], redis_client
+    ):
+        async def loader() -> DummyDTO:
+            raise LookupError("not found")
+
+        with pytest.raises(LookupError):
+            await redis_service.get_or_load("failing:8", DummyDTO, loader)
+
+        assert await redis_client.exists("failing:8", "lock:failing:8") == 0
+
+    def test_should_refresh_early(self):
+        assert not RedisService._should_refresh_early(load_seconds=0, ttl_ms=10)
+        assert not RedisService._should_refresh_early(load_seconds=0.01, ttl_ms=-1)
+        assert not RedisService._should_refresh_early(
+            load_seconds=0.001, ttl_ms=3_600_000
+        )
+        assert RedisService._should_refresh_early(load_seconds=1000, ttl_ms=1)
@@ -2,6 +2,7 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 from uuid import UUID
 
+import jwt
 import pytest
 from pytest_asyncio import fixture
 
@@ -74,3 +75,40 @@ class TestTokenService:
 
         with pytest.raises(TokenExpired):
             token_service.decode_token(expired_token)
+
+    def test_decode_token_returns_cached_payload(self, token_service, test_user):
+        token = token_service.create_token(str(test_user.id))
+
+        with patch(
+            "expenses_tracker.infrastructure.security.jwt_token_service.jwt.decode",
+            wraps=jwt.decode,
+        ) as mock_decode:
+            first = token_service.decode_token(token)
+            second = token_service.decode_token(token)
+
+        assert first is second
+        mock_decode.assert_called_once()
+
+    def test_decode_cached_token_after_exp_raises_exception(
+        self, token_service, test_user
+    ):
+        token = token_service.create_token(
+            str(test_user.id), expires_delta=timedelta(seconds=5)
+        )
+        payload = token_service.decode_token(token)
+
+        with patch(
+            "expenses_tracker.infrastructure.security.jwt_token_service.time.time",
+            return_value=payload.exp,
+        ):
+            with pytest.raises(TokenExpired):
+                token_service.decode_token(token)
+
+    def test_decode_token_cache_is_bounded(self, test_user):
+        token_service = JWTTokenService(cache_max_size=2)
+        tokens = [token_service.create_token(str(test_user.id)) for _ in range(3)]
+
+        for token in tokens:
+            token_service.decode_token(token)
+
+        assert len(token_service._cache) == 2
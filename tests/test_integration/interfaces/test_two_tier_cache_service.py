@@ -0,0 +1,116 @@
+import asyncio
+from dataclasses import dataclass
+
+from pytest_asyncio import fixture
+
+from expenses_tracker.infrastructure.cache.redis_cache_service import RedisService
+from expenses_tracker.infrastructure.cache.two_tier_cache_service import (
+    TwoTierCacheService,
+)
+
+
+@dataclass
+class DummyDTO:
+    id: int
+    name: str
+
+
+async def _create_worker(dsn: str) -> TwoTierCacheService[DummyDTO]:
+    service = TwoTierCacheService[DummyDTO](
+        remote=RedisService(url=dsn), channel="test:cache:invalidate"
+    )
+    await service.start()
+    return service
+
+
+@fixture
+async def workers(redis_container):
+    first = await _create_worker(redis_container["dsn"])
+    second = await _create_worker(redis_container["dsn"])
+    # let both listeners subscribe before publishing
+    await asyncio.sleep(0.2)
+    yield first, second
+    await first.close()
+    await second.close()
+
+
+class TestTwoTierCacheService:
+    async def test_local_hit_skips_redis(self, workers, redis_client):
+        first, _ = workers
+        await first.set("user:1", DummyDTO(id=1, name="local"), ttl=10)
+        await redis_client.delete("user:1")
+
+        cached = await first.get("user:1", DummyDTO)
+
+        assert cached == DummyDTO(id=1, name="local")
+
+    async def test_keys_without_local_prefix_go_to_redis(self, workers, redis_client):
+        first, _ = workers
+        await first.set("profile:1", DummyDTO(id=1, name="remote"), ttl=10)
+        await redis_client.delete("profile:1")
+
+        assert await first.get("profile:1", DummyDTO) is None
+
+    async def test_update_invalidates_other_worker(self, workers):
+        first, second = workers
+        await first.set("user:2", DummyDTO(id=2, name="old"), ttl=10)
+        assert await second.get("user:2", DummyDTO) == DummyDTO(id=2, name="old")
+
+        async with first.pipeline() as pipe:
+            pipe.set("user:2", DummyDTO(id=2, name="new"), ttl=10)
+        await asyncio.sleep(0.2)
+
+        assert await second.get("user:2", DummyDTO) == DummyDTO(id=2, name="new")
+
+    async def test_delete_invalidates_other_worker(self, workers):
+        first, second = workers
+        await first.set("expense:3", DummyDTO(id=3, name="deleted"), ttl=10)
+        assert await second.get("expense:3", DummyDTO) is not None
+
+        await first.delete("expense:3")
+        await asyncio.sleep(0.2)
+
+        assert await second.get("expense:3", DummyDTO) is None
+
+    async def test_invalidate_tags_drops_other_worker_local(self, workers):
+        first, second = workers
+        await first.set(
+            "category:user:4", DummyDTO(id=4, name="list"), ttl=10, tags=["c:4"]
+        )
+        assert await second.get("category:user:4", DummyDTO) is not None
+
+        await first.invalidate_tags(["c:4"])
+        await asyncio.sleep(0.2)
+
+        assert await second.get("category:user:4", DummyDTO) is None
+
+    async def test_local_delete_during_get_is_not_undone(self, workers):
+        first, _ = workers
+        await first._remote.set("user:5", DummyDTO(id=5, name="stale"), ttl=10)
+        remote_get = first._remote.get
+        release = asyncio.Event()
+
+        async def slow_get(key, serializer):
+            value = await remote_get(key, serializer)
+            await release.wait()
+            return value
+
+        first._remote.get = slow_get
+        reader = asyncio.create_task(first.get("user:5", DummyDTO))
+        await asyncio.sleep(0.05)
+        await first.delete("user:5")
+        release.set()
+
+        assert await reader == DummyDTO(id=5, name="stale")
+        first._remote.get = remote_get
+        assert await first.get("user:5", DummyDTO) is None
+
+    async def test_local_entry_expires_with_redis_ttl(self, workers, redis_client):
+        first, _ = workers
+        await first.set("user:6", DummyDTO(id=6, name="short"), ttl=1)
+        await redis_client.delete("user:6")
+        assert await first.get("user:6", DummyDTO) is not None
+
+        await asyncio.sleep(1.1)
+
+        assert await first.get("user:6", DummyDTO) is None
@@ -0,0 +1,37 @@
+import pytest
+
+from expenses_tracker.domain.entities.user import User
+from expenses_tracker.infrastructure.database.repositories.psycopg_uow import (
+    PsycopgUnitOfWork,
+)
+
+
+class TestPsycopgUnitOfWork:
+    async def test_connection_returned_to_pool(self, psycopg_pool, async_engine):
+        uow = PsycopgUnitOfWork(pool=psycopg_pool)
+        async with uow:
+            assert psycopg_pool.get_stats()["pool_available"] == 0
+
+        assert psycopg_pool.get_stats()["pool_available"] == 1
+
+    async def test_connection_reused_between_units_of_work(
+        self, psycopg_pool, async_engine
+    ):
+        for _ in range(10):
+            async with PsycopgUnitOfWork(pool=psycopg_pool) as uow:
+                await uow.user_repository.get_all()
+
+        stats = psycopg_pool.get_stats()
+        assert stats["pool_size"] == 1
+        assert stats["connections_num"] == 1
+
+    async def test_rollback_on_exception(self, psycopg_pool, async_engine):
+        user = User(username="rollback_user", hashed_password="hashed_password")
+        with pytest.raises(RuntimeError):
+            async with PsycopgUnitOfWork(pool=psycopg_pool) as uow:
+                await uow.user_repository.create(user)
+                raise RuntimeError("boom")
+
+        async with PsycopgUnitOfWork(pool=psycopg_pool) as uow:
+            assert await uow.user_repository.get_by_id(user.id) is None
+        assert psycopg_pool.get_stats()["pool_available"] == 1
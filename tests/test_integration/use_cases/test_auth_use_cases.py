@@ -32,7 +32,9 @@ class TestAuthUserUseCases:
     async def _create_user_with_hashed_password(
         self, user_create_dto: UserCreateDTO
     ) -> User:
-        hashed_password = self.password_hasher.hash(password=user_create_dto.password)
+        hashed_password = await self.password_hasher.hash(
+            password=user_create_dto.password
+        )
         user = User(
             username=user_create_dto.username,
             hashed_password=hashed_password,
@@ -60,7 +62,7 @@ class TestAuthUserUseCases:
             assert user is not None
             assert user.username == unique_user_create_dto.username
             assert user.email == unique_user_create_dto.email
-            assert self.password_hasher.verify(
+            assert await self.password_hasher.verify(
                 unique_user_create_dto.password, user.hashed_password
             )
 
@@ -7,7 +7,9 @@ from expenses_tracker.application.dto.budget import (
     BudgetDTO,
 )
 from expenses_tracker.application.use_cases.budget import BudgetUseCases
+from expenses_tracker.core.constants import BudgetPeriod
 from expenses_tracker.domain.entities.budget import Budget
+from expenses_tracker.domain.entities.expense import Expense
 from expenses_tracker.domain.exceptions.budget import BudgetNotFound
 
 
@@ -37,6 +39,41 @@ class TestBudgetUseCases:
         with pytest.raises(BudgetNotFound):
             await self.budget_use_cases.get_budget(budget_id=random_uuid)
 
+    async def test_get_budgets_utilisation_success(
+        self, create_test_user, create_test_category
+    ):
+        now = datetime.now(timezone.utc)
+        budget = await self._create_budget(
+            Budget(
+                amount=200.0,
+                period=BudgetPeriod.MONTHLY,
+                start_date=now - timedelta(days=10),
+                end_date=now + timedelta(days=10),
+                user_id=create_test_user.id,
+                category_id=create_test_category.id,
+            )
+        )
+        async with self.unit_of_work as uow:
+            for amount, days_ago in ((30.0, 1), (20.0, 5), (999.0, 30)):
+                await uow.expense_repository.create(
+                    Expense(
+                        amount=amount,
+                        date=(now - timedelta(days=days_ago)).replace(tzinfo=None),
+                        user_id=create_test_user.id,
+                        category_id=create_test_category.id,
+                    )
+                )
+
+        utilisation = await self.budget_use_cases.get_budgets_utilisation(
+            user_id=create_test_user.id
+        )
+
+        assert len(utilisation) == 1
+        assert utilisation[0].budget_id == budget.id
+        assert utilisation[0].spent == pytest.approx(50.0)
+        assert utilisation[0].remaining == pytest.approx(150.0)
+        assert utilisation[0].percentage == pytest.approx(25.0)
+
     async def test_get_budgets_by_user_id_success(
         self, unique_budget_entity, unique_budget_dto
     ):
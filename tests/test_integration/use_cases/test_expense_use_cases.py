@@ -1,13 +1,17 @@
-from datetime import datetime, timezone
+import csv
+import io
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from pytest import fixture
 
 from expenses_tracker.application.dto.expense import (
+    ExpenseCreateDTO,
     ExpenseDTO,
     ExpenseUpdateDTO,
 )
 from expenses_tracker.application.use_cases.expense import ExpenseUseCases
+from expenses_tracker.core.constants import ExpenseGranularity
 from expenses_tracker.domain.entities.expense import Expense
 from expenses_tracker.domain.exceptions.expense import ExpenseNotFound
 
@@ -47,6 +51,46 @@ class TestExpenseUseCases:
         assert isinstance(expenses[0], ExpenseDTO)
         assert expenses[0] == unique_expense_dto
 
+    async def test_get_expenses_page_by_user_id_walks_all_pages(
+        self, unique_expense_entity
+    ):
+        for days in range(5):
+            await self._create_expense(
+                Expense(
+                    amount=unique_expense_entity.amount,
+                    date=unique_expense_entity.date - timedelta(days=days),
+                    user_id=unique_expense_entity.user_id,
+                    category_id=unique_expense_entity.category_id,
+                )
+            )
+
+        seen, cursor = [], None
+        while True:
+            page = await self.expense_use_cases.get_expenses_page_by_user_id(
+                user_id=unique_expense_entity.user_id, limit=2, cursor=cursor
+            )
+            seen.extend(page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert len(seen) == 5
+        assert len({e.id for e in seen}) == 5
+        assert [e.date for e in seen] == sorted((e.date for e in seen), reverse=True)
+
+    async def test_stream_expenses_by_user_id_success(
+        self, unique_expense_entity, unique_expense_dto
+    ):
+        await self._create_expense(unique_expense_entity)
+        expenses = [
+            dto
+            async for dto in self.expense_use_cases.stream_expenses_by_user_id(
+                user_id=unique_expense_entity.user_id
+            )
+        ]
+
+        assert expenses == [unique_expense_dto]
+
     async def test_get_expenses_by_user_id_and_date_range_success(
         self, unique_expense_entity, unique_expense_dto
     ):
@@ -68,6 +112,82 @@ class TestExpenseUseCases:
         assert isinstance(expenses[0], ExpenseDTO)
         assert expenses[0] == unique_expense_dto
 
+    async def test_export_expenses_csv_success(self, unique_expense_entity):
+        await self._create_expense(unique_expense_entity)
+        body = b"".join(
+            [
+                chunk
+                async for chunk in self.expense_use_cases.export_expenses_csv(
+                    user_id=unique_expense_entity.user_id
+                )
+            ]
+        )
+
+        rows = list(csv.DictReader(io.StringIO(body.decode())))
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(unique_expense_entity.id)
+        assert float(rows[0]["amount"]) == unique_expense_entity.amount
+        assert rows[0]["description"] == unique_expense_entity.description
+
+    async def test_get_expenses_summary_by_day_and_category(
+        self, unique_expense_entity
+    ):
+        day = unique_expense_entity.date.replace(
+            hour=12, minute=0, second=0, microsecond=0
+        )
+        for amount, date in (
+            (10.0, day),
+            (30.0, day + timedelta(hours=1)),
+            (5.0, day - timedelta(days=1)),
+        ):
+            await self._create_expense(
+                Expense(
+                    amount=amount,
+                    date=date,
+                    user_id=unique_expense_entity.user_id,
+                    category_id=unique_expense_entity.category_id,
+                )
+            )
+
+        summaries = await self.expense_use_cases.get_expenses_summary(
+            user_id=unique_expense_entity.user_id,
+            start_date=day - timedelta(days=2),
+            end_date=day + timedelta(days=1),
+            granularity=ExpenseGranularity.DAY,
+        )
+
+        assert [(s.count, s.total_amount) for s in summaries] == [(1, 5.0), (2, 40.0)]
+        latest = summaries[-1]
+        assert latest.category_id == unique_expense_entity.category_id
+        assert latest.period_start.date() == day.date()
+        assert (latest.min_amount, latest.max_amount) == (10.0, 30.0)
+        assert latest.avg_amount == pytest.approx(20.0)
+
+    async def test_get_expenses_summary_total_only(self, unique_expense_entity):
+        await self._create_expense(unique_expense_entity)
+        summaries = await self.expense_use_cases.get_expenses_summary(
+            user_id=unique_expense_entity.user_id,
+            start_date=unique_expense_entity.date - timedelta(days=1),
+            end_date=unique_expense_entity.date + timedelta(days=1),
+            group_by_category=False,
+        )
+
+        assert len(summaries) == 1
+        assert summaries[0].category_id is None
+        assert summaries[0].period_start is None
+        assert summaries[0].total_amount == pytest.approx(unique_expense_entity.amount)
+
+    async def test_get_expenses_summary_empty_range(self, unique_expense_entity):
+        await self._create_expense(unique_expense_entity)
+        summaries = await self.expense_use_cases.get_expenses_summary(
+            user_id=unique_expense_entity.user_id,
+            start_date=unique_expense_entity.date + timedelta(days=1),
+            end_date=unique_expense_entity.date + timedelta(days=2),
+            group_by_category=False,
+        )
+
+        assert summaries == []
+
     async def test_get_expenses_by_user_id_and_category_id_success(
         self, unique_expense_entity, unique_expense_dto
     ):
@@ -97,6 +217,35 @@ class TestExpenseUseCases:
         assert before_create <= expense.created_at <= after_create
         assert before_create <= expense.updated_at <= after_create
 
+    async def test_import_expenses_success(self, unique_expense_create_dto):
+        result = await self.expense_use_cases.import_expenses(
+            expenses_data=[unique_expense_create_dto] * 3
+        )
+
+        assert result.created == 3
+        assert result.errors == []
+        expenses = await self.expense_use_cases.get_expenses_by_user_id(
+            user_id=unique_expense_create_dto.user_id
+        )
+        assert len(expenses) == 3
+
+    async def test_import_expenses_rejects_unknown_category(
+        self, unique_expense_create_dto, random_uuid
+    ):
+        invalid = ExpenseCreateDTO(
+            **{**unique_expense_create_dto.__dict__, "category_id": random_uuid}
+        )
+        result = await self.expense_use_cases.import_expenses(
+            expenses_data=[unique_expense_create_dto, invalid]
+        )
+
+        assert result.created == 0
+        assert [e.row for e in result.errors] == [1]
+        expenses = await self.expense_use_cases.get_expenses_by_user_id(
+            user_id=unique_expense_create_dto.user_id
+        )
+        assert expenses == []
+
     async def test_update_expense_success(
         self, unique_expense_entity_with_times, unique_expense_update_dto
     ):
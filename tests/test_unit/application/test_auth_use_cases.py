@@ -7,6 +7,7 @@ from pytest_asyncio import fixture
 from expenses_tracker.application.dto.token import TokenPairDTO
 from expenses_tracker.application.use_cases.auth import AuthUserUseCases
 from expenses_tracker.core.constants import TokenType
+from expenses_tracker.domain.entities.user import UNUSABLE_PASSWORD
 from expenses_tracker.domain.exceptions.auth import (
     InvalidCredentials,
     TokenExpired,
@@ -31,6 +32,7 @@ class TestAuthUserUseCases:
         mock_token_service,
         cache_service_mock,
         mock_email_service,
+        mock_cache_warmer,
     ):
         self.auth_use_cases = AuthUserUseCases(
             unit_of_work=mock_unit_of_work,
@@ -38,6 +40,7 @@ class TestAuthUserUseCases:
             token_service=mock_token_service,
             cache_service=cache_service_mock,
             email_service=mock_email_service,
+            cache_warmer=mock_cache_warmer,
         )
         self.mock_unit_of_work = mock_unit_of_work
         self.mock_hasher = mock_password_hasher
@@ -130,7 +133,7 @@ class TestAuthUserUseCases:
         assert isinstance(result, TokenPairDTO)
         mock_repo.get_by_email.assert_called_once_with(user_create_dto.email)
         mock_repo.get_by_username.assert_called_once_with(user_create_dto.username)
-        mock_password_hasher.hash.assert_called_once_with(
+        mock_password_hasher.hash.assert_awaited_once_with(
             password=user_create_dto.password
         )
         mock_repo.create.assert_called_once()
@@ -150,7 +153,13 @@ class TestAuthUserUseCases:
             await self.auth_use_cases.register(user_create_dto)
 
     async def test_login_success(
-        self, mock_unit_of_work, mock_password_hasher, mock_token_service, user_entity
+        self,
+        mock_unit_of_work,
+        mock_password_hasher,
+        mock_token_service,
+        cache_service_mock,
+        mock_cache_warmer,
+        user_entity,
     ):
         mock_repo = mock_unit_of_work.__aenter__.return_value.user_repository
         mock_repo.get_by_username.return_value = user_entity
@@ -161,12 +170,14 @@ class TestAuthUserUseCases:
 
         assert isinstance(result, TokenPairDTO)
         mock_repo.get_by_username.assert_called_once_with(user_entity.username)
-        mock_password_hasher.verify.assert_called_once_with(
+        mock_password_hasher.verify.assert_awaited_once_with(
             password="password123", hashed=user_entity.hashed_password
         )
         assert mock_token_service.create_token.call_count == 2
+        cache_service_mock.delete.assert_awaited_once_with(key=f"user:{user_entity.id}")
+        mock_cache_warmer.schedule.assert_called_once_with(user_id=user_entity.id)
 
-    async def test_login_user_not_found(self, mock_unit_of_work):
+    async def test_login_user_not_found(self, mock_unit_of_work, mock_cache_warmer):
         mock_repo = mock_unit_of_work.__aenter__.return_value.user_repository
         mock_repo.get_by_username.return_value = None
 
@@ -176,6 +187,7 @@ class TestAuthUserUseCases:
             await self.auth_use_cases.login(
                 username="nonexistent", password="password123"
             )
+        mock_cache_warmer.schedule.assert_not_called()
 
     async def test_login_invalid_credentials(
         self, mock_unit_of_work, mock_password_hasher, user_entity
@@ -192,8 +204,25 @@ class TestAuthUserUseCases:
                 username=user_entity.username, password="wrong_password"
             )
 
+    async def test_login_without_usable_password(
+        self, mock_unit_of_work, mock_password_hasher, user_entity
+    ):
+        mock_repo = mock_unit_of_work.__aenter__.return_value.user_repository
+        user_entity.hashed_password = UNUSABLE_PASSWORD
+        mock_repo.get_by_username.return_value = user_entity
+
+        with pytest.raises(
+            InvalidCredentials,
+            match=f"Invalid credentials for user {user_entity.username}",
+        ):
+            await self.auth_use_cases.login(
+                username=user_entity.username, password="password123"
+            )
+        mock_password_hasher.verify.assert_not_awaited()
+        mock_repo.update_last_refresh_jti.assert_not_called()
+
     async def test_refresh_success(
-        self, mock_unit_of_work, mock_token_service, user_entity
+        self, mock_unit_of_work, mock_token_service, mock_cache_warmer, user_entity
     ):
         mock_repo = mock_unit_of_work.__aenter__.return_value.user_repository
         refresh_jti = "old_jti"
@@ -215,6 +244,7 @@ class TestAuthUserUseCases:
         mock_token_service.decode_token.assert_called_once_with("valid_refresh_token")
         mock_repo.get_by_id.assert_called_once_with(user_id=user_entity.id)
         assert mock_token_service.create_token.call_count == 2
+        mock_cache_warmer.schedule.assert_called_once_with(user_id=user_entity.id)
 
     async def test_refresh_user_not_found(
         self, mock_unit_of_work, mock_token_service, random_uuid
@@ -9,9 +9,12 @@ from expenses_tracker.application.dto.budget import (
     BudgetCreateDTO,
     BudgetUpdateDTO,
 )
-from expenses_tracker.application.use_cases.budget import BudgetUseCases
+from expenses_tracker.application.use_cases.budget import (
+    BudgetUseCases,
+    user_budgets_utilisation_cache_key,
+)
 from expenses_tracker.core.constants import BudgetPeriod
-from expenses_tracker.domain.entities.budget import Budget
+from expenses_tracker.domain.entities.budget import Budget, BudgetUtilisation
 from expenses_tracker.domain.exceptions.budget import BudgetNotFound
 
 
@@ -71,26 +74,27 @@ def budget_update_dto(budget_entity):
 
 class TestBudgetUseCases:
     @fixture(autouse=True)
-    def setup(self, mock_unit_of_work, cache_service_mock):
+    def setup(self, mock_unit_of_work, cache_service_mock, cache_pipeline_mock):
         self.budget_use_cases = BudgetUseCases(
             unit_of_work=mock_unit_of_work,
             cache_service=cache_service_mock,
         )
         self.mock_unit_of_work = mock_unit_of_work
         self.mock_cache_service = cache_service_mock
+        self.mock_cache_pipeline = cache_pipeline_mock
 
     async def test_get_budget_from_cache(self, budget_dto):
-        self.mock_cache_service.get.return_value = budget_dto
+        self.mock_cache_service.get_or_tombstone.return_value = budget_dto
 
         budget = await self.budget_use_cases.get_budget(budget_id=budget_dto.id)
 
         assert budget == budget_dto
-        self.mock_cache_service.get.assert_called_once()
+        self.mock_cache_service.get_or_tombstone.assert_called_once()
 
     async def test_get_budget_success(
         self, mock_unit_of_work, budget_entity, budget_dto
     ):
-        self.mock_cache_service.get.return_value = None
+        self.mock_cache_service.get_or_tombstone.return_value = None
         mock_repo = mock_unit_of_work.__aenter__.return_value.budget_repository
         mock_repo.get_by_id.return_value = budget_entity
 
@@ -102,22 +106,57 @@ class TestBudgetUseCases:
         self.mock_cache_service.set.assert_called_once()
 
     async def test_get_budget_not_found(self, mock_unit_of_work, random_uuid):
-        self.mock_cache_service.get.return_value = None
+        self.mock_cache_service.get_or_tombstone.return_value = None
         mock_repo = mock_unit_of_work.__aenter__.return_value.budget_repository
         mock_repo.get_by_id.return_value = None
 
         with pytest.raises(BudgetNotFound):
             await self.budget_use_cases.get_budget(budget_id=random_uuid)
 
-    async def test_get_budgets_by_user_id_from_cache(self, budget_entity, budget_dto):
-        self.mock_cache_service.get.return_value = [budget_dto]
+    async def test_get_budgets_by_user_id_from_cache(
+        self, mock_unit_of_work, budget_entity, budget_dto
+    ):
+        self.mock_cache_service.get_or_load.side_effect = None
+        self.mock_cache_service.get_or_load.return_value = [budget_dto]
+        mock_repo = mock_unit_of_work.__aenter__.return_value.budget_repository
 
         budgets = await self.budget_use_cases.get_budgets_by_user_id(
             user_id=budget_entity.user_id
         )
 
         assert budgets == [budget_dto]
-        self.mock_cache_service.get.assert_called_once()
+        self.mock_cache_service.get_or_load.assert_called_once()
+        assert (
+            self.mock_cache_service.get_or_load.call_args[1]["key"]
+            == f"budgets:user:{budget_entity.user_id}"
+        )
+        mock_repo.get_all_by_user_id.assert_not_called()
+
+    async def test_get_active_budgets_filters_cached_list(
+        self, mock_unit_of_work, budget_entity
+    ):
+        mock_repo = mock_unit_of_work.__aenter__.return_value.budget_repository
+        expired = Budget(
+            amount=500.0,
+            period=BudgetPeriod.MONTHLY,
+            start_date=datetime(2023, 12, 1),
+            end_date=datetime(2023, 12, 31),
+            user_id=budget_entity.user_id,
+            category_id=budget_entity.category_id,
+        )
+        mock_repo.get_all_by_user_id.return_value = [budget_entity, expired]
+
+        budgets = await self.budget_use_cases.get_active_budgets_by_user_id(
+            user_id=budget_entity.user_id,
+            current_date=datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+        )
+
+        assert [b.id for b in budgets] == [budget_entity.id]
+        # one entry per user, whatever the requested timestamp
+        assert (
+            self.mock_cache_service.get_or_load.call_args[1]["key"]
+            == f"budgets:user:{budget_entity.user_id}"
+        )
 
     async def test_get_budgets_by_user_id_success(
         self, mock_unit_of_work, budget_entity, budget_dto
@@ -132,7 +171,7 @@ class TestBudgetUseCases:
 
         assert len(budgets) == 1
         assert isinstance(budgets[0], BudgetDTO)
-        self.mock_cache_service.set.assert_called_once()
+        self.mock_cache_service.get_or_load.assert_called_once()
         assert budgets[0].id == budget_dto.id
         assert budgets[0].amount == budget_dto.amount
         mock_repo.get_all_by_user_id.assert_called_once_with(
@@ -151,6 +190,46 @@ class TestBudgetUseCases:
         assert len(budgets) == 0
         mock_repo.get_all_by_user_id.assert_called_once_with(user_id=random_uuid)
 
+    async def test_get_budgets_utilisation_success(
+        self, mock_unit_of_work, budget_entity
+    ):
+        self.mock_cache_service.get.return_value = None
+        mock_repo = mock_unit_of_work.__aenter__.return_value.budget_repository
+        mock_repo.get_utilisation_by_user_id.return_value = [
+            BudgetUtilisation(budget=budget_entity, spent=budget_entity.amount / 4)
+        ]
+
+        utilisation = await self.budget_use_cases.get_budgets_utilisation(
+            user_id=budget_entity.user_id
+        )
+
+        assert len(utilisation) == 1
+        assert utilisation[0].budget_id == budget_entity.id
+        assert utilisation[0].spent == budget_entity.amount / 4
+        assert utilisation[0].remaining == budget_entity.amount * 3 / 4
+        assert utilisation[0].percentage == 25.0
+        self.mock_cache_service.get_or_load.assert_called_once()
+        mock_repo.get_utilisation_by_user_id.assert_called_once()
+
+    async def test_get_budgets_utilisation_from_cache(
+        self, mock_unit_of_work, budget_entity
+    ):
+        cached = [object()]
+        self.mock_cache_service.get_or_load.side_effect = None
+        self.mock_cache_service.get_or_load.return_value = cached
+        mock_repo = mock_unit_of_work.__aenter__.return_value.budget_repository
+
+        utilisation = await self.budget_use_cases.get_budgets_utilisation(
+            user_id=budget_entity.user_id
+        )
+
+        assert utilisation == cached
+        # the key ExpenseUseCases deletes when expenses change
+        assert self.mock_cache_service.get_or_load.call_args[1][
+            "key"
+        ] == user_budgets_utilisation_cache_key(budget_entity.user_id)
+        mock_repo.get_utilisation_by_user_id.assert_not_called()
+
     async def test_create_budget_success(
         self, mock_unit_of_work, budget_entity, budget_create_dto, budget_dto
     ):
@@ -169,8 +248,14 @@ class TestBudgetUseCases:
         created_budget = mock_repo.create.call_args[1]["budget"]
         assert created_budget.user_id == budget_create_dto.user_id
         assert created_budget.amount == budget_create_dto.amount
-        self.mock_cache_service.set.assert_called_once()
-        self.mock_cache_service.delete.assert_called_once()
+        self.mock_cache_service.pipeline.assert_called_once()
+        self.mock_cache_pipeline.set.assert_called_once()
+        self.mock_cache_pipeline.invalidate_tags.assert_called_once_with(
+            f"budgets:user:{budget_create_dto.user_id}"
+        )
+        self.mock_cache_pipeline.bump_version.assert_called_once_with(
+            f"budgets:user:{budget_create_dto.user_id}"
+        )
 
     async def test_update_budget_success(
         self, mock_unit_of_work, budget_entity, budget_update_dto
@@ -192,8 +277,11 @@ class TestBudgetUseCases:
         assert budget.category_id == budget_update_dto.category_id
         mock_repo.get_by_id.assert_called_once_with(budget_id=budget_entity.id)
         mock_repo.update.assert_called_once_with(budget=budget_entity)
-        self.mock_cache_service.set.assert_called_once()
-        self.mock_cache_service.delete.assert_called_once()
+        self.mock_cache_service.pipeline.assert_called_once()
+        self.mock_cache_pipeline.set.assert_called_once()
+        self.mock_cache_pipeline.invalidate_tags.assert_called_once_with(
+            f"budgets:user:{budget_entity.user_id}"
+        )
 
     async def test_update_budget_not_found(
         self, mock_unit_of_work, budget_update_dto, random_uuid
@@ -215,9 +303,11 @@ class TestBudgetUseCases:
 
         mock_repo.get_by_id.assert_called_once_with(budget_id=budget_entity.id)
         mock_repo.delete.assert_called_once_with(budget=budget_entity)
-        self.mock_cache_service.delete.assert_any_call(key=f"budget:{budget_entity.id}")
-        self.mock_cache_service.delete.assert_any_call(
-            key=f"budgets:user:{budget_entity.user_id}"
+        self.mock_cache_pipeline.delete.assert_called_once_with(
+            f"budget:{budget_entity.id}"
+        )
+        self.mock_cache_pipeline.invalidate_tags.assert_called_once_with(
+            f"budgets:user:{budget_entity.user_id}"
         )
 
     async def test_delete_budget_not_found(self, mock_unit_of_work, random_uuid):
@@ -197,7 +197,9 @@ class TestCategoryUseCases:
             )
         mock_repo.get_by_id.assert_called_once_with(category_id=random_uuid)
 
-    async def test_delete_category_success(self, mock_unit_of_work, category_entity):
+    async def test_delete_category_success(
+        self, mock_unit_of_work, cache_pipeline_mock, category_entity
+    ):
         mock_repo = mock_unit_of_work.__aenter__.return_value.category_repository
         mock_repo.get_by_id.return_value = category_entity
         mock_repo.delete.return_value = None
@@ -205,6 +207,11 @@ class TestCategoryUseCases:
 
         mock_repo.get_by_id.assert_called_once_with(category_id=category_entity.id)
         mock_repo.delete.assert_called_once_with(category=category_entity)
+        # expenses and budgets of the category are deleted by the database
+        cache_pipeline_mock.bump_version.assert_called_once_with(
+            f"expenses:user:{category_entity.user_id}",
+            f"budgets:user:{category_entity.user_id}",
+        )
 
     async def test_delete_category_not_found(self, mock_unit_of_work, random_uuid):
         mock_repo = mock_unit_of_work.__aenter__.return_value.category_repository
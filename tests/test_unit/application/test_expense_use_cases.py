@@ -1,4 +1,5 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
@@ -10,8 +11,13 @@ from expenses_tracker.application.dto.expense import (
     ExpenseUpdateDTO,
 )
 from expenses_tracker.application.use_cases.expense import ExpenseUseCases
-from expenses_tracker.domain.entities.expense import Expense
-from expenses_tracker.domain.exceptions.expense import ExpenseNotFound
+from expenses_tracker.core.constants import ExpenseGranularity
+from expenses_tracker.domain.entities.category import Category
+from expenses_tracker.domain.entities.expense import Expense, ExpenseSummary
+from expenses_tracker.domain.exceptions.expense import (
+    ExpenseNotFound,
+    InvalidExpenseCursor,
+)
 
 
 @fixture
@@ -120,8 +126,74 @@ class TestExpenseUseCases:
         assert len(expenses) == 0
         mock_repo.get_all_by_user_id.assert_called_once_with(user_id=random_uuid)
 
+    async def test_get_expenses_page_by_user_id_has_next_page(
+        self, mock_unit_of_work, expense_entity
+    ):
+        older = Expense(
+            amount=10.0,
+            date=expense_entity.date - timedelta(days=1),
+            user_id=expense_entity.user_id,
+            category_id=expense_entity.category_id,
+        )
+        mock_repo = mock_unit_of_work.__aenter__.return_value.expense_repository
+        mock_repo.get_page_by_user_id.return_value = [expense_entity, older]
+        page = await self.expense_use_cases.get_expenses_page_by_user_id(
+            user_id=expense_entity.user_id, limit=1
+        )
+
+        assert [e.id for e in page.items] == [expense_entity.id]
+        assert page.next_cursor is not None
+        mock_repo.get_page_by_user_id.assert_called_once_with(
+            user_id=expense_entity.user_id, limit=2, after=None
+        )
+
+    async def test_get_expenses_page_by_user_id_cursor_round_trip(
+        self, mock_unit_of_work, expense_entity
+    ):
+        mock_repo = mock_unit_of_work.__aenter__.return_value.expense_repository
+        mock_repo.get_page_by_user_id.return_value = []
+        cursor = ExpenseUseCases._encode_cursor(expense_entity)
+        page = await self.expense_use_cases.get_expenses_page_by_user_id(
+            user_id=expense_entity.user_id, limit=10, cursor=cursor
+        )
+
+        assert page.items == []
+        assert page.next_cursor is None
+        mock_repo.get_page_by_user_id.assert_called_once_with(
+            user_id=expense_entity.user_id,
+            limit=11,
+            after=(expense_entity.date, expense_entity.id),
+        )
+
+    async def test_get_expenses_page_by_user_id_invalid_cursor(
+        self, mock_unit_of_work, random_uuid
+    ):
+        mock_repo = mock_unit_of_work.__aenter__.return_value.expense_repository
+
+        with pytest.raises(InvalidExpenseCursor):
+            await self.expense_use_cases.get_expenses_page_by_user_id(
+                user_id=random_uuid, limit=10, cursor="not-a-cursor"
+            )
+        mock_repo.get_page_by_user_id.assert_not_called()
+
+    async def test_stream_expenses_by_user_id(self, mock_unit_of_work, expense_entity):
+        async def stream(**kwargs):
+            yield expense_entity
+
+        mock_repo = mock_unit_of_work.__aenter__.return_value.expense_repository
+        mock_repo.stream_by_user_id = Mock(side_effect=stream)
+        expenses = [
+            dto
+            async for dto in self.expense_use_cases.stream_expenses_by_user_id(
+                user_id=expense_entity.user_id
+            )
+        ]
+
+        assert [e.id for e in expenses] == [expense_entity.id]
+        mock_repo.stream_by_user_id.assert_called_once()
+
     async def test_get_expenses_by_user_id_and_date_range_success(
-        self, mock_unit_of_work, expense_entity, expense_dto
+        self, mock_unit_of_work, cache_service_mock, expense_entity, expense_dto
     ):
         mock_repo = mock_unit_of_work.__aenter__.return_value.expense_repository
         mock_repo.get_by_user_id_and_date_range.return_value = [expense_entity]
@@ -138,6 +210,27 @@ class TestExpenseUseCases:
         mock_repo.get_by_user_id_and_date_range.assert_called_once_with(
             user_id=expense_entity.user_id, start_date=start_date, end_date=end_date
         )
+        cache_service_mock.get_version.assert_called_once_with(
+            namespace=f"expenses:user:{expense_entity.user_id}"
+        )
+        key = cache_service_mock.get_or_load.call_args[1]["key"]
+        assert key.startswith(f"expenses:user:{expense_entity.user_id}:v1:range:")
+
+    async def test_get_expenses_by_user_id_and_date_range_without_version(
+        self, mock_unit_of_work, cache_service_mock, expense_entity
+    ):
+        cache_service_mock.get_version.return_value = None
+        mock_repo = mock_unit_of_work.__aenter__.return_value.expense_repository
+        mock_repo.get_by_user_id_and_date_range.return_value = [expense_entity]
+
+        expenses = await self.expense_use_cases.get_expenses_by_user_id_and_date_range(
+            user_id=expense_entity.user_id,
+            start_date=datetime.now(timezone.utc),
+            end_date=datetime.now(timezone.utc),
+        )
+
+        assert [e.id for e in expenses] == [expense_entity.id]
+        cache_service_mock.get_or_load.assert_not_called()
 
     async def test_get_expenses_by_user_id_and_category_id_success(
         self, mock_unit_of_work, expense_entity, expense_dto
@@ -156,8 +249,77 @@ class TestExpenseUseCases:
             user_id=expense_entity.user_id, category_id=expense_entity.category_id
         )
 
+    async def test_export_expenses_csv(self, mock_unit_of_work, random_uuid):
+        async def export(**kwargs):
+            yield b"id,amount\n"
+            yield b"1,2.5\n"
+
+        mock_repo = mock_unit_of_work.__aenter__.return_value.expense_repository
+        mock_repo.export_csv_by_user_id = Mock(side_effect=export)
+        chunks = [
+            chunk
+            async for chunk in self.expense_use_cases.export_expenses_csv(
+                user_id=random_uuid
+            )
+        ]
+
+        assert b"".join(chunks) == b"id,amount\n1,2.5\n"
+        assert mock_repo.export_csv_by_user_id.call_args[1]["user_id"] == random_uuid
+
+    async def test_get_expenses_summary_success(
+        self, mock_unit_of_work, expense_entity
+    ):
+        summary = ExpenseSummary(
+            total_amount=300.0,
+            count=3,
+            min_amount=50.0,
+            max_amount=150.0,
+            avg_amount=100.0,
+            category_id=expense_entity.category_id,
+            period_start=datetime(2025, 1, 1),
+        )
+        mock_repo = mock_unit_of_work.__aenter__.return_value.expense_repository
+        mock_repo.get_summary_by_user_id.return_value = [summary]
+        start_date, end_date = datetime(2025, 1, 1), datetime(2025, 1, 31)
+        summaries = await self.expense_use_cases.get_expenses_summary(
+            user_id=expense_entity.user_id,
+            start_date=start_date,
+            end_date=end_date,
+            granularity=ExpenseGranularity.MONTH,
+        )
+
+        assert len(summaries) == 1
+        assert summaries[0].__dict__ == summary.__dict__
+        mock_repo.get_summary_by_user_id.assert_called_once_with(
+            user_id=expense_entity.user_id,
+            start_date=start_date,
+            end_date=end_date,
+            granularity=ExpenseGranularity.MONTH,
+            group_by_category=True,
+        )
+
+    async def test_get_expenses_summary_empty_range(
+        self, mock_unit_of_work, expense_entity
+    ):
+        mock_repo = mock_unit_of_work.__aenter__.return_value.expense_repository
+        mock_repo.get_summary_by_user_id.return_value = []
+        summaries = await self.expense_use_cases.get_expenses_summary(
+            user_id=expense_entity.user_id,
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 1, 31),
+            group_by_category=False,
+        )
+
+        assert summaries == []
+        assert mock_repo.get_summary_by_user_id.call_args[1]["granularity"] is None
+
     async def test_create_expense_success(
-        self, mock_unit_of_work, expense_entity, expense_create_dto, expense_dto
+        self,
+        mock_unit_of_work,
+        cache_pipeline_mock,
+        expense_entity,
+        expense_create_dto,
+        expense_dto,
     ):
         mock_repo = mock_unit_of_work.__aenter__.return_value.expense_repository
         mock_repo.create.return_value = expense_entity
@@ -173,6 +335,63 @@ class TestExpenseUseCases:
         created_expense = mock_repo.create.call_args[1]["expense"]
         assert created_expense.user_id == expense_create_dto.user_id
         assert created_expense.amount == expense_create_dto.amount
+        # single round trip: dto set and all list invalidations
+        cache_pipeline_mock.set.assert_called_once()
+        cache_pipeline_mock.invalidate_tags.assert_called_once_with(
+            f"expenses:user:{expense_entity.user_id}"
+        )
+        cache_pipeline_mock.bump_version.assert_called_once_with(
+            f"expenses:user:{expense_entity.user_id}"
+        )
+        cache_pipeline_mock.delete.assert_called_once_with(
+            f"budgets:user:{expense_entity.user_id}:utilisation"
+        )
+
+    async def test_import_expenses_success(
+        self, mock_unit_of_work, cache_pipeline_mock, expense_create_dto
+    ):
+        uow = mock_unit_of_work.__aenter__.return_value
+        uow.category_repository.get_all_by_user_id.return_value = [
+            Category(
+                id=expense_create_dto.category_id,
+                name="Food",
+                color="red",
+                user_id=expense_create_dto.user_id,
+            )
+        ]
+        uow.expense_repository.create_many.return_value = 2
+
+        result = await self.expense_use_cases.import_expenses(
+            expenses_data=[expense_create_dto, expense_create_dto]
+        )
+
+        assert result.created == 2
+        assert result.errors == []
+        created = uow.expense_repository.create_many.call_args[1]["expenses"]
+        assert len(created) == 2
+        assert created[0].id != created[1].id
+        # every list of the user goes with its tag, even for two rows
+        cache_pipeline_mock.invalidate_tags.assert_called_once_with(
+            f"expenses:user:{expense_create_dto.user_id}"
+        )
+        cache_pipeline_mock.delete.assert_called_once_with(
+            f"budgets:user:{expense_create_dto.user_id}:utilisation"
+        )
+
+    async def test_import_expenses_unknown_category(
+        self, mock_unit_of_work, cache_service_mock, expense_create_dto
+    ):
+        uow = mock_unit_of_work.__aenter__.return_value
+        uow.category_repository.get_all_by_user_id.return_value = []
+
+        result = await self.expense_use_cases.import_expenses(
+            expenses_data=[expense_create_dto]
+        )
+
+        assert result.created == 0
+        assert [e.row for e in result.errors] == [0]
+        uow.expense_repository.create_many.assert_not_called()
+        cache_service_mock.pipeline.assert_not_called()
 
     async def test_update_expense_success(
         self, mock_unit_of_work, expense_entity, expense_update_dto
@@ -2,6 +2,7 @@ import pytest
 from pytest_asyncio import fixture
 
 from expenses_tracker.application.dto.user import UserDTO
+from expenses_tracker.application.interfaces.cache_service import TOMBSTONE
 from expenses_tracker.application.use_cases.user import UserUseCases
 from expenses_tracker.core.settings import get_settings
 from expenses_tracker.domain.exceptions.user import UserNotFound, UserAlreadyExists
@@ -20,30 +21,40 @@ class TestUserUseCases:
         self.cache_service_mock = cache_service_mock
 
     async def test_get_user_success(self, mock_unit_of_work, user_entity, user_dto):
-        self.cache_service_mock.get.return_value = None
+        self.cache_service_mock.get_or_tombstone.return_value = None
         mock_repo = mock_unit_of_work.__aenter__.return_value.user_repository
         mock_repo.get_by_id.return_value = user_entity
         user = await self.user_use_cases.get_user(user_id=user_entity.id)
 
         assert isinstance(user, UserDTO)
         assert user == user_dto
-        self.cache_service_mock.get.assert_awaited_once_with(
+        self.cache_service_mock.get_or_tombstone.assert_awaited_once_with(
             key=f"user:{user_entity.id}", serializer=UserDTO
         )
         self.cache_service_mock.set.assert_awaited_once()
         mock_repo.get_by_id.assert_called_once_with(user_id=user_entity.id)
 
     async def test_get_user_not_found(self, mock_unit_of_work, random_uuid):
-        self.cache_service_mock.get.return_value = None
+        self.cache_service_mock.get_or_tombstone.return_value = None
         mock_repo = mock_unit_of_work.__aenter__.return_value.user_repository
         mock_repo.get_by_id.return_value = None
 
         with pytest.raises(UserNotFound):
             await self.user_use_cases.get_user(user_id=random_uuid)
-        self.cache_service_mock.get.assert_awaited_once_with(
+        self.cache_service_mock.get_or_tombstone.assert_awaited_once_with(
             key=f"user:{random_uuid}", serializer=UserDTO
         )
         mock_repo.get_by_id.assert_called_once_with(user_id=random_uuid)
+        self.cache_service_mock.set_tombstone.assert_awaited_once_with(
+            key=f"user:{random_uuid}", ttl=get_settings().user_tombstone_ttl_seconds
+        )
+
+    async def test_get_user_tombstone(self, mock_unit_of_work, random_uuid):
+        self.cache_service_mock.get_or_tombstone.return_value = TOMBSTONE
+
+        with pytest.raises(UserNotFound):
+            await self.user_use_cases.get_user(user_id=random_uuid)
+        mock_unit_of_work.__aenter__.return_value.user_repository.get_by_id.assert_not_called()
 
     async def test__validate_user_uniqueness(self, mock_unit_of_work, user_entity):
         mock_repo = mock_unit_of_work.__aenter__.return_value.user_repository
@@ -90,7 +101,7 @@ class TestUserUseCases:
         assert isinstance(user, UserDTO)
         assert user == user_dto
         mock_repo.create.assert_called_once()
-        mock_password_hasher.hash.assert_called_once_with(password="new_password")
+        mock_password_hasher.hash.assert_awaited_once_with(password="new_password")
         self.cache_service_mock.set.assert_awaited_once_with(
             key=f"user:{user_entity.id}",
             value=user,
@@ -149,7 +160,7 @@ class TestUserUseCases:
         assert user.email == user_update_dto.email
         assert user.email_verified == user_dto.email_verified
         mock_repo.get_by_id.assert_called_once_with(user_id=user_entity.id)
-        mock_password_hasher.hash.assert_called_once_with(
+        mock_password_hasher.hash.assert_awaited_once_with(
             password=user_update_dto.password
         )
         mock_repo.update.assert_called_once_with(user=user_entity)
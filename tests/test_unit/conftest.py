@@ -1,10 +1,14 @@
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 from uuid import uuid4
 
 from pytest_asyncio import fixture
 
 from expenses_tracker.application.dto.user import UserDTO, UserCreateDTO, UserUpdateDTO
-from expenses_tracker.application.interfaces.cache_service import ICacheService
+from expenses_tracker.application.interfaces.cache_service import (
+    ICacheService,
+    ICachePipeline,
+)
+from expenses_tracker.application.interfaces.cache_warmer import ICacheWarmer
 from expenses_tracker.application.interfaces.email_service import IEmailService
 from expenses_tracker.application.interfaces.password_hasher import IPasswordHasher
 from expenses_tracker.application.interfaces.token_service import ITokenService
@@ -76,11 +80,25 @@ def mock_password_hasher(user_entity):
     return mock_hasher
 
 
+async def _load_without_cache(key, serializer, loader, ttl=None, tags=None):
+    return await loader()
+
+
+@fixture
+def cache_pipeline_mock():
+    return Mock(spec=ICachePipeline)
+
+
 @fixture
-def cache_service_mock():
+def cache_service_mock(cache_pipeline_mock):
     mock = AsyncMock(spec=ICacheService)
     mock.get = AsyncMock(return_value=None)
+    mock.get_or_tombstone = AsyncMock(return_value=None)
     mock.set = AsyncMock()
+    mock.get_or_load = AsyncMock(side_effect=_load_without_cache)
+    mock.get_version = AsyncMock(return_value=1)
+    mock.pipeline = MagicMock()
+    mock.pipeline.return_value.__aenter__.return_value = cache_pipeline_mock
     return mock
 
 
@@ -92,6 +110,11 @@ def mock_token_service():
     return mock_service
 
 
+@fixture
+def mock_cache_warmer():
+    return Mock(spec=ICacheWarmer)
+
+
 @fixture
 def mock_email_service():
     mock_service = Mock(spec=IEmailService)
@@ -0,0 +1,55 @@
+import io
+import threading
+
+import orjson
+
+from expenses_tracker.core.logger import QueueLogSink
+
+
+class BlockingFile(io.BytesIO):
+    """Holds the first write until `release` is set"""
+
+    def __init__(self):
+        super().__init__()
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, data):
+        self.writing.set()
+        self.release.wait(timeout=5)
+        return super().write(data)
+
+
+def _lines(file):
+    return [orjson.loads(line) for line in file.getvalue().splitlines()]
+
+
+class TestQueueLogSink:
+    def test_sink_writes_rendered_events(self):
+        file = io.BytesIO()
+        sink = QueueLogSink(file=file)
+
+        sink.info(event="first", count=1)
+        sink.debug(event="second")
+        sink.close()
+
+        assert _lines(file) == [
+            {"event": "first", "count": 1},
+            {"event": "second"},
+        ]
+
+    def test_sink_drops_events_when_queue_is_full(self):
+        file = BlockingFile()
+        sink = QueueLogSink(file=file, max_size=1)
+
+        sink.info(event="written")
+        assert file.writing.wait(timeout=5)
+        sink.info(event="queued")
+        sink.info(event="dropped")
+        file.release.set()
+        sink.close()
+
+        lines = _lines(file)
+        assert [line["event"] for line in lines[:2]] == ["written", "queued"]
+        assert lines[2]["dropped"] == 1
+        assert len(lines) == 3
@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 from expenses_tracker.core.constants import BudgetPeriod
-from expenses_tracker.domain.entities.budget import Budget
+from expenses_tracker.domain.entities.budget import Budget, BudgetUtilisation
 
 
 class TestBudget:
@@ -54,3 +54,30 @@ class TestBudget:
         assert isinstance(budget.updated_at, datetime)
         assert budget.created_at <= datetime.now(timezone.utc)
         assert budget.updated_at <= datetime.now(timezone.utc)
+
+    def test_budget_utilisation_overspent(self):
+        budget = Budget(
+            amount=200.0,
+            period=BudgetPeriod.MONTHLY,
+            start_date=datetime.now(timezone.utc),
+            end_date=datetime.now(timezone.utc),
+            user_id=UUID("12345678-1234-5678-1234-567812345678"),
+            category_id=UUID("87654321-4321-8765-4321-876543218765"),
+        )
+
+        utilisation = BudgetUtilisation(budget=budget, spent=250.0)
+
+        assert utilisation.remaining == -50.0
+        assert utilisation.percentage == 125.0
+
+    def test_budget_utilisation_zero_amount(self):
+        budget = Budget(
+            amount=0.0,
+            period=BudgetPeriod.WEEKLY,
+            start_date=datetime.now(timezone.utc),
+            end_date=datetime.now(timezone.utc),
+            user_id=UUID("12345678-1234-5678-1234-567812345678"),
+            category_id=UUID("87654321-4321-8765-4321-876543218765"),
+        )
+
+        assert BudgetUtilisation(budget=budget, spent=10.0).percentage == 0.0
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from expenses_tracker.domain.entities.user import User
+from expenses_tracker.domain.entities.user import UNUSABLE_PASSWORD, User
 
 
 class TestUser:
@@ -17,3 +17,8 @@ class TestUser:
         assert user.email is None
         assert isinstance(user.created_at, datetime)
         assert isinstance(user.updated_at, datetime)
+        assert user.has_usable_password is True
+
+    def test_user_without_usable_password(self):
+        user = User("testuser", UNUSABLE_PASSWORD)
+        assert user.has_usable_password is False
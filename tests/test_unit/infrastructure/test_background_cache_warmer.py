@@ -0,0 +1,121 @@
+import asyncio
+from uuid import uuid4
+
+from prometheus_client import REGISTRY
+from pytest_asyncio import fixture
+
+from expenses_tracker.infrastructure.cache.background_cache_warmer import (
+    BackgroundCacheWarmer,
+)
+
+
+def _warmups(result):
+    return REGISTRY.get_sample_value("cache_warmups_total", {"result": result}) or 0
+
+
+class TestBackgroundCacheWarmer:
+    @fixture(autouse=True)
+    def setup(
+        self, mock_unit_of_work, cache_service_mock, mock_password_hasher, user_entity
+    ):
+        self.repos = mock_unit_of_work.__aenter__.return_value
+        self.repos.user_repository.get_by_id.return_value = user_entity
+        self.repos.category_repository.get_all_by_user_id.return_value = []
+        self.repos.budget_repository.get_all_by_user_id.return_value = []
+        self.repos.budget_repository.get_utilisation_by_user_id.return_value = []
+        self.cache_service = cache_service_mock
+        self.release = asyncio.Event()
+        self.warmer_kwargs = dict(
+            unit_of_work_factory=lambda: mock_unit_of_work,
+            cache_service=cache_service_mock,
+            password_hasher=mock_password_hasher,
+        )
+
+    def _block_user_loads(self, user_entity):
+        async def get_by_id(user_id):
+            await self.release.wait()
+            return user_entity
+
+        self.repos.user_repository.get_by_id.side_effect = get_by_id
+
+    async def test_schedule_warms_user_categories_and_budgets(self, user_entity):
+        warmer = BackgroundCacheWarmer(**self.warmer_kwargs)
+        completed = _warmups("completed")
+
+        warmer.schedule(user_entity.id)
+        await asyncio.sleep(0.05)
+
+        self.repos.user_repository.get_by_id.assert_awaited_once_with(
+            user_id=user_entity.id
+        )
+        self.repos.category_repository.get_all_by_user_id.assert_awaited_once()
+        self.repos.budget_repository.get_all_by_user_id.assert_awaited_once_with(
+            user_id=user_entity.id
+        )
+        self.repos.budget_repository.get_utilisation_by_user_id.assert_awaited_once()
+        self.cache_service.set.assert_awaited_once()
+        assert _warmups("completed") == completed + 1
+
+    async def test_pending_user_is_skipped(self, user_entity):
+        self._block_user_loads(user_entity)
+        warmer = BackgroundCacheWarmer(**self.warmer_kwargs)
+        skipped = _warmups("skipped")
+
+        warmer.schedule(user_entity.id)
+        await asyncio.sleep(0)
+        warmer.schedule(user_entity.id)
+        self.release.set()
+        await asyncio.sleep(0.05)
+
+        assert self.repos.user_repository.get_by_id.await_count == 1
+        assert _warmups("skipped") == skipped + 1
+
+    async def test_over_max_pending_is_dropped(self, user_entity):
+        self._block_user_loads(user_entity)
+        warmer = BackgroundCacheWarmer(**self.warmer_kwargs, max_pending=1)
+        dropped = _warmups("dropped")
+        first, second = uuid4(), uuid4()
+
+        warmer.schedule(first)
+        warmer.schedule(second)
+        self.release.set()
+        await asyncio.sleep(0.05)
+
+        self.repos.user_repository.get_by_id.assert_awaited_once_with(user_id=first)
+        assert _warmups("dropped") == dropped + 1
+
+        # the slot is free again once the first warmup is done
+        warmer.schedule(second)
+        await asyncio.sleep(0.05)
+        assert self.repos.user_repository.get_by_id.await_count == 2
+
+    async def test_timeout_fails_the_warmup(self, user_entity):
+        self._block_user_loads(user_entity)
+        warmer = BackgroundCacheWarmer(**self.warmer_kwargs, timeout_seconds=0.05)
+        failed = _warmups("failed")
+
+        warmer.schedule(user_entity.id)
+        await asyncio.sleep(0.15)
+
+        assert _warmups("failed") == failed + 1
+        self.cache_service.set.assert_not_awaited()
+        # nothing left pending, the user can be warmed again
+        warmer.schedule(user_entity.id)
+        await asyncio.sleep(0.01)
+        assert self.repos.user_repository.get_by_id.await_count == 2
+        await warmer.close()
+
+    async def test_close_cancels_pending_warmups(self, user_entity):
+        self._block_user_loads(user_entity)
+        warmer = BackgroundCacheWarmer(**self.warmer_kwargs)
+        warmer.schedule(user_entity.id)
+        warmer.schedule(uuid4())
+        await asyncio.sleep(0)
+
+        await warmer.close()
+        await asyncio.sleep(0)
+
+        self.cache_service.set.assert_not_awaited()
+        self.release.set()
+        await asyncio.sleep(0.05)
+        self.cache_service.set.assert_not_awaited()
@@ -0,0 +1,40 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from prometheus_client import REGISTRY
+
+from expenses_tracker.infrastructure.database.repositories.psycopg_uow import (
+    PsycopgUnitOfWork,
+)
+
+
+def _in_use():
+    return REGISTRY.get_sample_value(
+        "db_pool_connections_in_use", {"pool": "test-psycopg"}
+    )
+
+
+class TestPsycopgUnitOfWork:
+    async def test_pool_gauges_follow_checkout_and_return(self):
+        checked_out = 0
+
+        async def getconn():
+            nonlocal checked_out
+            checked_out += 1
+            return AsyncMock()
+
+        async def putconn(_):
+            nonlocal checked_out
+            checked_out -= 1
+
+        pool = MagicMock(name="pool", max_size=20, getconn=getconn, putconn=putconn)
+        pool.name = "test-psycopg"
+        pool.get_stats = lambda: {
+            "pool_size": 5,
+            "pool_available": 5 - checked_out,
+            "requests_waiting": 0,
+        }
+
+        async with PsycopgUnitOfWork(pool=pool):
+            assert _in_use() == 1
+
+        assert _in_use() == 0
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from expenses_tracker.infrastructure.api.exception_handlers import (
+    register_exception_handlers,
+)
+from expenses_tracker.infrastructure.monitoring.readiness import (
+    ReadinessTracker,
+    ServiceNotReady,
+)
+
+
+class TestReadinessTracker:
+    async def test_wait_returns_once_initialized(self):
+        initialized = asyncio.Event()
+
+        async def initializer():
+            await asyncio.sleep(0.05)
+            initialized.set()
+
+        tracker = ReadinessTracker(timeout_seconds=1)
+        tracker.start("service", initializer)
+        assert tracker.status() == {"service": "starting"}
+        assert tracker.ready is False
+
+        await tracker.wait("service")
+
+        assert initialized.is_set()
+        assert tracker.status() == {"service": "ready"}
+        assert tracker.ready is True
+
+    async def test_wait_retries_failed_initialization(self):
+        attempts = 0
+
+        async def initializer():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise ConnectionError("unreachable")
+
+        tracker = ReadinessTracker(timeout_seconds=1)
+        tracker.start("service", initializer)
+        with pytest.raises(ServiceNotReady):
+            await tracker.wait("service")
+        assert tracker.status() == {"service": "failed"}
+
+        await tracker.wait("service")
+
+        assert attempts == 2
+        assert tracker.status() == {"service": "ready"}
+
+    async def test_failed_initialization_is_retried_in_background(self):
+        attempts = 0
+
+        async def initializer():
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise ConnectionError("unreachable")
+
+        tracker = ReadinessTracker(
+            timeout_seconds=1, retry_seconds=0.01, retry_max_seconds=0.02
+        )
+        tracker.start("service", initializer)
+        await asyncio.sleep(0)
+        assert tracker.status() == {"service": "failed"}
+
+        # nothing waits on the service, the tracker retries on its own
+        for _ in range(50):
+            if tracker.ready:
+                break
+            await asyncio.sleep(0.01)
+
+        assert attempts == 3
+        assert tracker.ready is True
+        await tracker.close()
+
+    async def test_close_cancels_scheduled_retry(self):
+        attempts = 0
+
+        async def initializer():
+            nonlocal attempts
+            attempts += 1
+            raise ConnectionError("unreachable")
+
+        tracker = ReadinessTracker(timeout_seconds=1, retry_seconds=0.01)
+        tracker.start("service", initializer)
+        await asyncio.sleep(0)
+        await tracker.close()
+        await asyncio.sleep(0.05)
+
+        assert attempts == 1
+
+    async def test_wait_times_out_without_cancelling(self):
+        async def initializer():
+            await asyncio.sleep(0.2)
+
+        tracker = ReadinessTracker(timeout_seconds=0.05)
+        tracker.start("service", initializer)
+        with pytest.raises(ServiceNotReady):
+            await tracker.wait("service")
+
+        await asyncio.sleep(0.3)
+        assert tracker.status() == {"service": "ready"}
+        await tracker.close()
+
+    async def test_service_not_ready_is_503(self):
+        async def initializer():
+            raise ConnectionError("unreachable")
+
+        tracker = ReadinessTracker(timeout_seconds=1)
+        tracker.start("avatar_storage", initializer)
+        app = FastAPI()
+        register_exception_handlers(app)
+
+        @app.get("/avatar")
+        async def avatar():
+            await tracker.wait("avatar_storage")
+            return {}
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/avatar")
+
+        assert response.status_code == 503
+        assert response.json() == {"detail": "Service avatar_storage is not available"}